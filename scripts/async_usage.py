@@ -1,7 +1,64 @@
 """Async usage example for UnifyLLM."""
 
 import asyncio
-from unify_llm import UnifyLLM
+import random
+from collections import Counter
+
+from unify_llm import (
+    ChunkAggregator,
+    ClientRateLimiter,
+    RouterDeployment,
+    UnifyLLM,
+    UnifyRouter,
+)
+from unify_llm.core.exceptions import APIError, RateLimitError, TimeoutError
+
+_SENTINEL = object()
+
+RETRYABLE_ERRORS = (RateLimitError, APIError, TimeoutError)
+
+
+async def retry_async(make_call, attempts=3, base=0.5, retryable=RETRYABLE_ERRORS):
+    """Await ``make_call()`` with exponential backoff plus jitter on transient errors.
+
+    ``make_call`` is a zero-argument factory (e.g. a lambda) because a coroutine
+    can only be awaited once. The random jitter keeps concurrent requests that
+    failed together from retrying in lock-step.
+    """
+    for attempt in range(attempts):
+        try:
+            return await make_call()
+        except retryable:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(base * (2 ** attempt) + random.random() * base)
+
+
+async def buffered(stream, size=2):
+    """Prefetch up to ``size`` items of an async iterator in a background task.
+
+    The producer keeps parsing the next SSE chunk while the consumer is busy
+    writing the previous one to the terminal, instead of the two alternating.
+    Errors raised by the stream are re-raised on the consumer side.
+    """
+    queue = asyncio.Queue(maxsize=size)
+
+    async def feeder():
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        await queue.put(_SENTINEL)
+
+    task = asyncio.create_task(feeder())
+    try:
+        while (item := await queue.get()) is not _SENTINEL:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
 
 
 async def example1_async_chat():
@@ -39,14 +96,15 @@ async def example2_async_stream():
 
     print("Generating response...\n")
 
-    async for chunk in client.achat_stream(
-        model="claude-3-sonnet-20240229",
-        messages=[
-            {"role": "user", "content": "Write a poem about async programming."}
-        ]
-    ):
-        if chunk.content:
-            print(chunk.content, end="", flush=True)
+    # Coalesce tokens into ~64-char writes instead of one flushed write per chunk
+    with ChunkAggregator() as out:
+        async for chunk in buffered(client.achat_stream(
+            model="claude-3-sonnet-20240229",
+            messages=[
+                {"role": "user", "content": "Write a poem about async programming."}
+            ]
+        )):
+            out.feed(chunk.content)
 
     print("\n")
 
@@ -57,69 +115,89 @@ async def example3_concurrent_requests():
     print("Example 3: Concurrent Requests")
     print("=" * 50)
 
+    # Queue locally when the account's RPM/TPM would be exceeded instead of
+    # sending requests that are bound to come back as 429
     client = UnifyLLM(
         provider="openai",
-        api_key="your-openai-api-key-here"
+        api_key="your-openai-api-key-here",
+        rate_limiter=ClientRateLimiter(rpm=500, tpm=60_000),
     )
 
-    # Create multiple tasks
-    tasks = [
-        client.achat(
+    topics = ["Python", "JavaScript", "Rust", "Go", "TypeScript"]
+
+    async def tagged(topic):
+        # Carry the topic with its response: as_completed yields in finish order
+        response = await retry_async(lambda: client.achat(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": f"Tell me a fact about {topic}"}]
-        )
-        for topic in ["Python", "JavaScript", "Rust", "Go", "TypeScript"]
-    ]
+        ))
+        return topic, response
 
-    # Run all tasks concurrently
-    print("Fetching facts about 5 programming languages concurrently...")
-    responses = await asyncio.gather(*tasks)
+    tasks = [tagged(topic) for topic in topics]
 
-    # Print results
-    for i, response in enumerate(responses):
-        topic = ["Python", "JavaScript", "Rust", "Go", "TypeScript"][i]
+    # Run all tasks concurrently, printing each answer as soon as it arrives
+    print("Fetching facts about 5 programming languages concurrently...")
+    for next_done in asyncio.as_completed(tasks):
+        topic, response = await next_done
         print(f"\n{topic}: {response.content}")
 
     print()
 
 
 async def example4_multi_provider():
-    """Example 4: Using multiple providers concurrently."""
+    """Example 4: Spreading load across providers with UnifyRouter."""
     print("=" * 50)
-    print("Example 4: Multi-Provider Concurrent Requests")
+    print("Example 4: Multi-Provider Load-Balanced Requests")
     print("=" * 50)
 
-    # Create clients for different providers
-    openai_client = UnifyLLM(provider="openai", api_key="your-openai-api-key")
-    anthropic_client = UnifyLLM(provider="anthropic", api_key="your-anthropic-api-key")
-    gemini_client = UnifyLLM(provider="gemini", api_key="your-gemini-api-key")
+    # Register every provider under one public model name; the router spreads
+    # requests across them and fails over on 429 / timeouts / 5xx.
+    router = UnifyRouter(
+        [
+            RouterDeployment(
+                "general",
+                UnifyLLM(provider="openai", api_key="your-openai-api-key"),
+                "gpt-3.5-turbo",
+                rpm=3500,
+            ),
+            RouterDeployment(
+                "general",
+                UnifyLLM(provider="anthropic", api_key="your-anthropic-api-key"),
+                "claude-3-sonnet-20240229",
+                rpm=1000,
+            ),
+            RouterDeployment(
+                "general",
+                UnifyLLM(provider="gemini", api_key="your-gemini-api-key"),
+                "gemini-pro",
+                rpm=1000,
+            ),
+        ],
+        strategy="least-busy",
+    )
 
     question = "What is the capital of France?"
 
-    # Ask the same question to all providers concurrently
-    tasks = [
-        openai_client.achat(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": question}]
-        ),
-        anthropic_client.achat(
-            model="claude-3-sonnet-20240229",
-            messages=[{"role": "user", "content": question}]
-        ),
-        gemini_client.achat(
-            model="gemini-pro",
-            messages=[{"role": "user", "content": question}]
-        ),
-    ]
-
     print(f"Question: {question}\n")
-    print("Asking multiple providers concurrently...\n")
-
-    responses = await asyncio.gather(*tasks)
+    print("Submitting 100 requests through the router...\n")
+
+    responses = await asyncio.gather(
+        *(
+            retry_async(
+                lambda: router.achat("general", [{"role": "user", "content": question}])
+            )
+            for _ in range(100)
+        ),
+        return_exceptions=True,
+    )
 
-    providers = ["OpenAI", "Anthropic", "Gemini"]
-    for provider, response in zip(providers, responses):
-        print(f"{provider}: {response.content}\n")
+    served = Counter(
+        response.provider for response in responses if not isinstance(response, Exception)
+    )
+    failed = sum(isinstance(response, Exception) for response in responses)
+    for provider, count in served.most_common():
+        print(f"{provider}: {count} requests")
+    print(f"Failed: {failed}\n")
 
 
 async def example5_error_handling():
@@ -1,111 +1,152 @@
-"""Basic usage example for UnifyLLM."""
-
-from unify_llm import UnifyLLM
-
-# Example 1: OpenAI
-print("=" * 50)
-print("Example 1: OpenAI GPT-4")
-print("=" * 50)
-
-client = UnifyLLM(
-    provider="openai",
-    api_key="your-openai-api-key-here"  # Or set OPENAI_API_KEY env var
-)
-
-response = client.chat(
-    model="gpt-4",
-    messages=[
-        {"role": "system", "content": "You are a helpful assistant."},
-        {"role": "user", "content": "What is Python?"}
-    ],
-    temperature=0.7,
-    max_tokens=500
-)
-
-print(f"Response: {response.content}")
-print(f"Model: {response.model}")
-print(f"Tokens used: {response.usage.total_tokens}")
-print()
-
-# Example 2: Anthropic Claude
-print("=" * 50)
-print("Example 2: Anthropic Claude")
-print("=" * 50)
-
-client = UnifyLLM(
-    provider="anthropic",
-    api_key="your-anthropic-api-key-here"  # Or set ANTHROPIC_API_KEY env var
-)
-
-response = client.chat(
-    model="claude-3-sonnet-20240229",
-    messages=[
-        {"role": "user", "content": "Explain quantum computing in simple terms."}
-    ],
-    max_tokens=1000
-)
-
-print(f"Response: {response.content}")
-print(f"Finish reason: {response.finish_reason}")
-print()
-
-# Example 3: Google Gemini
-print("=" * 50)
-print("Example 3: Google Gemini")
-print("=" * 50)
-
-client = UnifyLLM(
-    provider="gemini",
-    api_key="your-gemini-api-key-here"  # Or set GEMINI_API_KEY env var
-)
-
-response = client.chat(
-    model="gemini-pro",
-    messages=[
-        {"role": "user", "content": "Write a haiku about programming."}
-    ],
-    temperature=0.9
-)
-
-print(f"Response: {response.content}")
-print()
-
-# Example 4: Ollama (local model)
-print("=" * 50)
-print("Example 4: Ollama (Local)")
-print("=" * 50)
-
-client = UnifyLLM(
-    provider="ollama",
-    base_url="http://localhost:11434"  # Default Ollama URL
-)
-
-response = client.chat(
-    model="llama2",  # Make sure llama2 is pulled: ollama pull llama2
-    messages=[
-        {"role": "user", "content": "Tell me a fun fact about space."}
+"""Basic usage example for UnifyLLM.
+
+The provider examples are independent of each other, so they are issued
+concurrently with ``asyncio.gather``: total wall-clock time is the slowest
+provider's round trip instead of the sum of all of them. Results are printed
+afterwards in a fixed order.
+
+Responses are kept in an on-disk ``ResponseCache``, so re-running the script
+answers the same prompts without touching the network.
+"""
+
+import asyncio
+
+from unify_llm import ResponseCache, UnifyLLM
+
+# Shared by every example; cache="force" also caches the sampled (temperature > 0) calls
+CACHE = ResponseCache(path=".unify_llm_cache.sqlite")
+
+
+async def run_openai():
+    """Example 1: OpenAI GPT-4."""
+    client = UnifyLLM(
+        provider="openai",
+        api_key="your-openai-api-key-here",  # Or set OPENAI_API_KEY env var
+        response_cache=CACHE,
+    )
+
+    response = await client.achat(
+        model="gpt-4",
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "What is Python?"}
+        ],
+        temperature=0.7,
+        max_tokens=500,
+        cache="force"
+    )
+
+    return [
+        f"Response: {response.content}",
+        f"Model: {response.model}",
+        f"Tokens used: {response.usage.total_tokens}",
     ]
-)
 
-print(f"Response: {response.content}")
-print()
 
-# Example 5: Using environment variables for API keys
-print("=" * 50)
-print("Example 5: Using Environment Variables")
-print("=" * 50)
+async def run_anthropic():
+    """Example 2: Anthropic Claude."""
+    client = UnifyLLM(
+        provider="anthropic",
+        api_key="your-anthropic-api-key-here",  # Or set ANTHROPIC_API_KEY env var
+        response_cache=CACHE,
+    )
+
+    response = await client.achat(
+        model="claude-3-sonnet-20240229",
+        messages=[
+            {"role": "user", "content": "Explain quantum computing in simple terms."}
+        ],
+        max_tokens=1000,
+        cache="force"
+    )
 
-# Just provide provider name, API key will be read from env
-# Make sure to set OPENAI_API_KEY environment variable
-try:
-    client = UnifyLLM(provider="openai")
+    return [
+        f"Response: {response.content}",
+        f"Finish reason: {response.finish_reason}",
+    ]
+
+
+async def run_gemini():
+    """Example 3: Google Gemini."""
+    client = UnifyLLM(
+        provider="gemini",
+        api_key="your-gemini-api-key-here",  # Or set GEMINI_API_KEY env var
+        response_cache=CACHE,
+    )
 
-    response = client.chat(
+    response = await client.achat(
+        model="gemini-pro",
+        messages=[
+            {"role": "user", "content": "Write a haiku about programming."}
+        ],
+        temperature=0.9,
+        cache="force"
+    )
+
+    return [f"Response: {response.content}"]
+
+
+async def run_ollama():
+    """Example 4: Ollama (local model)."""
+    client = UnifyLLM(
+        provider="ollama",
+        base_url="http://localhost:11434",  # Default Ollama URL
+        response_cache=CACHE,
+    )
+
+    response = await client.achat(
+        model="llama2",  # Make sure llama2 is pulled: ollama pull llama2
+        messages=[
+            {"role": "user", "content": "Tell me a fun fact about space."}
+        ],
+        cache="force"
+    )
+
+    return [f"Response: {response.content}"]
+
+
+async def run_env_key():
+    """Example 5: Using environment variables for API keys."""
+    # Just provide provider name, API key will be read from env
+    # Make sure to set OPENAI_API_KEY environment variable
+    client = UnifyLLM(provider="openai", response_cache=CACHE)
+
+    response = await client.achat(
         model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": "Hello!"}]
+        messages=[{"role": "user", "content": "Hello!"}],
+        cache="force"
+    )
+
+    return [f"Response: {response.content}"]
+
+
+async def main():
+    """Run all provider examples concurrently and print them in order."""
+    examples = [
+        ("Example 1: OpenAI GPT-4", run_openai()),
+        ("Example 2: Anthropic Claude", run_anthropic()),
+        ("Example 3: Google Gemini", run_gemini()),
+        ("Example 4: Ollama (Local)", run_ollama()),
+        ("Example 5: Using Environment Variables", run_env_key()),
+    ]
+
+    results = await asyncio.gather(
+        *(coro for _, coro in examples), return_exceptions=True
     )
 
-    print(f"Response: {response.content}")
-except Exception as e:
-    print(f"Error: {e}")
-    print("Make sure to set the OPENAI_API_KEY environment variable")
+    for (label, _), result in zip(examples, results):
+        print("=" * 50)
+        print(label)
+        print("=" * 50)
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
+            if label.startswith("Example 5"):
+                print("Make sure to set the OPENAI_API_KEY environment variable")
+        else:
+            for line in result:
+                print(line)
+        print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,7 +5,7 @@ This example demonstrates how to use the ByteDance provider with UnifyLLM.
 """
 
 import asyncio
-from unify_llm import UnifyLLM
+from unify_llm import ChunkAggregator, UnifyLLM
 
 # Set your ByteDance API key
 # Get it from: https://console.volcengine.com/ark
@@ -59,11 +59,12 @@ def streaming_example():
     print("Streaming response: ", end="", flush=True)
 
     # Use LangChain-compatible .stream() method
-    for chunk in client.stream(
-        model="doubao-pro",
-        messages=[{"role": "user", "content": "讲一个关于人工智能的故事"}]
-    ):
-        print(chunk, end="", flush=True)
+    with ChunkAggregator() as out:
+        for chunk in client.stream(
+            model="doubao-pro",
+            messages=[{"role": "user", "content": "讲一个关于人工智能的故事"}]
+        ):
+            out.feed(chunk)
 
     print("\n")
 
@@ -92,11 +93,12 @@ async def async_streaming_example():
 
     print("Async streaming: ", end="", flush=True)
 
-    async for chunk in client.astream(
-        model="doubao-pro",
-        messages=[{"role": "user", "content": "给我一些学习Python的建议"}]
-    ):
-        print(chunk, end="", flush=True)
+    with ChunkAggregator() as out:
+        async for chunk in client.astream(
+            model="doubao-pro",
+            messages=[{"role": "user", "content": "给我一些学习Python的建议"}]
+        ):
+            out.feed(chunk)
 
     print("\n")
 
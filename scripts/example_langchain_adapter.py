@@ -6,11 +6,28 @@ LangChain-compatible usage across different providers.
 """
 
 import asyncio
-from unify_llm import LangChainAdapter
+import importlib.util
 
+import httpx
 
-def compare_providers():
-    """Compare responses from different providers using the same interface."""
+from unify_llm import ChunkAggregator, LangChainAdapter, ResponseCache
+
+# One larger connection pool shared by every adapter in compare_providers instead
+# of one pool per provider. HTTP/2 (multiplexing concurrent streams over one
+# connection) is used when the optional `h2` package is installed.
+_SHARED_HTTPX = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+)
+
+
+async def compare_providers():
+    """Compare responses from different providers using the same interface.
+
+    All providers are queried concurrently; adapters are built once up front
+    and all send their requests through the shared ``_SHARED_HTTPX`` pool.
+    """
     print("=== Comparing Providers ===\n")
 
     providers_config = [
@@ -23,23 +40,48 @@ def compare_providers():
 
     question = "What is artificial intelligence in one sentence?"
 
-    for provider_name, model in providers_config:
-        print(f"\n[{provider_name.upper()}] Using model: {model}")
+    # Repeated runs ask the same question: answer them from the on-disk cache
+    cache = ResponseCache(path=".unify_llm_cache.sqlite")
+
+    adapters = {}
+    for provider_name, _ in providers_config:
         try:
-            # Create adapter for each provider
-            llm = LangChainAdapter(provider=provider_name)
-
-            # Use unified .invoke() interface
-            response = llm.invoke(
-                messages=[{"role": "user", "content": question}],
-                model=model,
-                temperature=0.7,
-                max_tokens=100
+            adapters[provider_name] = LangChainAdapter(
+                provider=provider_name, response_cache=cache, http_client=_SHARED_HTTPX
             )
-
-            print(f"Response: {response}")
         except Exception as e:
-            print(f"Error: {e}")
+            adapters[provider_name] = e
+
+    # Seat a keep-alive connection to every provider up front, so the TLS
+    # handshakes overlap instead of sitting in front of each first request.
+    await asyncio.gather(*[
+        llm.awarmup() for llm in adapters.values() if not isinstance(llm, Exception)
+    ])
+
+    async def ask(provider_name, model):
+        llm = adapters[provider_name]
+        if isinstance(llm, Exception):
+            raise llm
+        # Use unified .ainvoke() interface
+        return await llm.ainvoke(
+            messages=[{"role": "user", "content": question}],
+            model=model,
+            temperature=0.7,
+            max_tokens=100,
+            cache="force",  # sampled request: cache it anyway for demo replays
+        )
+
+    results = await asyncio.gather(
+        *(ask(provider_name, model) for provider_name, model in providers_config),
+        return_exceptions=True,
+    )
+
+    for (provider_name, model), result in zip(providers_config, results):
+        print(f"\n[{provider_name.upper()}] Using model: {model}")
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
+        else:
+            print(f"Response: {result}")
 
 
 def streaming_with_adapter():
@@ -53,10 +95,11 @@ def streaming_with_adapter():
     print("Streaming response: ", end="", flush=True)
 
     # Now we can omit the model parameter
-    for chunk in llm.stream(
-        messages=[{"role": "user", "content": "Write a haiku about coding"}]
-    ):
-        print(chunk, end="", flush=True)
+    with ChunkAggregator() as out:
+        for chunk in llm.stream(
+            messages=[{"role": "user", "content": "Write a haiku about coding"}]
+        ):
+            out.feed(chunk)
 
     print("\n")
 
@@ -127,12 +170,20 @@ async def multi_provider_async_streaming():
     ])
 
 
+async def run_async_examples():
+    """Run the async examples on one event loop (pooled clients stay loop-bound)."""
+    try:
+        await compare_providers()
+        await async_adapter_example()
+        await multi_provider_async_streaming()
+    finally:
+        await _SHARED_HTTPX.aclose()
+
+
 if __name__ == "__main__":
     # Run synchronous examples
-    compare_providers()
     streaming_with_adapter()
     access_raw_client()
 
     # Run async examples
-    asyncio.run(async_adapter_example())
-    asyncio.run(multi_provider_async_streaming())
+    asyncio.run(run_async_examples())
@@ -5,7 +5,7 @@ This example demonstrates how to use the Qwen provider with UnifyLLM.
 """
 
 import asyncio
-from unify_llm import UnifyLLM
+from unify_llm import ChunkAggregator, UnifyLLM
 
 # Set your Qwen API key
 # Get it from: https://dashscope.console.aliyun.com/
@@ -59,11 +59,12 @@ def streaming_example():
     print("Streaming response: ", end="", flush=True)
 
     # Use LangChain-compatible .stream() method
-    for chunk in client.stream(
-        model="qwen-turbo",
-        messages=[{"role": "user", "content": "用简短的语言介绍一下人工智能的发展历史"}]
-    ):
-        print(chunk, end="", flush=True)
+    with ChunkAggregator() as out:
+        for chunk in client.stream(
+            model="qwen-turbo",
+            messages=[{"role": "user", "content": "用简短的语言介绍一下人工智能的发展历史"}]
+        ):
+            out.feed(chunk)
 
     print("\n")
 
@@ -92,11 +93,12 @@ async def async_streaming_example():
 
     print("Async streaming: ", end="", flush=True)
 
-    async for chunk in client.astream(
-        model="qwen-turbo",
-        messages=[{"role": "user", "content": "写一首关于编程的诗"}]
-    ):
-        print(chunk, end="", flush=True)
+    with ChunkAggregator() as out:
+        async for chunk in client.astream(
+            model="qwen-turbo",
+            messages=[{"role": "user", "content": "写一首关于编程的诗"}]
+        ):
+            out.feed(chunk)
 
     print("\n")
 
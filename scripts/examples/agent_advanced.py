@@ -7,6 +7,7 @@ This example demonstrates advanced capabilities:
 - Using agent templates
 """
 
+import asyncio
 import os
 from unify_llm import UnifyLLM
 from unify_llm.agent import (
@@ -20,8 +21,12 @@ from unify_llm.agent.builtin_tools import create_calculator_tool, create_string_
 from unify_llm.agent.extended_tools import create_datetime_tools, create_text_analysis_tools
 
 
-def demo_parallel_execution():
-    """Demonstrate parallel agent execution."""
+async def demo_parallel_execution():
+    """Demonstrate parallel agent execution.
+
+    The agents are LLM-bound, so they are fanned out on the event loop with
+    ``asyncio.gather`` (via ``aexecute_parallel``) rather than a thread pool.
+    """
     print("=" * 60)
     print("Demo: Parallel Agent Execution")
     print("=" * 60)
@@ -52,8 +57,12 @@ def demo_parallel_execution():
     print("Executing 3 agents in parallel...")
     print()
 
-    parallel = ParallelExecutor(max_workers=3)
-    results = parallel.execute_parallel(
+    await client.awarmup()
+
+    # No max_workers: concurrency is auto-sized to ceil(target_qps * median_rtt),
+    # bounded by the number of agents
+    parallel = ParallelExecutor(target_qps=10.0, median_rtt=1.5)
+    results = await parallel.aexecute_parallel(
         agents=[agent1, agent2, agent3],
         executors=[executor1, executor2, executor3],
         inputs=[
@@ -96,7 +105,8 @@ def demo_error_handling():
     # Create error handler
     handler = ErrorHandler(
         max_retries=3,
-        backoff_factor=1.5,
+        base=0.5,
+        cap=10.0,
         retry_on_errors=["timeout", "rate_limit", "api_error"]
     )
 
@@ -125,8 +135,8 @@ def demo_error_handling():
     print()
 
 
-def demo_agent_chain():
-    """Demonstrate agent chaining."""
+async def demo_agent_chain():
+    """Demonstrate agent chaining, streaming each step as it is generated."""
     print("=" * 60)
     print("Demo: Agent Chain (Research → Analyze → Write)")
     print("=" * 60)
@@ -171,7 +181,19 @@ def demo_agent_chain():
     print("Executing chain: Research → Analyze → Write")
     print()
 
-    result = chain.execute("What are the benefits of cloud computing?")
+    current_step = [None]
+
+    def on_chunk(step_name, text):
+        if step_name != current_step[0]:
+            current_step[0] = step_name
+            print(f"\n[{step_name}] ", end="")
+        print(text, end="", flush=True)
+
+    result = await chain.aexecute_streaming(
+        "What are the benefits of cloud computing?",
+        on_chunk=on_chunk
+    )
+    print("\n")
 
     # Display results
     print("Chain Results:")
@@ -241,13 +263,13 @@ def main():
         print("\n")
 
         # Uncomment to run these demos (require API key)
-        # demo_parallel_execution()
+        # asyncio.run(demo_parallel_execution())
         # print("\n")
         #
         # demo_error_handling()
         # print("\n")
         #
-        # demo_agent_chain()
+        # asyncio.run(demo_agent_chain())
 
     except Exception as e:
         print(f"Error running demo: {e}")
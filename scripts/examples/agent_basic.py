@@ -10,7 +10,6 @@ from unify_llm.agent import (
     AgentConfig,
     AgentExecutor,
     ToolRegistry,
-    ConversationMemory
 )
 from unify_llm.agent.builtin_tools import (
     create_calculator_tool,
@@ -25,6 +24,8 @@ def main():
         provider="openai",
         api_key=os.getenv("OPENAI_API_KEY")
     )
+    # Open the HTTPS connection now instead of on the first agent step
+    client.warmup()
 
     # Create tool registry
     registry = ToolRegistry()
@@ -53,11 +54,10 @@ Always use the appropriate tool when needed.""",
     # Create agent
     agent = Agent(config=config, client=client)
 
-    # Create executor
+    # Create executor (its memory is sized from config.memory_window)
     executor = AgentExecutor(
         agent=agent,
         tool_registry=registry,
-        memory=ConversationMemory(window_size=10),
         verbose=True
     )
 
@@ -3,10 +3,13 @@
 This example shows how to create custom tools for specific tasks.
 """
 
+import functools
+import itertools
 import os
 import requests
-from typing import List, Dict, Any
-from unify_llm import UnifyLLM
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple
+from unify_llm import ResponseCache, UnifyLLM
 from unify_llm.agent import (
     Agent,
     AgentConfig,
@@ -19,6 +22,45 @@ from unify_llm.agent import (
 )
 
 
+# Mock weather data (read-only). In production this would come from a real weather API.
+_MOCK_WEATHER = MappingProxyType({
+    "New York": {"temp": 72, "condition": "Sunny", "humidity": 65},
+    "London": {"temp": 61, "condition": "Cloudy", "humidity": 78},
+    "Tokyo": {"temp": 68, "condition": "Rainy", "humidity": 82},
+    "Paris": {"temp": 64, "condition": "Partly Cloudy", "humidity": 70},
+})
+_UNKNOWN_WEATHER = {"temp": 70, "condition": "Unknown", "humidity": 50}
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_weather(city: str) -> Tuple[int, str, int]:
+    """Return ``(temp, condition, humidity)`` for a city; agents repeat the same lookups."""
+    weather = _MOCK_WEATHER.get(city, _UNKNOWN_WEATHER)
+    return weather["temp"], weather["condition"], weather["humidity"]
+
+
+@functools.lru_cache(maxsize=None)
+def _param(
+    param_type: ToolParameterType,
+    description: str,
+    required: bool = True,
+    enum: Optional[Tuple[str, ...]] = None,
+    default: Optional[str] = None,
+) -> ToolParameter:
+    """Return a shared ToolParameter: identical specs reuse one instance.
+
+    Tool factories may be called many times (one set per agent); interning keeps
+    their parameter definitions from being rebuilt and re-validated each time.
+    """
+    return ToolParameter(
+        type=param_type,
+        description=description,
+        required=required,
+        enum=list(enum) if enum is not None else None,
+        default=default,
+    )
+
+
 def create_weather_tool() -> Tool:
     """Create a mock weather tool."""
 
@@ -31,24 +73,16 @@ def create_weather_tool() -> Tool:
         Returns:
             Weather information
         """
-        # This is a mock implementation
-        # In production, you would call a real weather API
-        mock_weather = {
-            "New York": {"temp": 72, "condition": "Sunny", "humidity": 65},
-            "London": {"temp": 61, "condition": "Cloudy", "humidity": 78},
-            "Tokyo": {"temp": 68, "condition": "Rainy", "humidity": 82},
-            "Paris": {"temp": 64, "condition": "Partly Cloudy", "humidity": 70},
-        }
-
-        weather = mock_weather.get(city, {"temp": 70, "condition": "Unknown", "humidity": 50})
+        temp, condition, humidity = _lookup_weather(city)
 
+        # A fresh ToolResult per call: callers may mutate it, so only the lookup is cached
         return ToolResult(
             success=True,
             output={
                 "city": city,
-                "temperature": weather["temp"],
-                "condition": weather["condition"],
-                "humidity": weather["humidity"],
+                "temperature": temp,
+                "condition": condition,
+                "humidity": humidity,
                 "unit": "Fahrenheit"
             },
             metadata={"source": "mock_api"}
@@ -58,11 +92,7 @@ def create_weather_tool() -> Tool:
         name="get_weather",
         description="Get current weather information for a city",
         parameters={
-            "city": ToolParameter(
-                type=ToolParameterType.STRING,
-                description="Name of the city to get weather for",
-                required=True
-            )
+            "city": _param(ToolParameterType.STRING, "Name of the city to get weather for")
         },
         function=get_weather
     )
@@ -71,54 +101,67 @@ def create_weather_tool() -> Tool:
 def create_todo_tools() -> List[Tool]:
     """Create TODO list management tools."""
 
-    # Shared TODO list storage
-    todo_list: List[Dict[str, Any]] = []
+    # Shared TODO storage as parallel per-field lists (struct of arrays): status
+    # queries such as the pending count run over one flat list of bools. The
+    # id -> position index keeps lookups O(1).
+    task_ids: List[int] = []
+    tasks: List[str] = []
+    priorities: List[str] = []
+    completed: List[bool] = []
+    position_by_id: Dict[int, int] = {}
+    # Ids keep increasing, so they never collide even if items are later removed
+    next_id = itertools.count(1)
 
     def add_todo(task: str, priority: str = "medium") -> ToolResult:
         """Add a task to the TODO list."""
-        todo_item = {
-            "id": len(todo_list) + 1,
-            "task": task,
-            "priority": priority,
-            "completed": False
-        }
-        todo_list.append(todo_item)
+        task_id = next(next_id)
+        position_by_id[task_id] = len(task_ids)
+        task_ids.append(task_id)
+        tasks.append(task)
+        priorities.append(priority)
+        completed.append(False)
 
         return ToolResult(
             success=True,
-            output=f"Added task #{todo_item['id']}: {task}",
-            metadata={"task_id": todo_item["id"]}
+            output=f"Added task #{task_id}: {task}",
+            metadata={"task_id": task_id}
         )
 
     def list_todos() -> ToolResult:
         """List all TODO items."""
-        if not todo_list:
+        if not task_ids:
             return ToolResult(
                 success=True,
                 output="No tasks in the TODO list",
-                metadata={"count": 0}
+                metadata={"count": 0, "pending": 0}
             )
 
+        # Rows are materialized only here, on demand, as an immutable snapshot (a
+        # tuple is sized exactly and still serializes to a JSON array for the LLM)
+        items = tuple(
+            {"id": task_id, "task": task, "priority": priority, "completed": done}
+            for task_id, task, priority, done in zip(task_ids, tasks, priorities, completed)
+        )
         return ToolResult(
             success=True,
-            output=todo_list.copy(),
-            metadata={"count": len(todo_list)}
+            output=items,
+            metadata={"count": len(items), "pending": completed.count(False)}
         )
 
     def complete_todo(task_id: int) -> ToolResult:
         """Mark a TODO item as completed."""
-        for item in todo_list:
-            if item["id"] == task_id:
-                item["completed"] = True
-                return ToolResult(
-                    success=True,
-                    output=f"Completed task #{task_id}: {item['task']}",
-                    metadata={"task_id": task_id}
-                )
+        position = position_by_id.get(task_id)
+        if position is None:
+            return ToolResult(
+                success=False,
+                error=f"Task #{task_id} not found"
+            )
 
+        completed[position] = True
         return ToolResult(
-            success=False,
-            error=f"Task #{task_id} not found"
+            success=True,
+            output=f"Completed task #{task_id}: {tasks[position]}",
+            metadata={"task_id": task_id}
         )
 
     tools = []
@@ -128,16 +171,12 @@ def create_todo_tools() -> List[Tool]:
         name="add_todo",
         description="Add a new task to the TODO list",
         parameters={
-            "task": ToolParameter(
-                type=ToolParameterType.STRING,
-                description="Task description",
-                required=True
-            ),
-            "priority": ToolParameter(
-                type=ToolParameterType.STRING,
-                description="Task priority: low, medium, or high",
+            "task": _param(ToolParameterType.STRING, "Task description"),
+            "priority": _param(
+                ToolParameterType.STRING,
+                "Task priority: low, medium, or high",
                 required=False,
-                enum=["low", "medium", "high"],
+                enum=("low", "medium", "high"),
                 default="medium"
             )
         },
@@ -157,11 +196,7 @@ def create_todo_tools() -> List[Tool]:
         name="complete_todo",
         description="Mark a task as completed",
         parameters={
-            "task_id": ToolParameter(
-                type=ToolParameterType.INTEGER,
-                description="ID of the task to complete",
-                required=True
-            )
+            "task_id": _param(ToolParameterType.INTEGER, "ID of the task to complete")
         },
         function=complete_todo
     ))
@@ -170,17 +205,18 @@ def create_todo_tools() -> List[Tool]:
 
 
 def main():
-    # Initialize UnifyLLM client
+    # Initialize UnifyLLM client. Re-running the demo asks the same questions, so
+    # deterministic (temperature 0) calls are answered from an on-disk cache; user
+    # prompts are matched case- and whitespace-insensitively.
     client = UnifyLLM(
         provider="openai",
-        api_key=os.getenv("OPENAI_API_KEY")
+        api_key=os.getenv("OPENAI_API_KEY"),
+        response_cache=ResponseCache(path=".unify_llm_cache.sqlite", normalize_prompts=True)
     )
 
     # Create tool registry and register custom tools
     registry = ToolRegistry()
-    registry.register(create_weather_tool())
-    for tool in create_todo_tools():
-        registry.register(tool)
+    registry.register_many((create_weather_tool(), *create_todo_tools()))
 
     # Configure agent with custom tools
     config = AgentConfig(
@@ -189,7 +225,7 @@ def main():
         provider="openai",
         system_prompt="""You are a helpful personal assistant with access to weather
 information and TODO list management. Help users manage their tasks and get weather updates.""",
-        temperature=0.7,
+        temperature=0.0,
         max_iterations=10,
         enable_memory=True,
         tools=["get_weather", "add_todo", "list_todos", "complete_todo"]
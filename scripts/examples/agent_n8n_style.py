@@ -16,7 +16,13 @@ Use case: Automated GitHub issue tracker that:
 """
 
 import asyncio
-from datetime import datetime
+import io
+import itertools
+import sys
+import time
+import traceback
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 from unify_llm.agent import (
     # Triggers
     ScheduleTrigger,
@@ -30,6 +36,7 @@ from unify_llm.agent import (
     http_request,
     http_get,
     create_http_request_tool,
+    shared_http_client,
     # Execution History
     ExecutionHistory,
     ExecutionData,
@@ -44,11 +51,37 @@ from unify_llm.agent import (
 )
 
 
+BAR = "=" * 60
+
+_SUMMARY = "\n".join([
+    "",
+    "📚 Key Features Demonstrated:",
+    "  ✅ Schedule Triggers (cron-based automation)",
+    "  ✅ Webhook Triggers (HTTP endpoint triggers)",
+    "  ✅ Interval Triggers (fixed interval execution)",
+    "  ✅ HTTP Request Node (API calls)",
+    "  ✅ Execution History (persistent tracking)",
+    "  ✅ Complete Automation Pipeline",
+    "",
+    "🎯 n8n-Style Capabilities:",
+    "  • Automated workflow execution",
+    "  • Time-based scheduling (cron)",
+    "  • HTTP webhooks and triggers",
+    "  • REST API integration",
+    "  • Execution history and analytics",
+    "  • Error handling and recovery",
+    "",
+])
+
+
+def _banner(title):
+    """Write a section banner in a single write call."""
+    sys.stdout.write(f"\n{BAR}\n{title}\n{BAR}\n")
+
+
 async def example_1_schedule_trigger():
     """Example 1: Schedule Trigger - Run workflow every 5 minutes"""
-    print("\n" + "=" * 60)
-    print("Example 1: Schedule Trigger (Cron-based)")
-    print("=" * 60)
+    _banner("Example 1: Schedule Trigger (Cron-based)")
 
     def on_scheduled_execution(event):
         """Handle scheduled execution"""
@@ -86,16 +119,15 @@ async def example_1_schedule_trigger():
 
 async def example_2_http_requests():
     """Example 2: HTTP Request Node - Fetching data from APIs"""
-    print("\n" + "=" * 60)
-    print("Example 2: HTTP Request Node (API Calls)")
-    print("=" * 60)
+    _banner("Example 2: HTTP Request Node (API Calls)")
 
     # Example: Fetch GitHub repository info
     print("\nFetching GitHub repository data...")
 
     result = await http_get(
         url="https://api.github.com/repos/microsoft/vscode",
-        headers={"Accept": "application/json"}
+        headers={"Accept": "application/json"},
+        cache_ttl=60.0  # repeated runs within a minute skip the round-trip
     )
 
     if result.success:
@@ -131,9 +163,7 @@ async def example_2_http_requests():
 
 async def example_3_webhook_trigger():
     """Example 3: Webhook Trigger - HTTP endpoint trigger"""
-    print("\n" + "=" * 60)
-    print("Example 3: Webhook Trigger")
-    print("=" * 60)
+    _banner("Example 3: Webhook Trigger")
 
     def on_webhook_triggered(event):
         """Handle webhook execution"""
@@ -175,85 +205,89 @@ async def example_3_webhook_trigger():
 
 async def example_4_execution_history():
     """Example 4: Execution History - Persistent tracking"""
-    print("\n" + "=" * 60)
-    print("Example 4: Execution History (Persistence)")
-    print("=" * 60)
+    _banner("Example 4: Execution History (Persistence)")
 
     # Initialize history
-    history = ExecutionHistory(db_path="demo_executions.db")
-
-    # Save some executions
-    executions = [
-        ExecutionData(
-            id="exec_001",
-            workflow_id="github_workflow",
-            workflow_name="GitHub Issue Tracker",
-            status=ExecutionStatus.SUCCESS,
-            start_time=datetime.now(),
-            end_time=datetime.now(),
-            trigger_type="schedule",
-            input_data={"repo": "microsoft/vscode"},
-            output_data={"issues_found": 10}
-        ),
-        ExecutionData(
-            id="exec_002",
-            workflow_id="github_workflow",
-            workflow_name="GitHub Issue Tracker",
-            status=ExecutionStatus.SUCCESS,
-            start_time=datetime.now(),
-            end_time=datetime.now(),
-            trigger_type="webhook",
-            input_data={"repo": "facebook/react"},
-            output_data={"issues_found": 15}
-        ),
-        ExecutionData(
-            id="exec_003",
-            workflow_id="github_workflow",
-            workflow_name="GitHub Issue Tracker",
-            status=ExecutionStatus.ERROR,
-            start_time=datetime.now(),
-            end_time=datetime.now(),
-            trigger_type="manual",
-            input_data={"repo": "invalid/repo"},
-            error="Repository not found"
-        )
-    ]
-
-    print("\nSaving execution history...")
-    for execution in executions:
-        history.save(execution)
-        print(f"  ✅ Saved: {execution.id} - {execution.status}")
-
-    # Query history
-    print("\n\nRecent executions:")
-    recent = history.get_recent(limit=5)
-    for execution in recent:
-        print(f"  - [{execution.status.value}] {execution.workflow_name} ({execution.trigger_type})")
-
-    # Get statistics
-    stats = history.get_statistics(workflow_id="github_workflow")
-    print(f"\n\nWorkflow Statistics:")
-    print(f"  Total executions: {stats['total']}")
-    print(f"  Successful: {stats['success']}")
-    print(f"  Failed: {stats['error']}")
-    print(f"  Success rate: {stats['success_rate']}%")
+    # In-memory for the demo: no disk writes, released when the block exits
+    with ExecutionHistory(db_path=":memory:") as history:
+        # Save some executions (one wall-clock reading shared by all of them)
+        now = datetime.now()
+        executions = [
+            ExecutionData(
+                id="exec_001",
+                workflow_id="github_workflow",
+                workflow_name="GitHub Issue Tracker",
+                status=ExecutionStatus.SUCCESS,
+                start_time=now,
+                end_time=now,
+                trigger_type="schedule",
+                input_data={"repo": "microsoft/vscode"},
+                output_data={"issues_found": 10}
+            ),
+            ExecutionData(
+                id="exec_002",
+                workflow_id="github_workflow",
+                workflow_name="GitHub Issue Tracker",
+                status=ExecutionStatus.SUCCESS,
+                start_time=now,
+                end_time=now,
+                trigger_type="webhook",
+                input_data={"repo": "facebook/react"},
+                output_data={"issues_found": 15}
+            ),
+            ExecutionData(
+                id="exec_003",
+                workflow_id="github_workflow",
+                workflow_name="GitHub Issue Tracker",
+                status=ExecutionStatus.ERROR,
+                start_time=now,
+                end_time=now,
+                trigger_type="manual",
+                input_data={"repo": "invalid/repo"},
+                error="Repository not found"
+            )
+        ]
+
+        print("\nSaving execution history...")
+        history.save_many(executions)  # one transaction for the whole batch
+        # Report once, after the commit, instead of one print per row
+        print("\n".join(
+            f"  ✅ Saved: {execution.id} - {execution.status}" for execution in executions
+        ))
+
+        # Query history
+        print("\n\nRecent executions:")
+        recent = history.get_recent(limit=5)
+        print("\n".join(
+            f"  - [{execution.status.value}] {execution.workflow_name} ({execution.trigger_type})"
+            for execution in recent
+        ))
+
+        # Get statistics
+        stats = history.get_statistics(workflow_id="github_workflow")
+        print(f"\n\nWorkflow Statistics:")
+        print(f"  Total executions: {stats['total']}")
+        print(f"  Successful: {stats['success']}")
+        print(f"  Failed: {stats['error']}")
+        print(f"  Success rate: {stats['success_rate']}%")
 
 
 async def example_5_complete_automation():
     """Example 5: Complete n8n-style Automation"""
-    print("\n" + "=" * 60)
-    print("Example 5: Complete Automation Pipeline")
-    print("=" * 60)
+    _banner("Example 5: Complete Automation Pipeline")
 
     # Initialize components
-    history = ExecutionHistory(db_path="automation_executions.db")
+    history = ExecutionHistory(db_path=":memory:")
     trigger_manager = TriggerManager()
 
     async def run_workflow(event):
         """Execute the workflow"""
-        execution_id = f"exec_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # One wall-clock reading for the start; the end is derived from a monotonic timer
+        started_at = datetime.now()
+        t0 = time.perf_counter()
+        execution_id = f"exec_{started_at.strftime('%Y%m%d_%H%M%S')}"
 
-        print(f"\n[{datetime.now()}] Workflow execution started")
+        print(f"\n[{started_at}] Workflow execution started")
         print(f"  Execution ID: {execution_id}")
         print(f"  Triggered by: {event.trigger_type}")
 
@@ -263,39 +297,47 @@ async def example_5_complete_automation():
             workflow_id=event.metadata["workflow_id"],
             workflow_name="Automated GitHub Monitor",
             status=ExecutionStatus.RUNNING,
-            start_time=datetime.now(),
+            start_time=started_at,
             trigger_type=event.trigger_type.value,
             input_data=event.data
         )
         history.save(execution)
 
         try:
-            # Step 1: Fetch GitHub data
-            print("  Step 1: Fetching GitHub issues...")
-            result = await http_get(
-                url="https://api.github.com/repos/microsoft/vscode/issues",
-                query_params={"state": "open", "per_page": "5"}
-            )
-
-            if not result.success:
-                raise Exception(f"Failed to fetch issues: {result.error}")
-
-            issues = result.output["body"]
-            print(f"    ✅ Found {len(issues)} open issues")
+            # Step 1: Fetch GitHub data (all repos concurrently)
+            repos = event.data.get("repos") or [event.data.get("repo", "microsoft/vscode")]
+            print(f"  Step 1: Fetching GitHub issues for {len(repos)} repo(s)...")
+
+            async def fetch_repo(repo):
+                return await http_get(
+                    url=f"https://api.github.com/repos/{repo}/issues",
+                    query_params={"state": "open", "per_page": "5"},
+                    cache_ttl=60.0
+                )
+
+            results = await asyncio.gather(*(fetch_repo(repo) for repo in repos))
+
+            issues_by_repo = {}
+            for repo, result in zip(repos, results):
+                if not result.success:
+                    raise Exception(f"Failed to fetch issues for {repo}: {result.error}")
+                issues_by_repo[repo] = result.output["body"]
+                print(f"    ✅ {repo}: found {len(issues_by_repo[repo])} open issues")
 
             # Step 2: Process data
             print("  Step 2: Processing issues...")
             issue_summary = [
-                {"title": issue["title"], "number": issue["number"]}
-                for issue in issues[:3]
+                {"repo": repo, "title": issue["title"], "number": issue["number"]}
+                for repo, issues in issues_by_repo.items()
+                for issue in itertools.islice(issues, 3)
             ]
             print(f"    ✅ Processed {len(issue_summary)} issues")
 
             # Update execution as success
             execution.status = ExecutionStatus.SUCCESS
-            execution.end_time = datetime.now()
+            execution.end_time = started_at + timedelta(seconds=time.perf_counter() - t0)
             execution.output_data = {
-                "issues_count": len(issues),
+                "issues_count": sum(len(issues) for issues in issues_by_repo.values()),
                 "summary": issue_summary
             }
             history.save(execution)
@@ -306,7 +348,7 @@ async def example_5_complete_automation():
         except Exception as e:
             # Update execution as error
             execution.status = ExecutionStatus.ERROR
-            execution.end_time = datetime.now()
+            execution.end_time = started_at + timedelta(seconds=time.perf_counter() - t0)
             execution.error = str(e)
             history.save(execution)
 
@@ -344,7 +386,7 @@ async def example_5_complete_automation():
 
     # Manually trigger for demo
     print("\nTriggering manual execution for demonstration...")
-    manual_trigger.execute({"repo": "microsoft/vscode", "reason": "demo"})
+    manual_trigger.execute({"repos": ["microsoft/vscode", "microsoft/TypeScript"], "reason": "demo"})
 
     # Wait a bit
     await asyncio.sleep(2)
@@ -357,42 +399,65 @@ async def example_5_complete_automation():
 
     # Cleanup
     await trigger_manager.stop_all()
+    history.close()
     print("\n✅ All triggers stopped")
 
 
+# Output buffer of the example running in the current task (None = real stdout)
+_example_output: ContextVar[io.StringIO | None] = ContextVar("_example_output", default=None)
+
+
+class _PerExampleStdout(io.TextIOBase):
+    """stdout proxy that sends print() output to the current example's buffer."""
+
+    def __init__(self, target):
+        self._target = target
+
+    def write(self, text):
+        buffer = _example_output.get()
+        return (buffer if buffer is not None else self._target).write(text)
+
+    def flush(self):
+        self._target.flush()
+
+
+async def _run_buffered(example):
+    """Run one example, capturing its output so concurrent examples don't interleave."""
+    buffer = io.StringIO()
+    _example_output.set(buffer)
+    try:
+        await example()
+    except Exception:
+        traceback.print_exc(file=buffer)
+    return buffer.getvalue()
+
+
 async def main():
     """Run all examples"""
-    print("\n" + "🚀 " + "=" * 58)
-    print("UnifyLLM n8n-Style AI Agent Features Demo")
-    print("=" * 60)
+    sys.stdout.write(f"\n🚀 {BAR[:58]}\nUnifyLLM n8n-Style AI Agent Features Demo\n{BAR}\n")
 
     try:
-        # Run examples
-        await example_1_schedule_trigger()
-        await example_2_http_requests()
-        await example_3_webhook_trigger()
-        await example_4_execution_history()
-        await example_5_complete_automation()
-
-        print("\n" + "=" * 60)
-        print("✅ All examples completed successfully!")
-        print("=" * 60)
-
-        print("\n📚 Key Features Demonstrated:")
-        print("  ✅ Schedule Triggers (cron-based automation)")
-        print("  ✅ Webhook Triggers (HTTP endpoint triggers)")
-        print("  ✅ Interval Triggers (fixed interval execution)")
-        print("  ✅ HTTP Request Node (API calls)")
-        print("  ✅ Execution History (persistent tracking)")
-        print("  ✅ Complete Automation Pipeline")
-
-        print("\n🎯 n8n-Style Capabilities:")
-        print("  • Automated workflow execution")
-        print("  • Time-based scheduling (cron)")
-        print("  • HTTP webhooks and triggers")
-        print("  • REST API integration")
-        print("  • Execution history and analytics")
-        print("  • Error handling and recovery")
+        # The examples are independent and mostly wait on the network, so run them
+        # concurrently; each one's output is buffered and printed in order afterwards.
+        # All their HTTP calls share one keep-alive connection pool.
+        stdout = sys.stdout
+        sys.stdout = _PerExampleStdout(stdout)
+        try:
+            async with shared_http_client():
+                outputs = await asyncio.gather(
+                    _run_buffered(example_1_schedule_trigger),
+                    _run_buffered(example_2_http_requests),
+                    _run_buffered(example_3_webhook_trigger),
+                    _run_buffered(example_4_execution_history),
+                    _run_buffered(example_5_complete_automation),
+                )
+        finally:
+            sys.stdout = stdout
+        for output in outputs:
+            print(output, end="")
+
+        _banner("✅ All examples completed successfully!")
+        sys.stdout.write(_SUMMARY)
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -20,6 +20,42 @@ from unify_llm.agent import (
 from unify_llm.agent.builtin_tools import create_calculator_tool, create_string_tools
 
 
+# Agent configurations are static, so they are built once at import time
+# rather than on every run
+RESEARCHER_CONFIG = AgentConfig(
+    name="researcher",
+    model="gpt-4",
+    provider="openai",
+    system_prompt="""You are a research specialist. Your job is to gather and organize
+information about a topic. Provide detailed, well-structured information.""",
+    temperature=0.7,
+    max_iterations=5,
+    tools=["calculator"]
+)
+
+ANALYST_CONFIG = AgentConfig(
+    name="analyst",
+    model="gpt-4",
+    provider="openai",
+    system_prompt="""You are a data analyst. Your job is to analyze information
+and extract key insights. Be analytical and thorough.""",
+    temperature=0.5,
+    max_iterations=5,
+    tools=["calculator"]
+)
+
+WRITER_CONFIG = AgentConfig(
+    name="writer",
+    model="gpt-4",
+    provider="openai",
+    system_prompt="""You are a technical writer. Your job is to take complex
+information and write clear, concise summaries. Be clear and engaging.""",
+    temperature=0.8,
+    max_iterations=5,
+    tools=["count_words"]
+)
+
+
 def main():
     # Initialize UnifyLLM client
     client = UnifyLLM(
@@ -29,48 +65,12 @@ def main():
 
     # Create shared tool registry
     registry = ToolRegistry()
-    registry.register(create_calculator_tool())
-    for tool in create_string_tools():
-        registry.register(tool)
-
-    # Create specialized agents
-    researcher_config = AgentConfig(
-        name="researcher",
-        model="gpt-4",
-        provider="openai",
-        system_prompt="""You are a research specialist. Your job is to gather and organize
-information about a topic. Provide detailed, well-structured information.""",
-        temperature=0.7,
-        max_iterations=5,
-        tools=["calculator"]
-    )
-
-    analyst_config = AgentConfig(
-        name="analyst",
-        model="gpt-4",
-        provider="openai",
-        system_prompt="""You are a data analyst. Your job is to analyze information
-and extract key insights. Be analytical and thorough.""",
-        temperature=0.5,
-        max_iterations=5,
-        tools=["calculator"]
-    )
-
-    writer_config = AgentConfig(
-        name="writer",
-        model="gpt-4",
-        provider="openai",
-        system_prompt="""You are a technical writer. Your job is to take complex
-information and write clear, concise summaries. Be clear and engaging.""",
-        temperature=0.8,
-        max_iterations=5,
-        tools=["count_words"]
-    )
+    registry.register_many((create_calculator_tool(), *create_string_tools()))
 
     # Create agent instances
-    researcher = Agent(config=researcher_config, client=client)
-    analyst = Agent(config=analyst_config, client=client)
-    writer = Agent(config=writer_config, client=client)
+    researcher = Agent(config=RESEARCHER_CONFIG, client=client)
+    analyst = Agent(config=ANALYST_CONFIG, client=client)
+    writer = Agent(config=WRITER_CONFIG, client=client)
 
     # Define workflow: Research -> Analyze -> Write
     workflow_config = WorkflowConfig(
@@ -15,11 +15,14 @@ Scenario: A team of AI agents working together to analyze code
 """
 
 import asyncio
+import functools
+import hashlib
 import os
-from typing import Dict, Any
+from typing import Awaitable, Callable, Dict, Any, Tuple
 from datetime import datetime
 
-from unify_llm import UnifyLLM, MessageBus, MessageBusConfig
+from unify_llm import UnifyLLM
+from unify_llm.adapters.base import canonical_json
 from unify_llm.agent import Agent, AgentConfig, AgentType
 from unify_llm.a2a import (
     A2AAgent,
@@ -28,9 +31,171 @@ from unify_llm.a2a import (
     AgentRegistry,
     AgentCollaboration,
     CollaborationStrategy,
+    ConversationHistory,
+    MessageBus,
+    get_default_bus,
+    get_default_registry,
 )
 
 
+# Report layout for the doc writer, parsed once instead of rebuilt per call. The
+# sections are kept separate so the streaming writer can emit them one by one.
+_DOC_SECTIONS = (
+    """
+# Code Analysis Report
+
+Generated: {generated}
+""",
+    """
+## Quality Analysis
+- Quality Score: {quality_score}
+- Issues Found: {issue_count}
+""",
+    """
+## Security Analysis
+- Severity: {severity}
+- Vulnerabilities: {vulnerability_count}
+""",
+    """
+## Recommendations
+{recommendations}
+""",
+)
+_DOC_TEMPLATE = "".join(_DOC_SECTIONS)
+
+# Capability descriptors are invariant, so they are built once per process and
+# shared by every AgentTeam instead of being reconstructed on each team init
+_ANALYZE_CAPABILITY = AgentCapability(
+    name="analyze_code",
+    description="Analyze code files for quality and complexity",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "file_path": {"type": "string"},
+            "language": {"type": "string"}
+        }
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "quality_score": {"type": "number"},
+            "issues": {"type": "array"},
+            "recommendations": {"type": "array"}
+        }
+    },
+    tags=["code", "analysis"]
+)
+
+_AUDIT_CAPABILITY = AgentCapability(
+    name="audit_security",
+    description="Audit code for security vulnerabilities",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "code": {"type": "string"}
+        }
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "vulnerabilities": {"type": "array"},
+            "severity": {"type": "string"},
+            "recommendations": {"type": "array"}
+        }
+    },
+    tags=["security", "audit"]
+)
+
+_WRITE_CAPABILITY = AgentCapability(
+    name="write_docs",
+    description="Write documentation based on code analysis",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "analysis": {"type": "object"},
+            "security": {"type": "object"}
+        }
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "documentation": {"type": "string"}
+        }
+    },
+    tags=["documentation", "writing"]
+)
+
+_WRITE_STREAM_CAPABILITY = AgentCapability(
+    name="write_docs_stream",
+    description="Write documentation section by section as it is generated",
+    input_schema=_WRITE_CAPABILITY.input_schema,
+    output_schema={"type": "string"},
+    tags=["documentation", "writing", "streaming"]
+)
+
+_COORDINATE_CAPABILITY = AgentCapability(
+    name="coordinate_analysis",
+    description="Coordinate code analysis workflow",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "task": {"type": "string"}
+        }
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "status": {"type": "string"},
+            "results": {"type": "object"}
+        }
+    },
+    tags=["coordination", "workflow"]
+)
+
+
+def _doc_fields(analysis: Dict[str, Any], security: Dict[str, Any]) -> Dict[str, Any]:
+    """Values for the report template placeholders."""
+    return {
+        "generated": datetime.now().isoformat(),
+        "quality_score": analysis.get("quality_score", "N/A"),
+        "issue_count": len(analysis.get("issues") or []),
+        "severity": security.get("severity", "N/A"),
+        "vulnerability_count": len(security.get("vulnerabilities") or []),
+        "recommendations": "\n".join(["- " + r for r in analysis.get("recommendations") or []]),
+    }
+
+
+CapabilityHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def cached_capability(stats: Dict[str, int]) -> Callable[[CapabilityHandler], CapabilityHandler]:
+    """Memoize a capability handler on its input data.
+
+    Capability handlers stand in for (expensive) LLM calls, and the same input
+    always yields a reusable answer, so results are keyed by a blake2b digest of
+    the canonical JSON of ``input_data``. Hits and misses are counted in ``stats``.
+    For production, this dict can be swapped for a semantic cache such as GPTCache.
+    """
+    def decorator(handler: CapabilityHandler) -> CapabilityHandler:
+        cache: Dict[str, Dict[str, Any]] = {}
+
+        @functools.wraps(handler)
+        async def wrapper(input_data: Dict[str, Any]) -> Dict[str, Any]:
+            key = hashlib.blake2b(canonical_json(input_data), digest_size=16).hexdigest()
+            cached = cache.get(key)
+            if cached is not None:
+                stats["hits"] += 1
+            else:
+                stats["misses"] += 1
+                cached = cache[key] = await handler(input_data)
+            # Hand out a copy so callers cannot mutate the cached result
+            return dict(cached)
+
+        return wrapper
+
+    return decorator
+
+
 class DemoConfig:
     """Configuration for the demo."""
 
@@ -49,11 +214,31 @@ class DemoConfig:
 class AgentTeam:
     """A team of specialized AI agents."""
 
-    def __init__(self, config: DemoConfig):
+    def __init__(
+        self,
+        config: DemoConfig,
+        registry: AgentRegistry | None = None,
+        message_bus: MessageBus | None = None,
+    ):
         self.config = config
-        self.registry = AgentRegistry()
-        self.message_bus = MessageBus(MessageBusConfig(name="agent-team"))
+        # Default to the running loop's shared registry and bus so agents from other
+        # modules can discover and message this team
+        self.registry = registry or get_default_registry()
+        self.message_bus = message_bus or get_default_bus()
         self.agents: Dict[str, A2AAgent] = {}
+        self._clients: Dict[Tuple[str, str, str], UnifyLLM] = {}
+        self.capability_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        # (agent_id, handler) pairs this team put on the bus, removed again on shutdown:
+        # the default bus outlives the team, so stale handlers would keep firing
+        self._subscriptions: list[tuple[str, Callable[..., Awaitable[None]]]] = []
+        # One append-only history shared by the whole team: results are added as new
+        # messages, so every agent's prompt prefix stays byte-identical (prompt-cacheable)
+        self.history = ConversationHistory(reset_cache_after_n_turns=20)
+
+    def _subscribe(self, agent_id: str, handler: Callable[..., Awaitable[None]]) -> None:
+        """Subscribe a handler to the bus and remember it for shutdown."""
+        self.message_bus.subscribe(agent_id, handler)
+        self._subscriptions.append((agent_id, handler))
 
     async def initialize(self):
         """Initialize the agent team."""
@@ -63,11 +248,13 @@ class AgentTeam:
         await self.message_bus.start()
         print("✅ Message bus started")
 
-        # Create specialized agents
-        await self._create_code_analyzer()
-        await self._create_security_auditor()
-        await self._create_doc_writer()
-        await self._create_coordinator()
+        # Create specialized agents (independent of each other, so start them concurrently)
+        await asyncio.gather(
+            self._create_code_analyzer(),
+            self._create_security_auditor(),
+            self._create_doc_writer(),
+            self._create_coordinator(),
+        )
 
         print(f"✅ Created {len(self.agents)} specialized agents")
 
@@ -91,33 +278,14 @@ class AgentTeam:
             base_agent=base_agent,
             config=A2AAgentConfig(
                 agent_name="code_analyzer",
-                capabilities=[
-                    AgentCapability(
-                        name="analyze_code",
-                        description="Analyze code files for quality and complexity",
-                        input_schema={
-                            "type": "object",
-                            "properties": {
-                                "file_path": {"type": "string"},
-                                "language": {"type": "string"}
-                            }
-                        },
-                        output_schema={
-                            "type": "object",
-                            "properties": {
-                                "quality_score": {"type": "number"},
-                                "issues": {"type": "array"},
-                                "recommendations": {"type": "array"}
-                            }
-                        },
-                        tags=["code", "analysis"]
-                    )
-                ]
+                capabilities=[_ANALYZE_CAPABILITY]
             ),
-            registry=self.registry
+            registry=self.registry,
+            history=self.history
         )
 
         @a2a_agent.handle_capability("analyze_code")
+        @cached_capability(self.capability_cache_stats)
         async def handle_analyze(input_data):
             file_path = input_data.get("file_path", "")
             language = input_data.get("language", "python")
@@ -139,11 +307,7 @@ class AgentTeam:
         self.agents["code_analyzer"] = a2a_agent
 
         # Subscribe to message bus
-        async def handle_message(msg):
-            if msg.get("type") == "analyze_request":
-                print(f"   📊 Code Analyzer: Processing {msg.get('file')}")
-
-        self.message_bus.subscribe("code_analyzer", handle_message)
+        self._subscribe("code_analyzer", self._on_analyzer_message)
 
     async def _create_security_auditor(self):
         """Create security audit agent."""
@@ -165,32 +329,14 @@ class AgentTeam:
             base_agent=base_agent,
             config=A2AAgentConfig(
                 agent_name="security_auditor",
-                capabilities=[
-                    AgentCapability(
-                        name="audit_security",
-                        description="Audit code for security vulnerabilities",
-                        input_schema={
-                            "type": "object",
-                            "properties": {
-                                "code": {"type": "string"}
-                            }
-                        },
-                        output_schema={
-                            "type": "object",
-                            "properties": {
-                                "vulnerabilities": {"type": "array"},
-                                "severity": {"type": "string"},
-                                "recommendations": {"type": "array"}
-                            }
-                        },
-                        tags=["security", "audit"]
-                    )
-                ]
+                capabilities=[_AUDIT_CAPABILITY]
             ),
-            registry=self.registry
+            registry=self.registry,
+            history=self.history
         )
 
         @a2a_agent.handle_capability("audit_security")
+        @cached_capability(self.capability_cache_stats)
         async def handle_audit(input_data):
             # Simulate security audit
             return {
@@ -209,11 +355,7 @@ class AgentTeam:
         await a2a_agent.start()
         self.agents["security_auditor"] = a2a_agent
 
-        async def handle_message(msg):
-            if msg.get("type") == "security_check":
-                print(f"   🔒 Security Auditor: Checking {msg.get('file')}")
-
-        self.message_bus.subscribe("security_auditor", handle_message)
+        self._subscribe("security_auditor", self._on_auditor_message)
 
     async def _create_doc_writer(self):
         """Create documentation writer agent."""
@@ -235,62 +377,34 @@ class AgentTeam:
             base_agent=base_agent,
             config=A2AAgentConfig(
                 agent_name="doc_writer",
-                capabilities=[
-                    AgentCapability(
-                        name="write_docs",
-                        description="Write documentation based on code analysis",
-                        input_schema={
-                            "type": "object",
-                            "properties": {
-                                "analysis": {"type": "object"},
-                                "security": {"type": "object"}
-                            }
-                        },
-                        output_schema={
-                            "type": "object",
-                            "properties": {
-                                "documentation": {"type": "string"}
-                            }
-                        },
-                        tags=["documentation", "writing"]
-                    )
-                ]
+                capabilities=[_WRITE_CAPABILITY, _WRITE_STREAM_CAPABILITY]
             ),
-            registry=self.registry
+            registry=self.registry,
+            history=self.history
         )
 
         @a2a_agent.handle_capability("write_docs")
+        @cached_capability(self.capability_cache_stats)
         async def handle_write(input_data):
             analysis = input_data.get("analysis", {})
             security = input_data.get("security", {})
 
             # Simulate documentation generation
-            doc = f"""
-# Code Analysis Report
-
-Generated: {datetime.now().isoformat()}
-
-## Quality Analysis
-- Quality Score: {analysis.get('quality_score', 'N/A')}
-- Issues Found: {len(analysis.get('issues', []))}
-
-## Security Analysis
-- Severity: {security.get('severity', 'N/A')}
-- Vulnerabilities: {len(security.get('vulnerabilities', []))}
-
-## Recommendations
-{chr(10).join('- ' + r for r in analysis.get('recommendations', []))}
-"""
+            doc = _DOC_TEMPLATE.format_map(_doc_fields(analysis, security))
             return {"documentation": doc}
 
+        @a2a_agent.handle_stream_capability("write_docs_stream")
+        async def handle_write_stream(input_data):
+            fields = _doc_fields(input_data.get("analysis", {}), input_data.get("security", {}))
+            # Yield each section as soon as it is rendered (an LLM-backed writer
+            # would stream tokens here)
+            for section in _DOC_SECTIONS:
+                yield section.format_map(fields)
+
         await a2a_agent.start()
         self.agents["doc_writer"] = a2a_agent
 
-        async def handle_message(msg):
-            if msg.get("type") == "write_request":
-                print(f"   📝 Doc Writer: Creating documentation")
-
-        self.message_bus.subscribe("doc_writer", handle_message)
+        self._subscribe("doc_writer", self._on_writer_message)
 
     async def _create_coordinator(self):
         """Create coordinator agent to manage workflow."""
@@ -312,115 +426,113 @@ Generated: {datetime.now().isoformat()}
             base_agent=base_agent,
             config=A2AAgentConfig(
                 agent_name="coordinator",
-                capabilities=[
-                    AgentCapability(
-                        name="coordinate_analysis",
-                        description="Coordinate code analysis workflow",
-                        input_schema={
-                            "type": "object",
-                            "properties": {
-                                "task": {"type": "string"}
-                            }
-                        },
-                        output_schema={
-                            "type": "object",
-                            "properties": {
-                                "status": {"type": "string"},
-                                "results": {"type": "object"}
-                            }
-                        },
-                        tags=["coordination", "workflow"]
-                    )
-                ]
+                capabilities=[_COORDINATE_CAPABILITY]
             ),
-            registry=self.registry
+            registry=self.registry,
+            history=self.history
         )
 
         await a2a_agent.start()
         self.agents["coordinator"] = a2a_agent
 
+    # Message-bus handlers are plain methods rather than per-agent closures
+    async def _on_analyzer_message(self, msg):
+        if msg.get("type") == "analyze_request":
+            print(f"   📊 Code Analyzer: Processing {msg.get('file')}")
+
+    async def _on_auditor_message(self, msg):
+        if msg.get("type") == "security_check":
+            print(f"   🔒 Security Auditor: Checking {msg.get('file')}")
+
+    async def _on_writer_message(self, msg):
+        if msg.get("type") == "write_request":
+            print(f"   📝 Doc Writer: Creating documentation")
+
     def _create_client(self) -> UnifyLLM:
-        """Create UnifyLLM client."""
-        if self.config.is_demo_mode:
-            # In demo mode, create client that will simulate responses
-            return UnifyLLM(
-                provider="databricks",
-                api_key=self.config.databricks_api_key,
-                base_url=self.config.databricks_base_url
-            )
-        else:
-            # Real Databricks connection
-            return UnifyLLM(
+        """Return the UnifyLLM client for the configured endpoint.
+
+        All agents talk to the same provider/api_key/base_url, so they share one
+        client (and its connection pool) instead of building one each.
+        """
+        key = ("databricks", self.config.databricks_api_key, self.config.databricks_base_url)
+        client = self._clients.get(key)
+        if client is None:
+            # In demo mode the client simply points at the placeholder endpoint
+            client = UnifyLLM(
                 provider="databricks",
                 api_key=self.config.databricks_api_key,
                 base_url=self.config.databricks_base_url
             )
+            self._clients[key] = client
+        return client
 
     async def run_workflow(self, file_path: str):
         """Run the complete analysis workflow."""
         print(f"\n🔄 Starting workflow for: {file_path}")
+        # Bound once: each is used several times below
+        agents = self.agents
+        observe = self.history.add_observation
 
-        # Step 1: Code Analysis
+        # Steps 1 and 2 are independent of each other: run them concurrently and
+        # only serialize Step 3, which consumes both results.
         print("\n📊 Step 1: Code Analysis")
-        await self.message_bus.publish(
-            "code_analyzer",
-            {"type": "analyze_request", "file": file_path}
-        )
-
-        analyzer = self.agents["code_analyzer"]
-        analysis_result = await analyzer.delegate_task(
-            target_agent_id=analyzer.agent_id,
-            capability="analyze_code",
-            input_data={"file_path": file_path, "language": "python"}
+        print("🔒 Step 2: Security Audit")
+        # Notify all three agents in one message-bus flush
+        await self.message_bus.publish_many([
+            ("code_analyzer", {"type": "analyze_request", "file": file_path}),
+            ("security_auditor", {"type": "security_check", "file": file_path}),
+            ("doc_writer", {"type": "write_request"}),
+        ])
+
+        analyzer = agents["code_analyzer"]
+        auditor = agents["security_auditor"]
+        analysis_result, security_result = await asyncio.gather(
+            analyzer.delegate_task(
+                target_agent_id=analyzer.agent_id,
+                capability="analyze_code",
+                input_data={"file_path": file_path, "language": "python"}
+            ),
+            auditor.delegate_task(
+                target_agent_id=auditor.agent_id,
+                capability="audit_security",
+                input_data={"code": "simulated code"}
+            ),
         )
 
+        # Results go into the shared history in a fixed order, whichever finished first
         if analysis_result.success:
             print(f"   ✅ Analysis complete: Quality score {analysis_result.output_data.get('quality_score')}")
-
-        # Step 2: Security Audit
-        print("\n🔒 Step 2: Security Audit")
-        await self.message_bus.publish(
-            "security_auditor",
-            {"type": "security_check", "file": file_path}
-        )
-
-        auditor = self.agents["security_auditor"]
-        security_result = await auditor.delegate_task(
-            target_agent_id=auditor.agent_id,
-            capability="audit_security",
-            input_data={"code": "simulated code"}
-        )
-
+            observe("analyze_code", analysis_result.output_data)
         if security_result.success:
             print(f"   ✅ Security audit complete: {security_result.output_data.get('severity')} severity")
+            observe("audit_security", security_result.output_data)
 
         # Step 3: Documentation
         print("\n📝 Step 3: Documentation Generation")
-        await self.message_bus.publish(
-            "doc_writer",
-            {"type": "write_request"}
-        )
-
-        writer = self.agents["doc_writer"]
-        doc_result = await writer.delegate_task(
+        writer = agents["doc_writer"]
+        # Print each report section as soon as the writer produces it
+        sections = []
+        print("\n" + "="*60)
+        async for section in writer.delegate_task_stream(
             target_agent_id=writer.agent_id,
-            capability="write_docs",
+            capability="write_docs_stream",
             input_data={
                 "analysis": analysis_result.output_data,
                 "security": security_result.output_data
             }
-        )
+        ):
+            print(section, end="", flush=True)
+            sections.append(section)
+        print("="*60)
 
-        if doc_result.success:
-            print("   ✅ Documentation generated")
-            print("\n" + "="*60)
-            print(doc_result.output_data.get('documentation', ''))
-            print("="*60)
+        documentation = {"documentation": "".join(sections)}
+        print("   ✅ Documentation generated")
+        observe("write_docs", documentation)
 
         return {
             "analysis": analysis_result.output_data,
             "security": security_result.output_data,
-            "documentation": doc_result.output_data
+            "documentation": documentation
         }
 
     async def demonstrate_collaboration(self):
@@ -429,9 +541,9 @@ Generated: {datetime.now().isoformat()}
 
         # Create collaboration with consensus strategy
         collab = AgentCollaboration(strategy=CollaborationStrategy.CONSENSUS)
-        collab.add_agent(self.agents["code_analyzer"])
-        collab.add_agent(self.agents["security_auditor"])
-        collab.add_agent(self.agents["doc_writer"])
+        agents = self.agents
+        for name in ("code_analyzer", "security_auditor", "doc_writer"):
+            collab.add_agent(agents[name])
 
         result = await collab.execute({
             "task": "decide_deployment_readiness",
@@ -446,10 +558,17 @@ Generated: {datetime.now().isoformat()}
         """Shutdown all agents and message bus."""
         print("\n🛑 Shutting down agent team...")
 
-        for name, agent in self.agents.items():
+        async def stop_agent(name: str, agent: A2AAgent):
             await agent.stop()
             print(f"   Stopped: {name}")
 
+        await asyncio.gather(*(stop_agent(name, agent) for name, agent in self.agents.items()))
+
+        # Only this team's handlers: other users of the shared bus keep theirs
+        for agent_id, handler in self._subscriptions:
+            self.message_bus.unsubscribe(agent_id, handler)
+        self._subscriptions.clear()
+
         await self.message_bus.stop()
 
 
@@ -477,6 +596,8 @@ async def main():
     stats = team.message_bus.get_stats()
     for key, value in stats.items():
         print(f"   {key}: {value}")
+    print(f"   capability_cache_hits: {team.capability_cache_stats['hits']}")
+    print(f"   capability_cache_misses: {team.capability_cache_stats['misses']}")
 
     # Shutdown
     await team.shutdown()
@@ -10,7 +10,7 @@ import os
 from unify_llm import UnifyLLM
 from unify_llm.agent import Agent, AgentConfig, AgentType
 from unify_llm.mcp import MCPClient, MCPClientConfig, StdioTransport
-from unify_llm.a2a import A2AAgent, A2AAgentConfig, AgentCapability, AgentRegistry
+from unify_llm.a2a import A2AAgent, A2AAgentConfig, A2ARequest, AgentCapability
 
 
 class MCPIntegratedAgent:
@@ -36,13 +36,30 @@ class MCPIntegratedAgent:
         self.base_agent = base_agent
         self.mcp_client = mcp_client
         self._available_tools = {}
+        # Tool discovery runs lazily, once: concurrent first callers share this task
+        self._discovery_task: asyncio.Task | None = None
 
-    async def initialize(self) -> None:
-        """Initialize and discover MCP tools."""
-        # List available tools from MCP server
+    async def _discover(self) -> None:
+        """List the MCP server's tools."""
         tools = await self.mcp_client.list_tools()
-        for tool in tools:
-            self._available_tools[tool.name] = tool
+        self._available_tools = {tool.name: tool for tool in tools}
+
+    async def _ensure_discovered(self) -> None:
+        """Run tool discovery on first use, coalescing concurrent callers into one RPC."""
+        task = self._discovery_task
+        if task is None:
+            task = self._discovery_task = asyncio.create_task(self._discover())
+        try:
+            await task
+        except Exception:
+            # Let the next caller retry instead of re-raising a stale failure forever
+            if self._discovery_task is task:
+                self._discovery_task = None
+            raise
+
+    async def initialize(self) -> None:
+        """Discover MCP tools eagerly (optional: tool calls discover on first use)."""
+        await self._ensure_discovered()
 
         print(f"✅ Discovered {len(self._available_tools)} MCP tools:")
         for name in self._available_tools:
@@ -58,12 +75,35 @@ class MCPIntegratedAgent:
         Returns:
             Tool result
         """
+        await self._ensure_discovered()
         if tool_name not in self._available_tools:
             raise ValueError(f"Tool not found: {tool_name}")
 
         result = await self.mcp_client.call_tool(tool_name, arguments)
         return result
 
+    async def call_mcp_tools(self, calls: list[tuple[str, dict]]) -> list[dict]:
+        """Call several MCP tools concurrently.
+
+        Requests are multiplexed over the one connection by JSON-RPC id, so
+        independent calls take one round-trip instead of one each.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs
+
+        Returns:
+            Tool results, in the order of ``calls``
+        """
+        await self._ensure_discovered()
+        # Check every tool name before sending anything, so a typo fails fast
+        missing = [name for name, _ in calls if name not in self._available_tools]
+        if missing:
+            raise ValueError(f"Tool not found: {', '.join(missing)}")
+
+        return list(await asyncio.gather(
+            *(self.mcp_client.call_tool(name, arguments) for name, arguments in calls)
+        ))
+
     async def execute_with_mcp(self, task: str) -> str:
         """Execute a task that may require MCP tools.
 
@@ -122,14 +162,14 @@ async def example_mcp_with_a2a():
 
     # Step 3: Create MCP-integrated agent
     mcp_agent = MCPIntegratedAgent(base_agent, mcp_client)
-    # await mcp_agent.initialize()  # Would discover MCP tools
+    # MCP tools are discovered lazily on the first call_mcp_tool(s); call
+    # `await mcp_agent.initialize()` to discover (and list) them up front instead
 
     print("✅ MCP-integrated agent created")
 
     # Step 4: Wrap with A2A capabilities
     print("\n🤝 Adding A2A capabilities...")
-    registry = AgentRegistry()
-
+    # No registry passed: the agent joins the process-wide default registry
     a2a_agent = A2AAgent(
         base_agent=base_agent,
         config=A2AAgentConfig(
@@ -143,8 +183,7 @@ async def example_mcp_with_a2a():
                     tags=["mcp", "tools"]
                 )
             ]
-        ),
-        registry=registry
+        )
     )
 
     # Register capability handler that uses MCP tools
@@ -170,16 +209,17 @@ async def example_mcp_with_a2a():
     # Simulate A2A task delegation with MCP
     print("\n   Example 2: A2A task with MCP tools")
     result = await a2a_agent.handle_request(
-        type("Request", (), {
-            "id": "test",
-            "sender_id": "user",
-            "method": "execute_task",
-            "params": {
+        A2ARequest(
+            id="test",
+            sender_id="user",
+            receiver_id=a2a_agent.agent_id,
+            method="execute_task",
+            params={
                 "task_id": "calc",
                 "capability": "execute_with_tools",
                 "input_data": {"task": "Calculate 15 * 23"}
             }
-        })()
+        )
     )
     print(f"   Result: {result}")
 
@@ -208,15 +248,16 @@ async def example_multi_mcp_servers():
     db_client = MCPClient(config2, transport2)
     api_client = MCPClient(config3, transport3)
 
-    # Initialize all
-    await fs_client.connect()
-    await db_client.connect()
-    await api_client.connect()
+    # Initialize all (concurrently)
+    await asyncio.gather(fs_client.connect(), db_client.connect(), api_client.connect())
 
-    # Agent can now use tools from all servers
-    files = await fs_client.call_tool("list_directory", {"path": "."})
-    data = await db_client.call_tool("query", {"sql": "SELECT * FROM users"})
-    result = await api_client.call_tool("http_request", {"url": "..."})
+    # Agent can now use tools from all servers; independent calls to
+    # different servers run concurrently (max of the round-trips, not the sum)
+    files, data, result = await asyncio.gather(
+        fs_client.call_tool("list_directory", {"path": "."}),
+        db_client.call_tool("query", {"sql": "SELECT * FROM users"}),
+        api_client.call_tool("http_request", {"url": "..."}),
+    )
     """)
 
 
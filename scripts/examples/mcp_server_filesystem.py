@@ -6,13 +6,290 @@ file system operations as tools.
 """
 
 import asyncio
+import fnmatch
 import os
 import json
+import re
+import stat
+import sys
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from unify_llm.mcp import MCPServer, MCPServerConfig, StdioTransport
 
 
+# Blocking file-system work for the tools below. The async handlers run these
+# with asyncio.to_thread so one slow disk call doesn't stall the stdio transport
+# or the other in-flight tool requests.
+
+
+class _StatCache:
+    """Short-lived cache of os.stat results, including misses.
+
+    MCP clients tend to call list_directory/read_file on the same paths over
+    and over; this saves the repeated metadata lookups. Entries expire quickly
+    and write_file drops the ones it may have changed.
+    """
+
+    def __init__(self, ttl: float = 1.0, negative_ttl: float = 5.0):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # absolute path -> (expiry time, stat result or None if it didn't exist)
+        self._entries: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}
+
+    def get_or_stat(self, path: str) -> Optional[os.stat_result]:
+        """Return the stat result for path, or None if it does not exist."""
+        key = os.path.abspath(path)
+        now = time.monotonic()
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        try:
+            result: Optional[os.stat_result] = os.stat(key)
+        except (FileNotFoundError, NotADirectoryError):
+            result = None
+        ttl = self.ttl if result is not None else self.negative_ttl
+        self._entries[key] = (now + ttl, result)
+        return result
+
+    def invalidate(self, path: str) -> None:
+        """Forget path and its ancestors (a write may have created any of them)."""
+        key = os.path.abspath(path)
+        while True:
+            self._entries.pop(key, None)
+            parent = os.path.dirname(key)
+            if parent == key:
+                return
+            key = parent
+
+
+_stat_cache = _StatCache()
+
+
+def _scandir(directory: str) -> Iterator[os.DirEntry]:
+    """Iterate a directory's entries, treating unreadable directories as empty."""
+    try:
+        with os.scandir(directory) as entries:
+            yield from entries
+    except OSError:
+        return
+
+
+# Matcher slot for a ".." pattern component: step to the parent, like Path.glob
+_PARENT = ".."
+
+
+def _walk_glob(
+    directory: str, matchers: List[Any], dirs_only: bool
+) -> Iterator[Tuple[str, bool]]:
+    """Yield (path, is_dir) for everything below directory matching matchers."""
+    match, rest = matchers[0], matchers[1:]
+    if match is _PARENT:
+        parent = os.path.join(directory, _PARENT)
+        if rest:
+            yield from _walk_glob(parent, rest, dirs_only)
+        else:
+            yield parent, True
+        return
+
+    if match is None:
+        if not rest:
+            # Trailing "**": this directory and everything below it. Symlinks are
+            # not followed, so a symlinked directory only counts as a directory
+            # when files are wanted too (Path.glob drops it for "**/")
+            yield directory, True
+            for entry in _scandir(directory):
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_glob(entry.path, matchers, dirs_only)
+                elif not dirs_only:
+                    yield entry.path, entry.is_dir()
+            return
+        # "**": match rest here, then recurse into every subdirectory
+        yield from _walk_glob(directory, rest, dirs_only)
+        for entry in _scandir(directory):
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_glob(entry.path, matchers, dirs_only)
+        return
+
+    for entry in _scandir(directory):
+        if match(entry.name):
+            if not rest:
+                yield entry.path, entry.is_dir()
+            elif entry.is_dir():
+                yield from _walk_glob(entry.path, rest, dirs_only)
+
+
+def _iter_glob(directory: str, pattern: str) -> Iterator[Tuple[str, bool]]:
+    """Yield (path, is_dir) for each match of a relative glob, as it is found.
+
+    Same matching rules as Path.glob: "*" also matches dot files, "**" matches
+    zero or more directories without following symlinks, ".." steps to the
+    parent (kept literally in the yielded paths) and a trailing "/" keeps only
+    directories. Walking with scandir reuses each entry's cached file type
+    instead of building a Path and stat-ing it.
+    """
+    if os.path.isabs(pattern):
+        raise ValueError(f"Non-relative patterns are unsupported: {pattern}")
+    parts = [part for part in pattern.split("/") if part not in ("", ".")]
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    matchers = [
+        None if part == "**"
+        else _PARENT if part == ".."
+        else re.compile(fnmatch.translate(part)).match
+        for part in parts
+    ]
+    dirs_only = pattern.endswith("/")
+    for path, is_dir in _walk_glob(directory, matchers, dirs_only):
+        if is_dir or not dirs_only:
+            yield path, is_dir
+
+
+def _sync_list_directory(path: str, show_hidden: bool) -> Dict[str, Any]:
+    """List directory contents."""
+    try:
+        dir_abs = os.path.abspath(path)
+        st = _stat_cache.get_or_stat(dir_abs)
+        if st is None:
+            return {"error": f"Path does not exist: {path}"}
+
+        if not stat.S_ISDIR(st.st_mode):
+            return {"error": f"Path is not a directory: {path}"}
+
+        items = []
+        # scandir entries carry the file type from the directory listing, so only
+        # regular files cost a stat() (for their size)
+        with os.scandir(dir_abs) as entries:
+            for entry in entries:
+                # Skip hidden files unless requested
+                if not show_hidden and entry.name.startswith('.'):
+                    continue
+
+                is_file = entry.is_file()
+                items.append({
+                    "name": entry.name,
+                    "type": "directory" if entry.is_dir() else "file",
+                    "size": entry.stat().st_size if is_file else None
+                })
+
+        return {
+            "path": dir_abs,
+            "items": items,
+            "count": len(items)
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _read_bytes(path: str) -> bytearray:
+    """Read a whole file into a buffer sized from fstat, in as few reads as possible."""
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(size)
+        filled = 0
+        with memoryview(buf) as view:
+            while filled < size:
+                n = f.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+        # The file may have changed size since the fstat
+        del buf[filled:]
+        while chunk := f.read(65536):
+            buf += chunk
+        return buf
+
+
+def _sync_read_file(path: str, encoding: str) -> Dict[str, Any]:
+    """Read file contents."""
+    try:
+        file_path = Path(path)
+        st = _stat_cache.get_or_stat(path)
+        if st is None:
+            return {"error": f"File does not exist: {path}"}
+
+        if not stat.S_ISREG(st.st_mode):
+            return {"error": f"Path is not a file: {path}"}
+
+        content = _read_bytes(path).decode(encoding)
+        if '\r' in content:
+            # Same universal-newline translation as read_text
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        return {
+            "path": str(file_path.absolute()),
+            "content": content,
+            "size": len(content),
+            "lines": content.count('\n') + 1
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _write_bytes(path: str, data: bytes, durable: bool) -> None:
+    """Write data to path with raw os.write calls (no buffered/text layer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with memoryview(data) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+        if durable:
+            # fdatasync where available (not on macOS/Windows), else a full fsync
+            getattr(os, "fdatasync", os.fsync)(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_write_file(
+    path: str, content: str, create_dirs: bool, durable: bool = False
+) -> Dict[str, Any]:
+    """Write file contents."""
+    try:
+        file_path = Path(path)
+
+        if create_dirs:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        _write_bytes(path, content.encode('utf-8'), durable)
+        _stat_cache.invalidate(path)
+
+        return {
+            "path": str(file_path.absolute()),
+            "size": len(content),
+            "success": True
+        }
+    except Exception as e:
+        return {"error": str(e), "success": False}
+
+
+def _sync_search_files(directory: str, pattern: str) -> Dict[str, Any]:
+    """Search for files matching pattern."""
+    try:
+        root = os.path.abspath(directory)
+        if not os.path.exists(root):
+            return {"error": f"Directory does not exist: {directory}"}
+
+        results = [
+            {
+                "path": path,
+                "name": os.path.basename(path),
+                "type": "directory" if is_dir else "file"
+            }
+            for path, is_dir in _iter_glob(root, pattern)
+        ]
+
+        return {
+            "directory": root,
+            "pattern": pattern,
+            "matches": results,
+            "count": len(results)
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
 async def main():
     """Run the file system MCP server."""
 
@@ -44,33 +321,7 @@ async def main():
     )
     async def list_directory(path: str, show_hidden: bool = False) -> Dict[str, Any]:
         """List directory contents."""
-        try:
-            dir_path = Path(path)
-            if not dir_path.exists():
-                return {"error": f"Path does not exist: {path}"}
-
-            if not dir_path.is_dir():
-                return {"error": f"Path is not a directory: {path}"}
-
-            items = []
-            for item in dir_path.iterdir():
-                # Skip hidden files unless requested
-                if not show_hidden and item.name.startswith('.'):
-                    continue
-
-                items.append({
-                    "name": item.name,
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None
-                })
-
-            return {
-                "path": str(dir_path.absolute()),
-                "items": items,
-                "count": len(items)
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        return await asyncio.to_thread(_sync_list_directory, path, show_hidden)
 
     # Tool: Read file
     @server.tool(
@@ -94,24 +345,7 @@ async def main():
     )
     async def read_file(path: str, encoding: str = "utf-8") -> Dict[str, Any]:
         """Read file contents."""
-        try:
-            file_path = Path(path)
-            if not file_path.exists():
-                return {"error": f"File does not exist: {path}"}
-
-            if not file_path.is_file():
-                return {"error": f"Path is not a file: {path}"}
-
-            content = file_path.read_text(encoding=encoding)
-
-            return {
-                "path": str(file_path.absolute()),
-                "content": content,
-                "size": len(content),
-                "lines": content.count('\n') + 1
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        return await asyncio.to_thread(_sync_read_file, path, encoding)
 
     # Tool: Write file
     @server.tool(
@@ -132,28 +366,21 @@ async def main():
                     "type": "boolean",
                     "description": "Create parent directories if needed",
                     "default": False
+                },
+                "durable": {
+                    "type": "boolean",
+                    "description": "Flush the file to disk before returning",
+                    "default": False
                 }
             },
             "required": ["path", "content"]
         }
     )
-    async def write_file(path: str, content: str, create_dirs: bool = False) -> Dict[str, Any]:
+    async def write_file(
+        path: str, content: str, create_dirs: bool = False, durable: bool = False
+    ) -> Dict[str, Any]:
         """Write file contents."""
-        try:
-            file_path = Path(path)
-
-            if create_dirs:
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            file_path.write_text(content, encoding='utf-8')
-
-            return {
-                "path": str(file_path.absolute()),
-                "size": len(content),
-                "success": True
-            }
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await asyncio.to_thread(_sync_write_file, path, content, create_dirs, durable)
 
     # Tool: Search files
     @server.tool(
@@ -176,30 +403,7 @@ async def main():
     )
     async def search_files(directory: str, pattern: str) -> Dict[str, Any]:
         """Search for files matching pattern."""
-        try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
-                return {"error": f"Directory does not exist: {directory}"}
-
-            matches = list(dir_path.glob(pattern))
-
-            results = [
-                {
-                    "path": str(m.absolute()),
-                    "name": m.name,
-                    "type": "directory" if m.is_dir() else "file"
-                }
-                for m in matches
-            ]
-
-            return {
-                "directory": str(dir_path.absolute()),
-                "pattern": pattern,
-                "matches": results,
-                "count": len(results)
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        return await asyncio.to_thread(_sync_search_files, directory, pattern)
 
     # Resource: Current working directory
     @server.resource(
@@ -254,19 +458,24 @@ async def main():
             ]
         }
 
-    print("🚀 File System MCP Server Starting...")
-    print(f"   Server: {server.config.server_name} v{server.config.server_version}")
-    print("\n📋 Available Tools:")
-    print("   - list_directory: List directory contents")
-    print("   - read_file: Read text file")
-    print("   - write_file: Write to file")
-    print("   - search_files: Search for files")
-    print("\n📦 Available Resources:")
-    print("   - file://cwd: Current working directory")
-    print("   - system://env: Environment information")
-    print("\n📝 Available Prompts:")
-    print("   - summarize_file: File summary template")
-    print("\n✅ Server ready! Listening on stdio...")
+    # Startup banner, emitted with a single write
+    banner = "\n".join([
+        "🚀 File System MCP Server Starting...",
+        f"   Server: {server.config.server_name} v{server.config.server_version}",
+        "\n📋 Available Tools:",
+        "   - list_directory: List directory contents",
+        "   - read_file: Read text file",
+        "   - write_file: Write to file",
+        "   - search_files: Search for files",
+        "\n📦 Available Resources:",
+        "   - file://cwd: Current working directory",
+        "   - system://env: Environment information",
+        "\n📝 Available Prompts:",
+        "   - summarize_file: File summary template",
+        "\n✅ Server ready! Listening on stdio...",
+    ])
+    sys.stdout.write(banner + "\n")
+    sys.stdout.flush()
 
     # Start server with stdio transport
     transport = StdioTransport()
@@ -25,10 +25,20 @@ import os
 import asyncio
 import json
 import re
+import time
 from datetime import datetime
 
 import rootutils
 
+
+def _json_string_value(raw: str) -> str:
+    """还原正则截出的 JSON 字符串体(含转义);LLM 常在字符串里直接换行,故用 strict=False"""
+    try:
+        return json.loads(f'"{raw}"', strict=False)
+    except json.JSONDecodeError:
+        return raw
+
+
 ROOT_DIR = rootutils.setup_root(os.getcwd(), indicator=".project-root", pythonpath=True)
 
 from unify_llm.client import UnifyLLM
@@ -41,11 +51,29 @@ from unify_llm.a2a.protocol import AgentCapability
 from unify_llm.a2a.agent_comm import A2AAgent, A2AAgentConfig, AgentRegistry
 from unify_llm.a2a.message_bus import MessageBus, MessageBusConfig
 
+# JSON 读写复用库里的 orjson-或-标准库 助手(unify-llm[fast] 装了 orjson 就走快路径);
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类,调用方统一捕获后者即可
+from unify_llm.adapters.base import json_loads, pretty_json
+
 
 # ============================================================================
 # 小说存储类
 # ============================================================================
 
+# _clean_content 用的模式,模块加载时编译一次。字符串体写成 (?:[^"\\]|\\.)*:
+# 每个字符只有一种匹配方式,未闭合的引号也不会触发回溯爆炸。
+_RE_JSON_FENCE = re.compile(r"```json\s*")
+_RE_FENCE = re.compile(r"```\s*")
+_RE_CONTENT = re.compile(r'"content"\s*:\s*"((?:[^"\\]|\\.)*)"')
+# LLM 输出里的 ```json 代码块(MysteryNovelWorkflow._parse_json_from_text)
+_RE_JSON_BLOCK = re.compile(r"```json\s*([\s\S]*?)\s*```")
+# 流式写作时在未写完的输出里找已闭合的章节字段,一旦 content 闭合即可开始评审
+_RE_CHAPTER_TITLE = re.compile(r'"chapter_title"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# save_to_file 的 Markdown 模板:每章一段(标题+正文),每条评审一行
+_MD_CHAPTER = "## 第{chapter_num}章 {title}\n\n{content}\n\n"
+_MD_REVIEW = "- **{reviewer}** (评分: {score}/10): {feedback}...\n"
+
 
 class NovelStorage:
     """小说内容存储"""
@@ -55,6 +83,11 @@ class NovelStorage:
         self.genre: str = "悬疑"
         self.framework: dict = {}
         self.chapters: list[dict] = []
+        # chapter_num -> 章节 dict(同号取最先添加的,与原先的顺序查找一致)
+        self._chapter_index: dict[int, dict] = {}
+        # 全部评审分数的累计和与条数,add_review 时增量维护
+        self._score_sum: float = 0
+        self._score_count: int = 0
         self.reviews: list[dict] = []
         self.created_at: datetime = datetime.now()
 
@@ -70,24 +103,30 @@ class NovelStorage:
                 "chapter_num": chapter_num,
                 "title": title,
                 "content": content,
-                "created_at": datetime.now().isoformat(),
+                "created_at": time.time(),
                 "reviews": [],
             }
         )
+        self._chapter_index.setdefault(chapter_num, self.chapters[-1])
+
+    def get_chapter(self, chapter_num: int) -> dict | None:
+        """按编号获取章节,不存在时返回 None"""
+        return self._chapter_index.get(chapter_num)
 
     def add_review(self, chapter_num: int, reviewer: str, score: int, feedback: str) -> None:
         """添加章节评论"""
-        for chapter in self.chapters:
-            if chapter["chapter_num"] == chapter_num:
-                chapter["reviews"].append(
-                    {
-                        "reviewer": reviewer,
-                        "score": score,
-                        "feedback": feedback,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
-                break
+        chapter = self._chapter_index.get(chapter_num)
+        if chapter is not None:
+            chapter["reviews"].append(
+                {
+                    "reviewer": reviewer,
+                    "score": score,
+                    "feedback": feedback,
+                    "timestamp": time.time(),
+                }
+            )
+            self._score_sum += score
+            self._score_count += 1
 
     def get_progress(self) -> dict:
         """获取写作进度"""
@@ -105,11 +144,19 @@ class NovelStorage:
 
     def _calculate_average_score(self) -> float:
         """计算平均评分"""
-        all_scores = []
-        for chapter in self.chapters:
-            for review in chapter.get("reviews", []):
-                all_scores.append(review["score"])
-        return sum(all_scores) / len(all_scores) if all_scores else 0.0
+        return self._score_sum / self._score_count if self._score_count else 0.0
+
+    @staticmethod
+    def _chapter_to_dict(chapter: dict) -> dict:
+        """章节及其评审的可序列化副本:内部存的 epoch 秒在这里才格式化为 ISO 字符串"""
+        return {
+            **chapter,
+            "created_at": datetime.fromtimestamp(chapter["created_at"]).isoformat(),
+            "reviews": [
+                {**review, "timestamp": datetime.fromtimestamp(review["timestamp"]).isoformat()}
+                for review in chapter["reviews"]
+            ],
+        }
 
     def to_dict(self) -> dict:
         """转换为字典"""
@@ -117,12 +164,16 @@ class NovelStorage:
             "title": self.title,
             "genre": self.genre,
             "framework": self.framework,
-            "chapters": self.chapters,
+            "chapters": [self._chapter_to_dict(chapter) for chapter in self.chapters],
             "progress": self.get_progress(),
         }
 
-    def save_to_file(self, output_dir: str = "output/novels") -> str:
-        """保存小说到文件"""
+    async def save_to_file(self, output_dir: str = "output/novels") -> str:
+        """保存小说到文件(阻塞的磁盘写入放到工作线程,不占用事件循环)"""
+        return await asyncio.to_thread(self._save_sync, output_dir)
+
+    def _save_sync(self, output_dir: str) -> str:
+        """同步写出 JSON 与 Markdown 两个文件,返回 Markdown 文件路径"""
         from pathlib import Path
 
         output_path = Path(output_dir)
@@ -133,48 +184,60 @@ class NovelStorage:
 
         # 保存JSON格式
         json_file = output_path / f"{safe_title}_{timestamp}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        json_file.write_bytes(pretty_json(self.to_dict()))
 
         # 保存Markdown格式
         md_file = output_path / f"{safe_title}_{timestamp}.md"
-        with open(md_file, "w", encoding="utf-8") as f:
-            f.write(f"# {self.title}\n\n")
-            f.write(f"**类型**: {self.genre}\n\n")
-            f.write(f"**故事梗概**: {self.framework.get('synopsis', '')}\n\n")
-            f.write(f"**主要人物**: {', '.join(self.framework.get('characters', []))}\n\n")
-            f.write(f"**核心悬念**: {self.framework.get('mystery_core', '')}\n\n")
-            f.write("---\n\n")
-
-            for chapter in self.chapters:
-                f.write(f"## 第{chapter['chapter_num']}章 {chapter['title']}\n\n")
-                content = self._clean_content(chapter["content"])
-                f.write(f"{content}\n\n")
-
-                if chapter.get("reviews"):
-                    f.write("### 评审意见\n\n")
-                    for review in chapter["reviews"]:
-                        f.write(
-                            f"- **{review['reviewer']}** (评分: {review['score']}/10): {review['feedback'][:200]}...\n"
-                        )
-                    f.write("\n")
-
-            f.write("---\n\n")
-            progress = self.get_progress()
-            f.write(
-                f"*完成进度: {progress['completed_chapters']}/{progress['total_chapters']} 章*\n"
+        # 先拼好各段,最后一次性写出
+        parts: list[str] = [
+            f"# {self.title}\n\n",
+            f"**类型**: {self.genre}\n\n",
+            f"**故事梗概**: {self.framework.get('synopsis', '')}\n\n",
+            f"**主要人物**: {', '.join(self.framework.get('characters', []))}\n\n",
+            f"**核心悬念**: {self.framework.get('mystery_core', '')}\n\n",
+            "---\n\n",
+        ]
+
+        for chapter in self.chapters:
+            parts.append(
+                _MD_CHAPTER.format(
+                    chapter_num=chapter["chapter_num"],
+                    title=chapter["title"],
+                    content=self._clean_content(chapter["content"]),
+                )
             )
-            f.write(f"*平均评分: {progress['average_score']:.1f}/10*\n")
+
+            if chapter.get("reviews"):
+                parts.append("### 评审意见\n\n")
+                parts.extend(
+                    _MD_REVIEW.format(
+                        reviewer=review["reviewer"],
+                        score=review["score"],
+                        feedback=review["feedback"][:200],
+                    )
+                    for review in chapter["reviews"]
+                )
+                parts.append("\n")
+
+        parts.append("---\n\n")
+        progress = self.get_progress()
+        parts.append(
+            f"*完成进度: {progress['completed_chapters']}/{progress['total_chapters']} 章*\n"
+        )
+        parts.append(f"*平均评分: {progress['average_score']:.1f}/10*\n")
+
+        with open(md_file, "w", encoding="utf-8") as f:
+            f.write("".join(parts))
 
         print(f"  小说已保存到: {md_file}")
         return str(md_file)
 
     def _clean_content(self, content: str) -> str:
         """清理内容中的JSON标记"""
-        content = re.sub(r"```json\s*", "", str(content))
-        content = re.sub(r"```\s*", "", content)
+        content = _RE_JSON_FENCE.sub("", str(content))
+        content = _RE_FENCE.sub("", content)
         if '"content"' in content:
-            match = re.search(r'"content"\s*:\s*"([^"]*(?:\\.[^"]*)*)"', content)
+            match = _RE_CONTENT.search(content)
             if match:
                 content = match.group(1).replace("\\n", "\n")
         return content
@@ -184,6 +247,10 @@ class NovelStorage:
 # Agent工具定义 (直接使用ToolRegistry，不用MCP)
 # ============================================================================
 
+# submit_framework 的列表字段:按分隔符切分并顺带去掉两侧空白
+_SPLIT_COMMA = re.compile(r"\s*,\s*")
+_SPLIT_BAR = re.compile(r"\s*\|\s*")
+
 
 def create_framework_tools(storage: NovelStorage) -> ToolRegistry:
     """为框架设计者创建工具"""
@@ -202,9 +269,9 @@ def create_framework_tools(storage: NovelStorage) -> ToolRegistry:
             "title": title,
             "total_chapters": total_chapters,
             "synopsis": synopsis,
-            "characters": [c.strip() for c in characters.split(",")],
+            "characters": _SPLIT_COMMA.split(characters.strip()),
             "mystery_core": mystery_core,
-            "chapter_outlines": [c.strip() for c in chapter_outlines.split("|")],
+            "chapter_outlines": _SPLIT_BAR.split(chapter_outlines.strip()),
         }
         storage.set_framework(framework)
         return ToolResult(
@@ -306,13 +373,13 @@ def create_critic_tools(storage: NovelStorage) -> ToolRegistry:
 
     def view_chapter(chapter_num: int) -> ToolResult:
         """查看指定章节"""
-        for chapter in storage.chapters:
-            if chapter["chapter_num"] == chapter_num:
-                return ToolResult(
-                    success=True,
-                    output=f"第{chapter_num}章《{chapter['title']}》:\n{chapter['content']}",
-                    metadata={"chapter": chapter},
-                )
+        chapter = storage.get_chapter(chapter_num)
+        if chapter is not None:
+            return ToolResult(
+                success=True,
+                output=f"第{chapter_num}章《{chapter['title']}》:\n{chapter['content']}",
+                metadata={"chapter": chapter},
+            )
         return ToolResult(success=False, output=f"未找到第{chapter_num}章", error="章节不存在")
 
     registry.register(
@@ -406,6 +473,20 @@ def create_framework_architect(
     return agent, executor
 
 
+# 章节评审细则:作为 CriticAgent system prompt 的一部分随缓存前缀复用,
+# 不在每条评审请求里重复发送
+_CHAPTER_REVIEW_RUBRIC = "\n".join(
+    [
+        "章节评审标准:",
+        "1. 文笔流畅度（2分）",
+        "2. 悬念推进（2分）",
+        "3. 人物塑造（2分）",
+        "4. 框架一致性（2分）",
+        "5. 整体吸引力（2分）",
+    ]
+)
+
+
 def create_critic_agent(client: UnifyLLM, storage: NovelStorage) -> tuple[Agent, AgentExecutor]:
     """创建评论者Agent"""
     config = AgentConfig(
@@ -440,7 +521,10 @@ def create_critic_agent(client: UnifyLLM, storage: NovelStorage) -> tuple[Agent,
   "feedback": "详细评论",
   "suggestions": ["建议1", "建议2"]
 }
-```""",
+```
+
+"""
+        + _CHAPTER_REVIEW_RUBRIC,
         temperature=0.6,
         max_iterations=3,
         tools=[],
@@ -596,6 +680,35 @@ async def setup_a2a_system(
 # ============================================================================
 
 
+# 各类请求里不随调用变化的部分。prompt 一律"固定部分在前、可变部分在后"拼接,
+# 同一 agent 的连续请求前缀逐字节一致,配合 AgentConfig.cache_system_prompt 命中提示词缓存。
+_FRAMEWORK_REVIEW_PREFIX = "\n".join(
+    [
+        "请评估以下悬疑小说框架的合理性。",
+        "",
+        "请从以下方面进行评估:",
+        "1. 悬念设计是否吸引人？",
+        "2. 人物动机是否合理？",
+        "3. 情节是否有逻辑漏洞？",
+        "4. 结构是否完整？",
+        "",
+        "给出你的评估意见和改进建议。",
+    ]
+)
+# 评分细则在 CriticAgent 的 system prompt 里(_CHAPTER_REVIEW_RUBRIC)
+_CHAPTER_REVIEW_PREFIX = "请按章节评审标准评审以下章节的质量。请按JSON格式返回评审结果。"
+_CHAPTER_WRITE_REQUIREMENTS = "\n".join(
+    [
+        "要求:",
+        "1. 按照大纲展开情节",
+        "2. 营造悬疑氛围",
+        "3. 章节内容至少300字",
+        "",
+        "请按JSON格式返回章节内容。",
+    ]
+)
+
+
 class MysteryNovelWorkflow:
     """悬疑小说多Agent协作工作流"""
 
@@ -619,6 +732,34 @@ class MysteryNovelWorkflow:
         self.writer_a2a = writer_a2a
         self.message_bus = message_bus
         self.shared_memory = SharedMemory()
+        # (框架 dict, 其规范化 JSON):框架被替换时才重新序列化
+        self._framework_json: tuple[dict, str] | None = None
+        # 串行化对 critic_executor 的章节评审调用
+        self._review_lock = asyncio.Lock()
+
+    def _get_framework_json(self) -> str:
+        """当前框架的确定性 JSON(键排序),同一框架每次得到相同文本"""
+        framework = self.storage.framework
+        if self._framework_json is None or self._framework_json[0] is not framework:
+            text = pretty_json(framework, sort_keys=True).decode()
+            self._framework_json = (framework, text)
+        return self._framework_json[1]
+
+    def _get_writer_context(self) -> str:
+        """写作请求的固定前缀:框架摘要 + 写作要求"""
+        framework = self.storage.framework
+        return "\n".join(
+            [
+                "请根据以下框架写章节。",
+                "",
+                "小说框架:",
+                f"- 标题: {framework.get('title')}",
+                f"- 核心悬念: {framework.get('mystery_core')}",
+                f"- 人物: {', '.join(framework.get('characters', []))}",
+                "",
+                _CHAPTER_WRITE_REQUIREMENTS,
+            ]
+        )
 
     async def run(self, theme: str = "密室杀人案", chapters_to_write: int = 2) -> dict:
         """运行完整的小说创作流程"""
@@ -660,7 +801,7 @@ class MysteryNovelWorkflow:
 
         # 保存小说到文件
         if self.storage.chapters:
-            self.storage.save_to_file()
+            await self.storage.save_to_file()
 
         return result
 
@@ -702,24 +843,25 @@ class MysteryNovelWorkflow:
 
     def _parse_json_from_text(self, text: str) -> dict | None:
         """从文本中解析JSON"""
-        # 尝试找到JSON块
-        json_match = re.search(r"```json\s*([\s\S]*?)\s*```", text)
+        # 尝试找到JSON块(没有代码围栏时跳过正则扫描)
+        json_match = _RE_JSON_BLOCK.search(text) if "```" in text else None
         if json_match:
             try:
-                return json.loads(json_match.group(1))
+                return json_loads(json_match.group(1))
             except json.JSONDecodeError:
                 pass
 
-        # 尝试直接解析
+        # 尝试直接解析:第一个 "{" 到其后最后一个 "}"
+        start = text.find("{")
+        if start == -1:
+            return None
+        end = text.rfind("}", start)
+        if end == -1:
+            return None
         try:
-            start = text.find("{")
-            end = text.rfind("}")
-            if start != -1 and end != -1:
-                return json.loads(text[start : end + 1])
+            return json_loads(text[start : end + 1])
         except json.JSONDecodeError:
-            pass
-
-        return None
+            return None
 
     def _set_default_framework(self, theme: str) -> None:
         """设置默认框架"""
@@ -737,27 +879,16 @@ class MysteryNovelWorkflow:
         """框架讨论阶段 - 使用A2A协作"""
         print("  CriticAgent 正在评估框架...")
 
-        # 通过A2A消息总线发送评估请求
+        # 通过A2A消息总线通知评估请求:评论者与本流程同进程,直接交给其本地处理器,不走队列
         if self.framework_a2a and self.critic_a2a:
-            await self.message_bus.publish(
+            await self.message_bus.publish_local(
                 target_id=self.critic_a2a.agent_id,
                 message={"type": "evaluate_framework_request", "framework": framework},
                 sender_id=self.framework_a2a.agent_id,
             )
 
         # 评论者评估框架
-        critic_prompt = f"""请评估以下悬疑小说框架的合理性:
-
-框架内容:
-{framework}
-
-请从以下方面进行评估:
-1. 悬念设计是否吸引人？
-2. 人物动机是否合理？
-3. 情节是否有逻辑漏洞？
-4. 结构是否完整？
-
-给出你的评估意见和改进建议。"""
+        critic_prompt = f"{_FRAMEWORK_REVIEW_PREFIX}\n\n框架内容:\n{self._get_framework_json()}"
 
         critic_result = await self.critic_executor.arun(critic_prompt)
 
@@ -780,84 +911,124 @@ class MysteryNovelWorkflow:
         return self.storage.framework
 
     async def _write_and_review_chapters(self, num_chapters: int) -> list:
-        """章节写作和评审阶段"""
-        chapters = []
-        outlines = self.storage.framework.get("chapter_outlines", [])
-
-        for i in range(1, min(num_chapters + 1, len(outlines) + 1)):
-            print(f"\n  写作第{i}章...")
+        """章节写作和评审阶段
 
-            outline = outlines[i - 1] if i <= len(outlines) else f"第{i}章"
+        写第 i+1 章只依赖框架,与评审第 i 章互不相关,两者流水线并行;
+        写作者的输出是流式的,第 i 章的 content 字段一闭合就开始评审,不等整段回复结束。
+        写作之间、评审之间各自按章节顺序串行(同一 agent 的对话记忆不能交错)。
+        """
+        outlines = self.storage.framework.get("chapter_outlines", [])
+        writer_context = self._get_writer_context()
+        total = min(num_chapters, len(outlines))
+        written: list[tuple[int, str, str]] = []
+
+        if total:
+            loop = asyncio.get_running_loop()
+            async with asyncio.TaskGroup() as tg:
+                # 每章一个 ready future:章节正文可用时置为 (标题, 正文),写作失败置为 None
+                readies: list[asyncio.Future] = []
+                previous: asyncio.Task | None = None
+                for i in range(1, total + 1):
+                    ready = loop.create_future()
+                    previous = tg.create_task(
+                        self._write_chapter(i, outlines[i - 1], writer_context, ready, previous)
+                    )
+                    readies.append(ready)
+
+                for i, ready in enumerate(readies, 1):
+                    chapter = await ready
+                    if chapter is None:
+                        continue
+
+                    title, content = chapter
+                    self.storage.add_chapter(i, title, content)
+                    print(f"  第{i}章《{title}》写作完成")
+                    written.append((i, title, content))
+
+                    # 评审章节(在后台进行,同时写下一章)
+                    print(f"  评审第{i}章...")
+                    tg.create_task(self._review_chapter_in_order(i, title, content))
 
-            # 写作者写章节
-            write_prompt = f"""请根据以下框架写第{i}章。
+        chapters = []
+        for i, title, content in written:
+            # 从存储中获取评分
+            reviews = self.storage.get_chapter(i)["reviews"]
+            chapters.append(
+                {
+                    "chapter_num": i,
+                    "title": title,
+                    # 正文已在 storage 里,这里只记预览的截止位置,展示时再切片
+                    "content_preview_end": min(len(content), 500),
+                    "score": reviews[-1].get("score") if reviews else None,
+                }
+            )
 
-小说框架:
-- 标题: {self.storage.framework.get('title')}
-- 核心悬念: {self.storage.framework.get('mystery_core')}
-- 人物: {', '.join(self.storage.framework.get('characters', []))}
+        return chapters
 
-本章大纲: {outline}
+    async def _write_chapter(
+        self,
+        chapter_num: int,
+        outline: str,
+        writer_context: str,
+        ready: asyncio.Future,
+        previous: asyncio.Task | None,
+    ) -> None:
+        """写作者流式写一章,把 (标题, 正文) 尽早放进 ready;写作失败时放 None
+
+        先等上一章写完再开始。输出边到边检查:content 字符串一闭合就交出结果,
+        剩余输出照常读完(写作者的对话记忆需要完整回复)。
+        """
+        if previous is not None:
+            await previous
+        print(f"\n  写作第{chapter_num}章...")
+        write_prompt = f"{writer_context}\n\n现在写第{chapter_num}章。\n本章大纲: {outline}"
 
-要求:
-1. 按照大纲展开情节
-2. 营造悬疑氛围
-3. 章节内容至少300字
-
-请按JSON格式返回章节内容。"""
-
-            write_result = await self.writer_executor.arun(write_prompt)
-
-            if write_result.success and write_result.output:
-                chapter_data = self._parse_json_from_text(write_result.output)
-                if chapter_data:
-                    title = chapter_data.get("chapter_title", f"第{i}章")
-                    content = chapter_data.get("content", write_result.output)
-                else:
-                    title = f"第{i}章"
-                    content = self.storage._clean_content(write_result.output)
-
-                self.storage.add_chapter(i, title, content)
-                print(f"  第{i}章《{title}》写作完成")
-
-                # 评审章节
-                print(f"  评审第{i}章...")
-                await self._review_chapter(i, title, content)
-
-                # 从存储中获取评分
-                score = None
-                for ch in self.storage.chapters:
-                    if ch["chapter_num"] == i and ch.get("reviews"):
-                        score = ch["reviews"][-1].get("score")
-                        break
-
-                chapters.append(
-                    {
-                        "chapter_num": i,
-                        "title": title,
-                        "content": content[:500] + "..." if len(content) > 500 else content,
-                        "score": score,
-                    }
-                )
+        output = ""
+        try:
+            async for delta in self.writer_executor.astream(write_prompt):
+                output += delta
+                # content 只会在收到引号时闭合,其余增量不必重新扫描
+                if ready.done() or '"' not in delta:
+                    continue
+                content_match = _RE_CONTENT.search(output)
+                if content_match:
+                    title_match = _RE_CHAPTER_TITLE.search(output)
+                    title = (
+                        _json_string_value(title_match.group(1))
+                        if title_match
+                        else f"第{chapter_num}章"
+                    )
+                    ready.set_result((title, _json_string_value(content_match.group(1))))
+        except Exception as e:
+            print(f"  第{chapter_num}章写作失败: {e}")
+            if not ready.done():
+                ready.set_result(None)
+            return
+
+        if ready.done():
+            return
+        if not output:
+            ready.set_result(None)
+            return
+        chapter_data = self._parse_json_from_text(output)
+        if chapter_data:
+            title = chapter_data.get("chapter_title", f"第{chapter_num}章")
+            content = chapter_data.get("content", output)
+        else:
+            title = f"第{chapter_num}章"
+            content = self.storage._clean_content(output)
+        ready.set_result((title, content))
 
-        return chapters
+    async def _review_chapter_in_order(self, chapter_num: int, title: str, content: str) -> None:
+        """排队评审:asyncio.Lock 先到先得,评审按章节顺序逐个进行"""
+        async with self._review_lock:
+            await self._review_chapter(chapter_num, title, content)
 
     async def _review_chapter(self, chapter_num: int, title: str, content: str) -> None:
         """评审单个章节"""
-        review_prompt = f"""请评审以下章节的质量。
-
-章节标题: {title}
-章节内容:
-{content[:1000]}...
-
-评审标准:
-1. 文笔流畅度（2分）
-2. 悬念推进（2分）
-3. 人物塑造（2分）
-4. 框架一致性（2分）
-5. 整体吸引力（2分）
-
-请按JSON格式返回评审结果。"""
+        review_prompt = (
+            f"{_CHAPTER_REVIEW_PREFIX}\n\n章节标题: {title}\n章节内容:\n{content[:1000]}..."
+        )
 
         critic_result = await self.critic_executor.arun(review_prompt)
 
@@ -954,7 +1125,8 @@ async def main():
             for chapter in result["chapters"]:
                 print(f"\n【第{chapter['chapter_num']}章 - {chapter.get('title', '未知')}】")
                 print(f"评分: {chapter.get('score', 'N/A')}/10")
-                content = storage._clean_content(chapter.get("content", ""))
+                full_content = storage.get_chapter(chapter["chapter_num"])["content"]
+                content = storage._clean_content(full_content[: chapter["content_preview_end"]])
                 print(f"内容预览:\n{content[:300]}...")
 
     finally:
@@ -18,13 +18,27 @@ from unify_llm.a2a import (
     A2AAgent,
     A2AAgentConfig,
     AgentCapability,
-    AgentRegistry,
     AgentDiscovery,
     AgentCollaboration,
     CollaborationStrategy,
+    get_default_registry,
 )
 
 
+# One client per Databricks endpoint, shared by every agent in every example,
+# so agents reuse a single HTTP connection pool instead of opening their own
+_clients: dict[tuple[str, str], UnifyLLM] = {}
+
+
+def _get_client(api_key: str, base_url: str) -> UnifyLLM:
+    """Return the shared Databricks client for these credentials."""
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = UnifyLLM(provider="databricks", api_key=api_key, base_url=base_url)
+    return client
+
+
 async def example_mcp_server():
     """Example 1: Create an MCP server that exposes agent tools"""
     print("\n" + "=" * 60)
@@ -106,12 +120,12 @@ async def example_a2a_agents():
         print("⚠️  Set DATABRICKS_API_KEY and DATABRICKS_BASE_URL to run this example")
         return
 
-    # Create shared registry
-    registry = AgentRegistry()
+    # Shared, process-wide registry
+    registry = get_default_registry()
 
     # Create first agent: Math Expert
     print("\n📦 Creating Math Expert agent...")
-    client1 = UnifyLLM(provider="databricks", api_key=api_key, base_url=base_url)
+    client1 = _get_client(api_key, base_url)
     base_agent1 = Agent(
         config=AgentConfig(
             name="math_expert",
@@ -160,7 +174,7 @@ async def example_a2a_agents():
 
     # Create second agent: Data Analyst
     print("\n📦 Creating Data Analyst agent...")
-    client2 = UnifyLLM(provider="databricks", api_key=api_key, base_url=base_url)
+    client2 = _get_client(api_key, base_url)
     base_agent2 = Agent(
         config=AgentConfig(
             name="data_analyst",
@@ -235,14 +249,14 @@ async def example_collaboration():
         print("⚠️  Set DATABRICKS_API_KEY and DATABRICKS_BASE_URL to run this example")
         return
 
-    # Create registry
-    registry = AgentRegistry()
+    # Shared, process-wide registry
+    registry = get_default_registry()
 
     # Create three agents for collaboration
     print("\n📦 Creating collaboration team...")
     agents = []
     for i, name in enumerate(["researcher", "analyst", "writer"]):
-        client = UnifyLLM(provider="databricks", api_key=api_key, base_url=base_url)
+        client = _get_client(api_key, base_url)
         base_agent = Agent(
             config=AgentConfig(
                 name=name,
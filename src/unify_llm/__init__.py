@@ -25,6 +25,10 @@ __version__ = "0.1.1"
 # 核心符号 → (模块, 属性):首次访问时才导入,bare `import unify_llm` 保持轻量。
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "UnifyLLM": ("unify_llm.client", "UnifyLLM"),
+    "UnifyRouter": ("unify_llm.router", "UnifyRouter"),
+    "RouterDeployment": ("unify_llm.router", "RouterDeployment"),
+    "ClientRateLimiter": ("unify_llm.limiter", "ClientRateLimiter"),
+    "ResponseCache": ("unify_llm.cache", "ResponseCache"),
     "Message": ("unify_llm.models", "Message"),
     "ChatRequest": ("unify_llm.models", "ChatRequest"),
     "ChatResponse": ("unify_llm.models", "ChatResponse"),
@@ -47,6 +51,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "estimate_tokens": ("unify_llm.utils", "estimate_tokens"),
     "truncate_messages": ("unify_llm.utils", "truncate_messages"),
     "format_provider_error": ("unify_llm.utils", "format_provider_error"),
+    "ChunkAggregator": ("unify_llm.utils", "ChunkAggregator"),
 }
 
 __all__ = ["__version__", *_LAZY_EXPORTS]
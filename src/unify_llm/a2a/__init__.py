@@ -13,6 +13,8 @@ from unify_llm.a2a.agent_comm import (
     A2AAgentConfig,
     AgentDiscovery,
     AgentRegistry,
+    ConversationHistory,
+    get_default_registry,
 )
 from unify_llm.a2a.collaboration import (
     AgentCollaboration,
@@ -24,6 +26,7 @@ from unify_llm.a2a.message_bus import (
     DistributedMessageBus,
     MessageBus,
     MessageBusConfig,
+    get_default_bus,
 )
 from unify_llm.a2a.protocol import (
     A2AMessage,
@@ -49,6 +52,8 @@ __all__ = [
     "A2AAgentConfig",
     "AgentRegistry",
     "AgentDiscovery",
+    "ConversationHistory",
+    "get_default_registry",
     # Collaboration
     "AgentCollaboration",
     "CollaborationStrategy",
@@ -58,4 +63,5 @@ __all__ = [
     "MessageBus",
     "MessageBusConfig",
     "DistributedMessageBus",
+    "get_default_bus",
 ]
@@ -4,7 +4,11 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import uuid
+import weakref
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 
@@ -19,6 +23,7 @@ from unify_llm.a2a.protocol import (
     TaskRequest,
     TaskResponse,
 )
+from unify_llm.adapters.base import canonical_json
 
 
 class A2AAgentConfig(BaseModel):
@@ -31,12 +36,38 @@ class A2AAgentConfig(BaseModel):
 
 
 class AgentRegistry:
-    """Registry for tracking available agents."""
+    """Registry for tracking available agents.
+
+    Besides the ``agent_id`` map, agents are indexed by capability name so that
+    capability lookups touch only the matching agents instead of scanning all.
+    Lookups return agents in registration order; re-registering an agent keeps
+    its original position.
+    """
 
     def __init__(self):
         self._agents: dict[str, AgentInfo] = {}
+        # capability name -> {agent_id: info}
+        self._by_capability: dict[str, dict[str, AgentInfo]] = defaultdict(dict)
+        # agent_id -> position of its first registration, to order index lookups
+        self._position: dict[str, int] = {}
+        self._positions = itertools.count()
         self._lock = asyncio.Lock()
 
+    def _in_registration_order(self, agents: Iterable[AgentInfo]) -> list[AgentInfo]:
+        return sorted(agents, key=lambda agent: self._position[agent.agent_id])
+
+    def _index(self, agent_info: AgentInfo) -> None:
+        for cap in agent_info.capabilities:
+            self._by_capability[cap.name][agent_info.agent_id] = agent_info
+
+    def _unindex(self, agent_info: AgentInfo) -> None:
+        for cap in agent_info.capabilities:
+            bucket = self._by_capability.get(cap.name)
+            if bucket is not None:
+                bucket.pop(agent_info.agent_id, None)
+                if not bucket:
+                    del self._by_capability[cap.name]
+
     async def register(self, agent_info: AgentInfo) -> None:
         """Register an agent.
 
@@ -44,7 +75,13 @@ class AgentRegistry:
             agent_info: Agent information
         """
         async with self._lock:
+            previous = self._agents.get(agent_info.agent_id)
+            if previous is not None:
+                self._unindex(previous)
+            else:
+                self._position[agent_info.agent_id] = next(self._positions)
             self._agents[agent_info.agent_id] = agent_info
+            self._index(agent_info)
 
     async def unregister(self, agent_id: str) -> None:
         """Unregister an agent.
@@ -53,7 +90,10 @@ class AgentRegistry:
             agent_id: Agent ID
         """
         async with self._lock:
-            self._agents.pop(agent_id, None)
+            agent_info = self._agents.pop(agent_id, None)
+            if agent_info is not None:
+                self._unindex(agent_info)
+                del self._position[agent_id]
 
     async def update_status(self, agent_id: str, status: AgentStatus) -> None:
         """Update agent status.
@@ -79,6 +119,18 @@ class AgentRegistry:
         async with self._lock:
             return self._agents.get(agent_id)
 
+    def find_by_capability(self, capability: str) -> list[AgentInfo]:
+        """Get the agents offering a capability (an index lookup, no scan).
+
+        Args:
+            capability: Capability name
+
+        Returns:
+            Matching agents, in registration order
+        """
+        bucket = self._by_capability.get(capability)
+        return self._in_registration_order(bucket.values()) if bucket else []
+
     async def find_agents(
         self,
         capabilities: list[str] | None = None,
@@ -87,21 +139,21 @@ class AgentRegistry:
         """Find agents matching criteria.
 
         Args:
-            capabilities: Required capabilities
+            capabilities: Capabilities to look for (an agent matches if it has any)
             status: Required status
 
         Returns:
-            List of matching agents
+            Matching agents, in registration order
         """
         async with self._lock:
-            agents = list(self._agents.values())
-
-        # Filter by capabilities
-        if capabilities:
-            agents = [
-                agent for agent in agents
-                if any(cap.name in capabilities for cap in agent.capabilities)
-            ]
+            if capabilities:
+                # Union of the capability buckets (an agent may appear in several)
+                matches: dict[str, AgentInfo] = {}
+                for capability in capabilities:
+                    matches.update(self._by_capability.get(capability, {}))
+                agents = self._in_registration_order(matches.values())
+            else:
+                agents = list(self._agents.values())
 
         # Filter by status
         if status:
@@ -122,7 +174,37 @@ class AgentRegistry:
                 if now - agent.last_seen > max_age
             ]
             for agent_id in stale_ids:
-                self._agents.pop(agent_id)
+                self._unindex(self._agents.pop(agent_id))
+                del self._position[agent_id]
+
+
+# One default registry per event loop: a registry's asyncio.Lock binds to the
+# loop that first waits on it, so an instance cannot be shared across loops
+_default_registries: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AgentRegistry] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_default_registry() -> AgentRegistry:
+    """Get the running event loop's shared agent registry, creating it on first use.
+
+    Agents built without an explicit registry in the same event loop share this
+    one, so they can discover each other across modules. Each loop gets its own
+    registry, so nothing carries over between ``asyncio.run`` calls. Outside a
+    running loop there is nothing to share and a new private registry is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AgentRegistry()
+    # The registry's lock references its loop, so entries of closed loops are
+    # dropped here rather than by the weak reference
+    for closed in [other for other in _default_registries if other.is_closed()]:
+        del _default_registries[closed]
+    registry = _default_registries.get(loop)
+    if registry is None:
+        registry = _default_registries[loop] = AgentRegistry()
+    return registry
 
 
 class AgentDiscovery:
@@ -172,12 +254,94 @@ class AgentDiscovery:
         return agents[0]
 
 
+class ConversationHistory:
+    """Append-only conversation shared by agents working on one workflow.
+
+    Provider prompt caches match on a byte-identical prefix, so instead of
+    rebuilding each agent's prompt from scratch, new observations are appended
+    as fresh ``user`` messages and earlier entries are never mutated. Once the
+    history exceeds ``reset_cache_after_n_turns`` appended turns it is cut back
+    to the system prompt, so the growing tail doesn't outweigh the cache savings.
+
+    Example:
+        ```python
+        history = ConversationHistory(system_prompt="You are a code reviewer.")
+        history.add_observation("analyze_code", {"quality_score": 8.5})
+
+        # Agents built with the history send it as their prompt prefix
+        reviewer = A2AAgent(base_agent, config, history=history)
+        summary = await reviewer.ask("Summarize.")
+        ```
+    """
+
+    def __init__(
+        self,
+        system_prompt: str | None = None,
+        reset_cache_after_n_turns: int = 20
+    ):
+        """Initialize conversation history.
+
+        Args:
+            system_prompt: Static system prompt that starts every prompt
+            reset_cache_after_n_turns: Appended turns after which history is reset
+        """
+        self.reset_cache_after_n_turns = reset_cache_after_n_turns
+        self._prefix: list[dict[str, str]] = (
+            [{"role": "system", "content": system_prompt}] if system_prompt else []
+        )
+        self._messages: list[dict[str, str]] = list(self._prefix)
+
+    @property
+    def messages(self) -> list[dict[str, str]]:
+        """Messages so far (a new list; the entries themselves are never mutated)."""
+        return list(self._messages)
+
+    @property
+    def turns(self) -> int:
+        """Number of messages appended since the last reset."""
+        return len(self._messages) - len(self._prefix)
+
+    def append(self, role: str, content: str) -> None:
+        """Append a message, resetting first if the turn limit has been reached.
+
+        Args:
+            role: Message role
+            content: Message content
+        """
+        if self.turns >= self.reset_cache_after_n_turns:
+            self.reset()
+        self._messages.append({"role": role, "content": content})
+
+    def add_observation(self, source: str, data: Any) -> None:
+        """Append a task result as a new ``user`` message.
+
+        The payload is serialized with sorted keys so that equal results always
+        produce the same bytes.
+
+        Args:
+            source: Capability or agent that produced the result
+            data: JSON-serializable result
+        """
+        payload = canonical_json(data).decode()
+        self.append("user", f"[{source}] {payload}")
+
+    def reset(self) -> None:
+        """Drop every appended message, keeping only the system prompt."""
+        self._messages = list(self._prefix)
+
+
 class A2AAgent:
     """Agent capable of A2A communication.
 
     This class wraps a standard UnifyLLM agent with A2A capabilities,
     allowing it to communicate and collaborate with other agents.
 
+    Without an explicit ``registry`` the agent registers with
+    ``get_default_registry()``, shared by every such agent created in the same
+    event loop, so they can discover each other (earlier versions gave each
+    agent a private registry). Pass ``registry=AgentRegistry()`` to keep an
+    agent isolated.
+
     Example:
         ```python
         from unify_llm import UnifyLLM
@@ -218,23 +382,28 @@ class A2AAgent:
         self,
         base_agent: Any,
         config: A2AAgentConfig,
-        registry: AgentRegistry | None = None
+        registry: AgentRegistry | None = None,
+        history: ConversationHistory | None = None
     ):
         """Initialize A2A agent.
 
         Args:
             base_agent: Underlying agent implementation
             config: A2A configuration
-            registry: Shared agent registry
+            registry: Shared agent registry (defaults to the running loop's
+                get_default_registry(), not a new private one)
+            history: Shared conversation history used as the prompt prefix by ``ask``
         """
         self.base_agent = base_agent
         self.config = config
         self.agent_id = config.agent_id or str(uuid.uuid4())
-        self.registry = registry or AgentRegistry()
+        self.registry = registry or get_default_registry()
+        self.history = history
         self.discovery = AgentDiscovery(self.registry)
 
         self._message_handlers: dict[str, Callable] = {}
         self._capability_handlers: dict[str, Callable] = {}
+        self._stream_handlers: dict[str, Callable[..., AsyncIterator[Any]]] = {}
         self._running = False
         self._heartbeat_task: asyncio.Task | None = None
 
@@ -257,6 +426,28 @@ class A2AAgent:
             return func
         return decorator
 
+    def handle_stream_capability(self, capability_name: str):
+        """Decorator to register a streaming capability handler.
+
+        The handler is an async generator whose items are passed to the caller
+        of ``delegate_task_stream`` as soon as they are produced.
+
+        Args:
+            capability_name: Name of the capability
+
+        Example:
+            ```python
+            @a2a_agent.handle_stream_capability("write_report")
+            async def handle_report(input_data: Dict):
+                yield "# Report\n"
+                yield "..."
+            ```
+        """
+        def decorator(func: Callable[..., AsyncIterator[Any]]):
+            self._stream_handlers[capability_name] = func
+            return func
+        return decorator
+
     async def start(self) -> None:
         """Start the A2A agent."""
         # Register with registry
@@ -334,6 +525,76 @@ class A2AAgent:
 
         return TaskResponse(**response.result)
 
+    async def delegate_task_stream(
+        self,
+        target_agent_id: str,
+        capability: str,
+        input_data: dict[str, Any]
+    ) -> AsyncIterator[Any]:
+        """Delegate a streaming task and yield its output as it is produced.
+
+        Args:
+            target_agent_id: ID of target agent
+            capability: Required streaming capability
+            input_data: Task input data
+
+        Yields:
+            Output chunks from the capability handler
+
+        Raises:
+            LookupError: If the target agent or streaming capability is unknown
+        """
+        if not await self.registry.get_agent(target_agent_id):
+            raise LookupError(f"Agent not found: {target_agent_id}")
+        handler = self._stream_handlers.get(capability)
+        if handler is None:
+            raise LookupError(f"Capability not found: {capability}")
+
+        # As in delegate_task, local agents in the same registry are served directly
+        await self.registry.update_status(self.agent_id, AgentStatus.BUSY)
+        try:
+            async for chunk in handler(input_data):
+                yield chunk
+        finally:
+            await self.registry.update_status(self.agent_id, AgentStatus.IDLE)
+
+    async def ask(self, prompt: str, **kwargs: Any) -> str:
+        """Ask the base agent's model, continuing the shared conversation history.
+
+        The request is the base agent's system message (unless the history
+        starts with its own), then the history's messages unchanged, then
+        ``prompt``. The prefix is therefore byte-identical to the previous
+        call's and can be served from the provider's prompt cache. The prompt
+        and the reply are appended to the history afterwards.
+
+        Args:
+            prompt: New user message
+            **kwargs: Additional parameters for the LLM call
+
+        Returns:
+            The model's reply
+        """
+        agent_config = self.base_agent.config
+        messages = self.history.messages if self.history is not None else []
+        if not messages or messages[0]["role"] != "system":
+            messages.insert(0, self.base_agent.get_system_message())
+        messages.append({"role": "user", "content": prompt})
+
+        response = await self.base_agent.client.achat(
+            model=agent_config.model,
+            messages=messages,
+            temperature=agent_config.temperature,
+            max_tokens=agent_config.max_tokens,
+            prompt_caching=agent_config.cache_system_prompt,
+            **kwargs
+        )
+        reply = response.content or ""
+
+        if self.history is not None:
+            self.history.append("user", prompt)
+            self.history.append("assistant", reply)
+        return reply
+
     async def discover_agents(
         self,
         capabilities: list[str] | None = None
@@ -123,6 +123,30 @@ class ConsensusBuilder:
         """
         self.agents = agents
 
+    async def _collect_vote(
+        self,
+        agent: A2AAgent,
+        task: str,
+        input_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Ask one agent for its vote on the task.
+
+        Args:
+            agent: Voting agent
+            task: Task description
+            input_data: Task input
+
+        Returns:
+            The agent's vote and confidence
+        """
+        # Each agent processes the task
+        # (simplified - would use actual task execution)
+        return {
+            "agent_id": agent.agent_id,
+            "vote": "approve",  # Placeholder
+            "confidence": 0.8
+        }
+
     async def reach_consensus(
         self,
         task: str,
@@ -139,17 +163,11 @@ class ConsensusBuilder:
         Returns:
             Consensus result
         """
-        # Collect responses from all agents
-        responses = []
-        for agent in self.agents:
-            # Each agent processes the task
-            # (simplified - would use actual task execution)
-            response = {
-                "agent_id": agent.agent_id,
-                "vote": "approve",  # Placeholder
-                "confidence": 0.8
-            }
-            responses.append(response)
+        # Votes are independent of each other: collect them from all agents
+        # concurrently, then tally in-process
+        responses = list(await asyncio.gather(
+            *(self._collect_vote(agent, task, input_data) for agent in self.agents)
+        ))
 
         # Apply voting method
         if voting_method == "majority":
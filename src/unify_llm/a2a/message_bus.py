@@ -9,13 +9,23 @@ enabling distributed agents to communicate across processes or networks.
 from __future__ import annotations
 
 import asyncio
+import weakref
+from array import array
 from collections import defaultdict
 from datetime import datetime
+from enum import IntEnum
 from typing import Any, Callable, Dict, List, Optional, Set
 
 from pydantic import BaseModel
 
 
+class _Metric(IntEnum):
+    """Slots of ``MessageBus._counters`` (names are the ``get_stats`` keys)."""
+    MESSAGES_SENT = 0
+    MESSAGES_RECEIVED = 1
+    ERRORS = 2
+
+
 class MessageBusConfig(BaseModel):
     """Configuration for message bus."""
     name: str = "default"
@@ -60,11 +70,9 @@ class MessageBus:
         self._queues: dict[str, asyncio.Queue] = {}
         self._pending_responses: dict[str, asyncio.Future] = {}
         self._running = False
-        self._stats = {
-            "messages_sent": 0,
-            "messages_received": 0,
-            "errors": 0
-        }
+        # Fixed counter slots indexed by _Metric: a hot-path increment is an
+        # array store, and the stats dict is only built by get_stats()
+        self._counters = array("Q", [0] * len(_Metric))
 
     async def start(self) -> None:
         """Start the message bus."""
@@ -85,7 +93,7 @@ class MessageBus:
 
         if self.config.enable_logging:
             print(f"🛑 Message bus '{self.config.name}' stopped")
-            print(f"   Stats: {self._stats}")
+            print(f"   Stats: {self._counter_stats()}")
 
     def subscribe(self, agent_id: str, handler: Callable) -> None:
         """Subscribe to messages for an agent.
@@ -117,6 +125,32 @@ class MessageBus:
             self._subscribers.pop(agent_id, None)
             self._queues.pop(agent_id, None)
 
+    def _envelope(
+        self,
+        target_id: str,
+        message: dict[str, Any],
+        sender_id: str | None,
+        timestamp: str | None = None
+    ) -> dict[str, Any]:
+        """Copy a message and add the bus metadata fields.
+
+        Args:
+            target_id: Target agent ID
+            message: Message to send
+            sender_id: Sender agent ID
+            timestamp: ISO timestamp to stamp (now if None)
+
+        Returns:
+            The message with ``_target``, ``_sender``, ``_timestamp`` and ``_bus`` set
+        """
+        return {
+            **message,
+            "_target": target_id,
+            "_sender": sender_id,
+            "_timestamp": timestamp or datetime.now().isoformat(),
+            "_bus": self.config.name
+        }
+
     async def publish(
         self,
         target_id: str,
@@ -133,20 +167,13 @@ class MessageBus:
         if not self._running:
             raise RuntimeError("Message bus is not running")
 
-        # Add metadata
-        full_message = {
-            **message,
-            "_target": target_id,
-            "_sender": sender_id,
-            "_timestamp": datetime.now().isoformat(),
-            "_bus": self.config.name
-        }
+        full_message = self._envelope(target_id, message, sender_id)
 
         # Add to queue
         if target_id in self._queues:
             try:
                 await self._queues[target_id].put(full_message)
-                self._stats["messages_sent"] += 1
+                self._counters[_Metric.MESSAGES_SENT] += 1
 
                 # Notify subscribers
                 if target_id in self._subscribers:
@@ -154,18 +181,108 @@ class MessageBus:
                         try:
                             await handler(full_message)
                         except Exception as e:
-                            self._stats["errors"] += 1
+                            self._counters[_Metric.ERRORS] += 1
                             if self.config.enable_logging:
                                 print(f"❌ Handler error: {e}")
             except asyncio.QueueFull:
-                self._stats["errors"] += 1
+                self._counters[_Metric.ERRORS] += 1
                 if self.config.enable_logging:
                     print(f"⚠️  Queue full for agent: {target_id}")
         else:
-            self._stats["errors"] += 1
+            self._counters[_Metric.ERRORS] += 1
             if self.config.enable_logging:
                 print(f"⚠️  No queue for agent: {target_id}")
 
+    async def publish_local(
+        self,
+        target_id: str,
+        message: dict[str, Any],
+        sender_id: str | None = None
+    ) -> bool:
+        """Deliver a message straight to the target's in-process handlers.
+
+        The target's queue is skipped: each subscribed handler is awaited
+        directly, so a co-resident agent gets the message without an
+        enqueue/dequeue round-trip. Nothing is sent when the target has no
+        handler on this bus; use ``publish`` to queue it for polling consumers.
+
+        Args:
+            target_id: Target agent ID
+            message: Message to send
+            sender_id: Sender agent ID
+
+        Returns:
+            True if the message was handed to at least one local handler
+        """
+        if not self._running:
+            raise RuntimeError("Message bus is not running")
+
+        handlers = self._subscribers.get(target_id)
+        if not handlers:
+            return False
+
+        full_message = self._envelope(target_id, message, sender_id)
+        self._counters[_Metric.MESSAGES_SENT] += 1
+
+        for handler in handlers:
+            try:
+                await handler(full_message)
+            except Exception as e:
+                self._counters[_Metric.ERRORS] += 1
+                if self.config.enable_logging:
+                    print(f"❌ Handler error: {e}")
+        return True
+
+    async def publish_many(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        sender_id: str | None = None
+    ) -> None:
+        """Publish a batch of messages in one flush.
+
+        All messages are enqueued first (sharing one timestamp), then every
+        subscriber handler is notified in a single ``asyncio.gather``, instead of
+        one enqueue/notify round-trip per message as with repeated ``publish``.
+
+        Args:
+            items: ``(target_id, message)`` pairs to send
+            sender_id: Sender agent ID
+        """
+        if not self._running:
+            raise RuntimeError("Message bus is not running")
+
+        timestamp = datetime.now().isoformat()
+        notifications = []
+
+        for target_id, message in items:
+            queue = self._queues.get(target_id)
+            if queue is None:
+                self._counters[_Metric.ERRORS] += 1
+                if self.config.enable_logging:
+                    print(f"⚠️  No queue for agent: {target_id}")
+                continue
+
+            full_message = self._envelope(target_id, message, sender_id, timestamp)
+            try:
+                queue.put_nowait(full_message)
+            except asyncio.QueueFull:
+                self._counters[_Metric.ERRORS] += 1
+                if self.config.enable_logging:
+                    print(f"⚠️  Queue full for agent: {target_id}")
+                continue
+
+            self._counters[_Metric.MESSAGES_SENT] += 1
+            notifications.extend(
+                handler(full_message) for handler in self._subscribers.get(target_id, ())
+            )
+
+        results = await asyncio.gather(*notifications, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self._counters[_Metric.ERRORS] += 1
+                if self.config.enable_logging:
+                    print(f"❌ Handler error: {result}")
+
     async def broadcast(
         self,
         message: dict[str, Any],
@@ -221,9 +338,10 @@ class MessageBus:
         await self.publish(target_id, request_msg, sender_id)
 
         try:
-            # Wait for response
-            response = await asyncio.wait_for(future, timeout=timeout)
-            return response
+            # Wait for response (await the future directly under a deadline, with no
+            # wrapper task or wait-set per request)
+            async with asyncio.timeout(timeout):
+                return await future
         except asyncio.TimeoutError as err:
             raise TimeoutError(f"Request timeout: {request_id}") from err
         finally:
@@ -264,14 +382,61 @@ class MessageBus:
 
         queue = self._queues[agent_id]
 
-        if timeout:
-            message = await asyncio.wait_for(queue.get(), timeout=timeout)
-        else:
+        async with asyncio.timeout(timeout or None):
             message = await queue.get()
 
-        self._stats["messages_received"] += 1
+        self._counters[_Metric.MESSAGES_RECEIVED] += 1
         return message
 
+    async def get_messages(
+        self,
+        agent_id: str,
+        max_messages: int | None = None,
+        timeout: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Wait for the next message for an agent, then drain what else is queued.
+
+        A consumer loop pays one wakeup per batch instead of one ``Queue.get``
+        future per message; messages already queued are taken with
+        ``get_nowait``.
+
+        Args:
+            agent_id: Agent ID
+            max_messages: Upper bound on the batch size, at least 1 (no bound if None)
+            timeout: Wait timeout in seconds for the first message
+
+        Returns:
+            Messages in arrival order (at least one)
+
+        Raises:
+            asyncio.TimeoutError: If timeout exceeded
+            KeyError: If agent not subscribed
+            ValueError: If max_messages is less than 1
+        """
+        if max_messages is not None and max_messages < 1:
+            raise ValueError(f"max_messages must be at least 1, got {max_messages}")
+        if agent_id not in self._queues:
+            raise KeyError(f"Agent not subscribed: {agent_id}")
+
+        queue = self._queues[agent_id]
+
+        async with asyncio.timeout(timeout or None):
+            messages = [await queue.get()]
+
+        limit = queue.qsize() if max_messages is None else max_messages - 1
+        for _ in range(limit):
+            try:
+                messages.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        self._counters[_Metric.MESSAGES_RECEIVED] += len(messages)
+        return messages
+
+    def _counter_stats(self) -> dict[str, int]:
+        """Materialize the message counters as a dict."""
+        return {metric.name.lower(): self._counters[metric] for metric in _Metric}
+
     def get_stats(self) -> dict[str, Any]:
         """Get message bus statistics.
 
@@ -279,7 +444,7 @@ class MessageBus:
             Statistics dictionary
         """
         return {
-            **self._stats,
+            **self._counter_stats(),
             "subscribers": len(self._subscribers),
             "queues": len(self._queues),
             "pending_responses": len(self._pending_responses)
@@ -294,6 +459,35 @@ class MessageBus:
         return list(self._queues.keys())
 
 
+# One default bus per event loop: its asyncio.Queues bind to the loop that
+# first waits on them, so a bus cannot be shared across loops
+_default_buses: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MessageBus] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_default_bus() -> MessageBus:
+    """Get the running event loop's shared message bus, creating it on first use.
+
+    The bus is created with the default MessageBusConfig and still has to be
+    started by its first user. Each loop gets its own bus, so subscriptions and
+    queued messages do not carry over between ``asyncio.run`` calls. Outside a
+    running loop there is nothing to share and a new private bus is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return MessageBus(MessageBusConfig())
+    # Queues reference their loop, so entries of closed loops are dropped here
+    # rather than by the weak reference
+    for closed in [other for other in _default_buses if other.is_closed()]:
+        del _default_buses[closed]
+    bus = _default_buses.get(loop)
+    if bus is None:
+        bus = _default_buses[loop] = MessageBus(MessageBusConfig())
+    return bus
+
+
 class DistributedMessageBus(MessageBus):
     """Message bus with network distribution support.
 
@@ -18,7 +18,7 @@ from typing import override
 import httpx
 from pydantic import BaseModel, Field
 
-from unify_llm.adapters.base import BaseProvider, to_finish_reason
+from unify_llm.adapters.base import BaseProvider, cache_breakpoint, json_loads, to_finish_reason
 from unify_llm.core.exceptions import TimeoutError as UnifyTimeoutError
 from unify_llm.models import (
     ChatRequest,
@@ -51,10 +51,12 @@ class _RawContentBlock(BaseModel):
 
 
 class _RawUsage(BaseModel):
-    """响应里的 token 计数(输入 / 输出)。"""
+    """响应里的 token 计数(输入 / 输出 / 提示词缓存写入与命中)。"""
 
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
 
 class _RawResponse(BaseModel):
@@ -141,6 +143,14 @@ class AnthropicProvider(BaseProvider):
                     }
                 )
 
+        if request.prompt_caching:
+            # 缓存断点:system prompt 之外,再标最后一条 user 消息(其前的历史只增不改)
+            for message in reversed(conversation_messages):
+                content = message["content"]
+                if message["role"] == Role.USER and isinstance(content, str) and content:
+                    message["content"] = cache_breakpoint(content)
+                    break
+
         payload: dict[str, object] = {
             "model": request.model,
             "messages": conversation_messages,
@@ -150,7 +160,8 @@ class AnthropicProvider(BaseProvider):
 
         # Add system message if present
         if system_messages:
-            payload["system"] = "\n\n".join(system_messages)
+            system = "\n\n".join(system_messages)
+            payload["system"] = cache_breakpoint(system) if request.prompt_caching else system
 
         # Add optional parameters
         if request.temperature is not None:
@@ -196,6 +207,8 @@ class AnthropicProvider(BaseProvider):
             prompt_tokens=parsed.usage.input_tokens,
             completion_tokens=parsed.usage.output_tokens,
             total_tokens=parsed.usage.input_tokens + parsed.usage.output_tokens,
+            cache_creation_input_tokens=parsed.usage.cache_creation_input_tokens,
+            cache_read_input_tokens=parsed.usage.cache_read_input_tokens,
         )
 
         return ChatResponse(
@@ -266,7 +279,7 @@ class AnthropicProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = self.client.post(url, json=payload)
+            response = self.client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -287,7 +300,7 @@ class AnthropicProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = await self.async_client.post(url, json=payload)
+            response = await self.async_client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -308,7 +321,7 @@ class AnthropicProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            with self.client.stream("POST", url, json=payload) as response:
+            with self.client.stream("POST", url, json=payload, headers=self._headers) as response:
                 response.raise_for_status()
 
                 for line in response.iter_lines():
@@ -320,7 +333,7 @@ class AnthropicProvider(BaseProvider):
                         data = line[6:]  # Remove "data: " prefix
 
                         try:
-                            chunk_data = json.loads(data)
+                            chunk_data = json_loads(data)
                         except json.JSONDecodeError:
                             continue
                         chunk = self._convert_stream_chunk(chunk_data)
@@ -345,7 +358,9 @@ class AnthropicProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            async with self.async_client.stream("POST", url, json=payload) as response:
+            async with self.async_client.stream(
+                "POST", url, json=payload, headers=self._headers
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -356,7 +371,7 @@ class AnthropicProvider(BaseProvider):
                         data = line[6:]  # Remove "data: " prefix
 
                         try:
-                            chunk_data = json.loads(data)
+                            chunk_data = json_loads(data)
                         except json.JSONDecodeError:
                             continue
                         chunk = self._convert_stream_chunk(chunk_data)
@@ -17,6 +17,7 @@ _SPEC = OpenAICompatSpec(
     base_url="https://api.anthropic.com/v1",
     env_var="ANTHROPIC_API_KEY",
     default_model="claude-sonnet-4-5",
+    supports_prompt_caching=True,
 )
 
 
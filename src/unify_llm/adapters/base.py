@@ -1,14 +1,19 @@
 """Base provider abstract class + shared adapter helpers.
 
 adapters 是 ports 的具体实现,也是唯一允许直连厂商 HTTP 的层。本模块承载所有 adapter
-共用的 HTTP 管线(连接池 / 重试 / 错误分类 / 网络错归一)与两个解析小工具。
+共用的 HTTP 管线(连接池 / 重试 / 错误分类 / 网络错归一)与解析小工具(含流式帧解码 json_loads、
+规范化序列化 canonical_json、缩进序列化 pretty_json)。
 """
 
 import contextlib
+import dataclasses
+import json
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import date, datetime, time
+from enum import Enum
 from types import TracebackType
-from typing import Self, TypeVar
+from typing import Any, Self, TypeVar
 
 import httpx
 from tenacity import (
@@ -37,6 +42,118 @@ from unify_llm.models import (
 _T = TypeVar("_T")
 
 
+def _json_default(obj: object) -> object:
+    """canonical_json 两个分支共用的非 JSON 原生类型编码:日期时间 → ISO 8601,
+    dataclass → dict,Enum → 值,其余 → ``str(obj)``(如 UUID、Path)。"""
+    if isinstance(obj, datetime | date | time):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _json_key(key: object) -> str:
+    """非 str 字典键转字符串,规则同 orjson 的 OPT_NON_STR_KEYS。"""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool) or key is None or isinstance(key, int | float):
+        return json.dumps(key)
+    return str(_json_default(key))
+
+
+def _with_str_keys(obj: object) -> object:
+    """递归把字典键换成字符串:标准库 sort_keys 按原始键排序(1 < 10 < 2 的顺序不同、
+    混合类型键直接报错),orjson 按转换后的字符串排序;先转换,两者才排出同样的顺序。"""
+    if isinstance(obj, dict):
+        return {_json_key(key): _with_str_keys(value) for key, value in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_with_str_keys(item) for item in obj]
+    return obj
+
+
+def _canonical_json_stdlib(obj: object) -> bytes:
+    """标准库实现的 canonical_json(未装 orjson 时使用,也是 orjson 分支的对照基准)。"""
+    return json.dumps(
+        _with_str_keys(obj),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode()
+
+
+def _pretty_json_stdlib(obj: object, *, sort_keys: bool = False) -> bytes:
+    """标准库实现的 pretty_json(未装 orjson 时使用,也是 orjson 分支的对照基准)。"""
+    return json.dumps(
+        _with_str_keys(obj),
+        sort_keys=sort_keys,
+        indent=2,
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode()
+
+
+# 流式热路径的 JSON 帧解码:装了可选 orjson(``unify-llm[fast]``)就用它,小 dict 帧上快数倍;
+# 否则回退标准库。orjson.JSONDecodeError 继承自 json.JSONDecodeError,调用方的 except 无需改。
+# canonical_json / pretty_json 同理:orjson 直接产出 bytes。两分支字节一致的前提:orjson
+# 放行(PASSTHROUGH)datetime / dataclass 交给同一个 _json_default,非 str 键像标准库一样
+# 转成字符串(NON_STR_KEYS)。
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - 取决于是否安装可选依赖
+    json_loads: Callable[[str | bytes], Any] = json.loads
+    canonical_json = _canonical_json_stdlib
+    pretty_json = _pretty_json_stdlib
+
+else:
+    json_loads = _orjson.loads
+    _CANONICAL_OPTIONS = (
+        _orjson.OPT_SORT_KEYS
+        | _orjson.OPT_NON_STR_KEYS
+        | _orjson.OPT_PASSTHROUGH_DATETIME
+        | _orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    _PRETTY_OPTIONS = (_CANONICAL_OPTIONS & ~_orjson.OPT_SORT_KEYS) | _orjson.OPT_INDENT_2
+
+    def canonical_json(obj: object) -> bytes:
+        """键排序、紧凑分隔、UTF-8 的 JSON 字节;orjson 直接产出 bytes,省一次编码。
+
+        用于 agent 间消息 / 观察结果等需要"相同数据 → 相同字节"的序列化(缓存键、提示词前缀)。
+        与标准库分支对 JSON 原生类型、非 str 键(int/float/bool/None)、日期时间、dataclass、
+        Enum 输出逐字节一致。例外:科学计数法的小数指数写法不同(orjson ``1.5e-7``,标准库
+        ``1.5e-07``),NaN/Infinity 与超 64 位整数 orjson 编码为 null 或报错。
+        """
+        encoded: bytes = _orjson.dumps(obj, option=_CANONICAL_OPTIONS, default=_json_default)
+        return encoded
+
+    def pretty_json(obj: object, *, sort_keys: bool = False) -> bytes:
+        """缩进 2、保留非 ASCII 的 UTF-8 JSON 字节,用于写文件 / 嵌进提示词等给人读的场景。
+
+        类型处理与 canonical_json 相同,与标准库分支的逐字节一致性及其例外也相同;
+        ``sort_keys=False`` 时保持插入顺序。
+        """
+        option = _PRETTY_OPTIONS | _orjson.OPT_SORT_KEYS if sort_keys else _PRETTY_OPTIONS
+        encoded: bytes = _orjson.dumps(obj, option=option, default=_json_default)
+        return encoded
+
+
+def cache_breakpoint(text: str) -> list[dict[str, object]]:
+    """把一段文本包成带 ``cache_control: ephemeral`` 的单个 content block(提示词缓存断点)。
+
+    Anthropic 风格的提示词缓存以 content block 上的 ``cache_control`` 标记前缀终点:该块及之前
+    的前缀被服务端缓存,后续请求前缀逐字节一致时按缓存价计费。
+
+    Args:
+        text: 块文本(system prompt 或 user 消息内容)。
+
+    Returns:
+        只含一个 text block 的 content 列表。
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
 def to_finish_reason(
     value: object, mapping: dict[str, FinishReason] | None = None
 ) -> FinishReason | None:
@@ -98,6 +215,8 @@ class BaseProvider(ABC):
         # Create HTTP clients with connection pooling (only for the self-built ones).
         timeout = httpx.Timeout(connect=5.0, read=self.config.timeout, write=10.0, pool=5.0)
         headers = self._get_headers()
+        # 注入的共享客户端不带本 provider 的鉴权头,故每个请求都显式携带(自建客户端上是同值覆盖)。
+        self._headers = headers
         limits = httpx.Limits(
             max_keepalive_connections=20,
             max_connections=100,
@@ -142,6 +261,29 @@ class BaseProvider(ABC):
         if self._owns_async_client:
             await self.async_client.aclose()
 
+    def warmup(self, timeout: float = 3.0) -> None:
+        """Seat a keep-alive connection to the provider endpoint in the sync pool.
+
+        Issues a cheap ``HEAD`` to the base URL so the TCP/TLS handshake happens now rather
+        than inline with the first chat call. Best effort: any status code is fine (only the
+        connection matters) and network errors are swallowed.
+
+        Args:
+            timeout: Timeout in seconds for the warmup request.
+        """
+        # 只要连接进池即可:4xx/405 同样有效;连不上就等首个真实请求再报错。
+        with contextlib.suppress(httpx.HTTPError, httpx.InvalidURL):
+            self.client.head(self._get_base_url(), timeout=timeout)
+
+    async def awarmup(self, timeout: float = 3.0) -> None:
+        """Async counterpart of ``warmup`` (seats the connection in the async pool).
+
+        Args:
+            timeout: Timeout in seconds for the warmup request.
+        """
+        with contextlib.suppress(httpx.HTTPError, httpx.InvalidURL):
+            await self.async_client.head(self._get_base_url(), timeout=timeout)
+
     def __enter__(self) -> Self:
         """Sync context manager entry."""
         return self
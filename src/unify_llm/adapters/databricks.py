@@ -18,6 +18,7 @@ _SPEC = OpenAICompatSpec(
     base_url="",  # 无静态默认:实际 base URL 由 _get_base_url 从 config / env 解析
     env_var="DATABRICKS_API_KEY",
     default_model="databricks-claude-sonnet-4-5",
+    supports_prompt_caching=True,
 )
 
 
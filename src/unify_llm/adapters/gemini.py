@@ -13,7 +13,7 @@ from typing import override
 import httpx
 from pydantic import BaseModel, Field
 
-from unify_llm.adapters.base import BaseProvider, to_finish_reason
+from unify_llm.adapters.base import BaseProvider, json_loads, to_finish_reason
 from unify_llm.core.exceptions import TimeoutError as UnifyTimeoutError
 from unify_llm.models import (
     ChatRequest,
@@ -244,7 +244,7 @@ class GeminiProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = self.client.post(url, json=payload)
+            response = self.client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -265,7 +265,7 @@ class GeminiProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = await self.async_client.post(url, json=payload)
+            response = await self.async_client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -286,7 +286,7 @@ class GeminiProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            with self.client.stream("POST", url, json=payload) as response:
+            with self.client.stream("POST", url, json=payload, headers=self._headers) as response:
                 response.raise_for_status()
 
                 # Gemini streams JSON objects separated by newlines
@@ -295,7 +295,7 @@ class GeminiProvider(BaseProvider):
                         continue
 
                     try:
-                        chunk_data = json.loads(line)
+                        chunk_data = json_loads(line)
                     except json.JSONDecodeError:
                         continue
                     chunk = self._convert_stream_chunk(chunk_data)
@@ -320,7 +320,9 @@ class GeminiProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            async with self.async_client.stream("POST", url, json=payload) as response:
+            async with self.async_client.stream(
+                "POST", url, json=payload, headers=self._headers
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -328,7 +330,7 @@ class GeminiProvider(BaseProvider):
                         continue
 
                     try:
-                        chunk_data = json.loads(line)
+                        chunk_data = json_loads(line)
                     except json.JSONDecodeError:
                         continue
                     chunk = self._convert_stream_chunk(chunk_data)
@@ -17,7 +17,7 @@ from typing import override
 import httpx
 from pydantic import BaseModel, Field
 
-from unify_llm.adapters.base import BaseProvider
+from unify_llm.adapters.base import BaseProvider, json_loads
 from unify_llm.core.exceptions import TimeoutError as UnifyTimeoutError
 from unify_llm.models import (
     ChatRequest,
@@ -194,7 +194,7 @@ class OllamaProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = self.client.post(url, json=payload)
+            response = self.client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -215,7 +215,7 @@ class OllamaProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = await self.async_client.post(url, json=payload)
+            response = await self.async_client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -236,7 +236,7 @@ class OllamaProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            with self.client.stream("POST", url, json=payload) as response:
+            with self.client.stream("POST", url, json=payload, headers=self._headers) as response:
                 response.raise_for_status()
 
                 # Ollama streams newline-delimited JSON objects
@@ -245,7 +245,7 @@ class OllamaProvider(BaseProvider):
                         continue
 
                     try:
-                        chunk_data = json.loads(line)
+                        chunk_data = json_loads(line)
                     except json.JSONDecodeError:
                         continue
 
@@ -276,7 +276,9 @@ class OllamaProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            async with self.async_client.stream("POST", url, json=payload) as response:
+            async with self.async_client.stream(
+                "POST", url, json=payload, headers=self._headers
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -284,7 +286,7 @@ class OllamaProvider(BaseProvider):
                         continue
 
                     try:
-                        chunk_data = json.loads(line)
+                        chunk_data = json_loads(line)
                     except json.JSONDecodeError:
                         continue
 
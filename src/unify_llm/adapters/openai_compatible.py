@@ -18,7 +18,7 @@ from typing import override
 import httpx
 from pydantic import BaseModel, Field
 
-from unify_llm.adapters.base import BaseProvider
+from unify_llm.adapters.base import BaseProvider, cache_breakpoint, json_loads
 from unify_llm.core.exceptions import TimeoutError as UnifyTimeoutError
 from unify_llm.models import (
     ChatRequest,
@@ -46,6 +46,8 @@ class OpenAICompatSpec:
         default_model: 文档/演示用默认 model。
         coerce_empty_content: 是否把 None content 序列化成空串(bytedance 历史行为)。
         default_headers: 附加默认头(如 OpenRouter 的 HTTP-Referer / X-Title),用户头优先。
+        supports_prompt_caching: 端点是否接受 content block 上的 ``cache_control``(Claude 系);
+            为 False 时忽略 ``ChatRequest.prompt_caching``。
     """
 
     name: str
@@ -54,6 +56,7 @@ class OpenAICompatSpec:
     default_model: str
     coerce_empty_content: bool = False
     default_headers: dict[str, str] = field(default_factory=dict)
+    supports_prompt_caching: bool = False
 
 
 # ── 数据注册表:一行一个兼容厂商(含正式装配的 deepseek)──────────────────────
@@ -114,11 +117,13 @@ class _RawChoice(BaseModel):
 
 
 class _RawUsage(BaseModel):
-    """响应里的 usage 计数。"""
+    """响应里的 usage 计数(cache_* 仅 Claude 系端点在开启提示词缓存时给出)。"""
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
 
 class _RawResponse(BaseModel):
@@ -156,6 +161,29 @@ class _RawStreamChunk(BaseModel):
     created: int | None = None
 
 
+def _mark_cache_breakpoints(messages: list[dict[str, object]]) -> None:
+    """就地把 system 消息与最后一条 user 消息的文本 content 换成带 cache_control 的 block。
+
+    system prompt 在多轮 agent 循环里逐字不变;最后一条 user 消息之前的对话历史也只增不改,
+    两处断点让服务端缓存这两段前缀。
+    """
+    last_user: dict[str, object] | None = None
+    for message in messages:
+        if message["role"] == Role.SYSTEM:
+            _to_cached_block(message)
+        elif message["role"] == Role.USER:
+            last_user = message
+    if last_user is not None:
+        _to_cached_block(last_user)
+
+
+def _to_cached_block(message: dict[str, object]) -> None:
+    """非空字符串 content → 单个带 cache_control 的 text block(其余保持原样)。"""
+    content = message["content"]
+    if isinstance(content, str) and content:
+        message["content"] = cache_breakpoint(content)
+
+
 class OpenAICompatibleProvider(BaseProvider):
     """所有 OpenAI 兼容厂商共用的实现;差异由注入的 OpenAICompatSpec 表达。"""
 
@@ -199,18 +227,22 @@ class OpenAICompatibleProvider(BaseProvider):
     def _convert_request(self, request: ChatRequest) -> dict[str, object]:
         """Convert ChatRequest to OpenAI-compatible request payload."""
         coerce = self._spec.coerce_empty_content
+        messages: list[dict[str, object]] = [
+            {
+                "role": msg.role,
+                "content": (msg.content or "") if coerce else msg.content,
+                **({"name": msg.name} if msg.name else {}),
+                **({"tool_calls": msg.tool_calls} if msg.tool_calls else {}),
+                **({"tool_call_id": msg.tool_call_id} if msg.tool_call_id else {}),
+            }
+            for msg in request.messages
+        ]
+        if request.prompt_caching and self._spec.supports_prompt_caching:
+            _mark_cache_breakpoints(messages)
+
         payload: dict[str, object] = {
             "model": request.model,
-            "messages": [
-                {
-                    "role": msg.role,
-                    "content": (msg.content or "") if coerce else msg.content,
-                    **({"name": msg.name} if msg.name else {}),
-                    **({"tool_calls": msg.tool_calls} if msg.tool_calls else {}),
-                    **({"tool_call_id": msg.tool_call_id} if msg.tool_call_id else {}),
-                }
-                for msg in request.messages
-            ],
+            "messages": messages,
             "stream": request.stream,
         }
 
@@ -270,6 +302,8 @@ class OpenAICompatibleProvider(BaseProvider):
             prompt_tokens=parsed.usage.prompt_tokens,
             completion_tokens=parsed.usage.completion_tokens,
             total_tokens=parsed.usage.total_tokens,
+            cache_creation_input_tokens=parsed.usage.cache_creation_input_tokens,
+            cache_read_input_tokens=parsed.usage.cache_read_input_tokens,
         )
 
         return ChatResponse(
@@ -288,6 +322,10 @@ class OpenAICompatibleProvider(BaseProvider):
         if not chunk:
             return None
 
+        fast = self._fast_content_chunk(chunk)
+        if fast is not None:
+            return fast
+
         parsed = _RawStreamChunk.model_validate(chunk)
 
         choices = [
@@ -314,6 +352,54 @@ class OpenAICompatibleProvider(BaseProvider):
             provider=self.name,
         )
 
+    def _fast_content_chunk(self, chunk: dict[str, object]) -> StreamChunk | None:
+        """纯文本增量帧的快路径:形状可确定时直接 model_construct,否则返回 None 走完整解析。
+
+        流式绝大多数帧形如 ``{"id", "model", "choices": [{"index", "delta": {"content"}}]}``,
+        逐层 model_validate(原始契约 + 三个统一模型)是每个 token 的主要 CPU 开销。这里逐字段
+        确认类型后才跳过校验;首帧 role、finish_reason、tool_calls 等其它形状一律回退。
+        """
+        choices = chunk.get("choices")
+        if not isinstance(choices, list) or len(choices) != 1:
+            return None
+        choice = choices[0]
+        if not isinstance(choice, dict) or choice.get("finish_reason") is not None:
+            return None
+        delta = choice.get("delta")
+        if not isinstance(delta, dict) or delta.get("role") is not None:
+            return None
+        if delta.keys() - {"content", "role"}:
+            return None
+        content = delta.get("content")
+        index = choice.get("index", 0)
+        chunk_id = chunk.get("id", "")
+        model = chunk.get("model", "")
+        created = chunk.get("created")
+        if not (
+            isinstance(content, str)
+            and type(index) is int
+            and isinstance(chunk_id, str)
+            and isinstance(model, str)
+        ):
+            return None
+        if created is None:
+            created = int(time.time())
+        elif type(created) is not int:
+            return None
+        return StreamChunk.model_construct(
+            id=chunk_id,
+            model=model,
+            choices=[
+                StreamChoiceDelta.model_construct(
+                    index=index,
+                    delta=MessageDelta.model_construct(role=None, content=content, tool_calls=None),
+                    finish_reason=None,
+                )
+            ],
+            created=created,
+            provider=self.name,
+        )
+
     @override
     def _chat_impl(self, request: ChatRequest) -> ChatResponse:
         """Implementation of synchronous chat request."""
@@ -321,7 +407,7 @@ class OpenAICompatibleProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = self.client.post(url, json=payload)
+            response = self.client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -342,7 +428,7 @@ class OpenAICompatibleProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = await self.async_client.post(url, json=payload)
+            response = await self.async_client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -363,7 +449,7 @@ class OpenAICompatibleProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            with self.client.stream("POST", url, json=payload) as response:
+            with self.client.stream("POST", url, json=payload, headers=self._headers) as response:
                 response.raise_for_status()
 
                 for line in response.iter_lines():
@@ -377,7 +463,7 @@ class OpenAICompatibleProvider(BaseProvider):
                             break
 
                         try:
-                            chunk_data = json.loads(data)
+                            chunk_data = json_loads(data)
                         except json.JSONDecodeError:
                             continue
                         chunk = self._convert_stream_chunk(chunk_data)
@@ -402,7 +488,9 @@ class OpenAICompatibleProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            async with self.async_client.stream("POST", url, json=payload) as response:
+            async with self.async_client.stream(
+                "POST", url, json=payload, headers=self._headers
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -416,7 +504,7 @@ class OpenAICompatibleProvider(BaseProvider):
                             break
 
                         try:
-                            chunk_data = json.loads(data)
+                            chunk_data = json_loads(data)
                         except json.JSONDecodeError:
                             continue
                         chunk = self._convert_stream_chunk(chunk_data)
@@ -19,7 +19,7 @@ from typing import override
 import httpx
 from pydantic import BaseModel, Field
 
-from unify_llm.adapters.base import BaseProvider, to_finish_reason
+from unify_llm.adapters.base import BaseProvider, json_loads, to_finish_reason
 from unify_llm.core.exceptions import TimeoutError as UnifyTimeoutError
 from unify_llm.models import (
     ChatRequest,
@@ -283,7 +283,7 @@ class QwenProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = self.client.post(url, json=payload)
+            response = self.client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -304,7 +304,7 @@ class QwenProvider(BaseProvider):
         payload = self._convert_request(request)
 
         try:
-            response = await self.async_client.post(url, json=payload)
+            response = await self.async_client.post(url, json=payload, headers=self._headers)
             response.raise_for_status()
             return self._convert_response(response.json())
         except httpx.TimeoutException as e:
@@ -332,7 +332,7 @@ class QwenProvider(BaseProvider):
             payload["parameters"] = {"incremental_output": True}
 
         try:
-            with self.client.stream("POST", url, json=payload) as response:
+            with self.client.stream("POST", url, json=payload, headers=self._headers) as response:
                 response.raise_for_status()
 
                 for line in response.iter_lines():
@@ -347,13 +347,13 @@ class QwenProvider(BaseProvider):
                             break
 
                         try:
-                            chunk_data = json.loads(data)
+                            chunk_data = json_loads(data)
                         except json.JSONDecodeError:
                             continue
                     else:
                         # Some responses might not have data: prefix
                         try:
-                            chunk_data = json.loads(line)
+                            chunk_data = json_loads(line)
                         except json.JSONDecodeError:
                             continue
 
@@ -386,7 +386,9 @@ class QwenProvider(BaseProvider):
             payload["parameters"] = {"incremental_output": True}
 
         try:
-            async with self.async_client.stream("POST", url, json=payload) as response:
+            async with self.async_client.stream(
+                "POST", url, json=payload, headers=self._headers
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -401,13 +403,13 @@ class QwenProvider(BaseProvider):
                             break
 
                         try:
-                            chunk_data = json.loads(data)
+                            chunk_data = json_loads(data)
                         except json.JSONDecodeError:
                             continue
                     else:
                         # Some responses might not have data: prefix
                         try:
-                            chunk_data = json.loads(line)
+                            chunk_data = json_loads(line)
                         except json.JSONDecodeError:
                             continue
 
@@ -13,53 +13,67 @@ New n8n-style features:
 
 from __future__ import annotations
 
-# Advanced features
-from unify_llm.agent.advanced import AgentChain, ErrorHandler, ParallelExecutor
-from unify_llm.agent.base import Agent, AgentConfig, AgentType
-from unify_llm.agent.execution_history import ExecutionData, ExecutionHistory, ExecutionStatus
-from unify_llm.agent.executor import AgentExecutor, ExecutionResult
-from unify_llm.agent.http_tools import (
-    create_all_http_tools,
-    create_http_request_tool,
-    http_delete,
-    http_get,
-    http_post,
-    http_put,
-    http_request,
-)
-from unify_llm.agent.memory import ConversationMemory, MemoryMessage, SharedMemory
+import importlib
+from typing import Any
 
-# Monitoring
-from unify_llm.agent.monitoring import (
-    AgentMetrics,
-    ExecutionLogger,
-    PerformanceMonitor,
-    get_logger,
-    get_monitor,
-)
-
-# Templates
-from unify_llm.agent.templates import AgentTemplates
-from unify_llm.agent.tools import Tool, ToolParameter, ToolParameterType, ToolRegistry, ToolResult
-
-# n8n-style features
-from unify_llm.agent.triggers import (
-    BaseTrigger,
-    IntervalTrigger,
-    ManualTrigger,
-    ScheduleTrigger,
-    TriggerConfig,
-    TriggerEvent,
-    TriggerManager,
-    TriggerStatus,
-    TriggerType,
-    WebhookTrigger,
-)
-
-# Visualization
-from unify_llm.agent.visualization import ExecutionTracer, WorkflowVisualizer, visualize_workflow
-from unify_llm.agent.webhook_server import WebhookClient, WebhookServer
-from unify_llm.agent.workflow import NodeType, Workflow, WorkflowConfig, WorkflowNode, WorkflowResult
+# Exported name -> defining module. Submodules are imported on first attribute
+# access (PEP 562), so ``from unify_llm.agent import Agent`` does not pull in
+# the webhook server (fastapi/uvicorn) or the cron triggers (croniter).
+_LAZY_EXPORTS: dict[str, str] = {
+    "AgentChain": "unify_llm.agent.advanced",
+    "ErrorHandler": "unify_llm.agent.advanced",
+    "ParallelExecutor": "unify_llm.agent.advanced",
+    "Agent": "unify_llm.agent.base",
+    "AgentConfig": "unify_llm.agent.base",
+    "AgentType": "unify_llm.agent.base",
+    "ExecutionData": "unify_llm.agent.execution_history",
+    "ExecutionHistory": "unify_llm.agent.execution_history",
+    "ExecutionStatus": "unify_llm.agent.execution_history",
+    "AgentExecutor": "unify_llm.agent.executor",
+    "ExecutionResult": "unify_llm.agent.executor",
+    "create_all_http_tools": "unify_llm.agent.http_tools",
+    "create_http_request_tool": "unify_llm.agent.http_tools",
+    "http_delete": "unify_llm.agent.http_tools",
+    "http_get": "unify_llm.agent.http_tools",
+    "http_post": "unify_llm.agent.http_tools",
+    "http_put": "unify_llm.agent.http_tools",
+    "http_request": "unify_llm.agent.http_tools",
+    "shared_http_client": "unify_llm.agent.http_tools",
+    "ConversationMemory": "unify_llm.agent.memory",
+    "MemoryMessage": "unify_llm.agent.memory",
+    "SharedMemory": "unify_llm.agent.memory",
+    "AgentMetrics": "unify_llm.agent.monitoring",
+    "ExecutionLogger": "unify_llm.agent.monitoring",
+    "PerformanceMonitor": "unify_llm.agent.monitoring",
+    "get_logger": "unify_llm.agent.monitoring",
+    "get_monitor": "unify_llm.agent.monitoring",
+    "AgentTemplates": "unify_llm.agent.templates",
+    "Tool": "unify_llm.agent.tools",
+    "ToolParameter": "unify_llm.agent.tools",
+    "ToolParameterType": "unify_llm.agent.tools",
+    "ToolRegistry": "unify_llm.agent.tools",
+    "ToolResult": "unify_llm.agent.tools",
+    "BaseTrigger": "unify_llm.agent.triggers",
+    "IntervalTrigger": "unify_llm.agent.triggers",
+    "ManualTrigger": "unify_llm.agent.triggers",
+    "ScheduleTrigger": "unify_llm.agent.triggers",
+    "TriggerConfig": "unify_llm.agent.triggers",
+    "TriggerEvent": "unify_llm.agent.triggers",
+    "TriggerManager": "unify_llm.agent.triggers",
+    "TriggerStatus": "unify_llm.agent.triggers",
+    "TriggerType": "unify_llm.agent.triggers",
+    "WebhookTrigger": "unify_llm.agent.triggers",
+    "ExecutionTracer": "unify_llm.agent.visualization",
+    "WorkflowVisualizer": "unify_llm.agent.visualization",
+    "visualize_workflow": "unify_llm.agent.visualization",
+    "WebhookClient": "unify_llm.agent.webhook_server",
+    "WebhookServer": "unify_llm.agent.webhook_server",
+    "NodeType": "unify_llm.agent.workflow",
+    "Workflow": "unify_llm.agent.workflow",
+    "WorkflowConfig": "unify_llm.agent.workflow",
+    "WorkflowNode": "unify_llm.agent.workflow",
+    "WorkflowResult": "unify_llm.agent.workflow",
+}
 
 __all__ = [
     # Core
@@ -116,6 +130,7 @@ __all__ = [
     "http_delete",
     "create_http_request_tool",
     "create_all_http_tools",
+    "shared_http_client",
     # Webhook Server (n8n-style)
     "WebhookServer",
     "WebhookClient",
@@ -124,3 +139,10 @@ __all__ = [
     "ExecutionData",
     "ExecutionHistory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -5,8 +5,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import random
+import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from unify_llm.agent.executor import ExecutionResult
 
@@ -20,7 +23,8 @@ class ParallelExecutor:
         ```python
         from unify_llm.agent.advanced import ParallelExecutor
 
-        parallel = ParallelExecutor(max_workers=3)
+        # Auto-sized: ceil(target_qps * median_rtt), bounded by the agent count
+        parallel = ParallelExecutor(target_qps=5.0, median_rtt=2.0)
 
         # Execute multiple agents concurrently
         results = parallel.execute_parallel(
@@ -31,13 +35,42 @@ class ParallelExecutor:
         ```
     """
 
-    def __init__(self, max_workers: int = 5):
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        target_qps: float = 10.0,
+        median_rtt: float = 1.0
+    ):
         """Initialize parallel executor.
 
+        Agent runs are network-bound, so concurrency is sized from the expected
+        request rate and latency rather than from the CPU count. By Little's law
+        the number of requests in flight is ``target_qps * median_rtt``; when
+        ``max_workers`` is None that figure (bounded by the number of agents) is
+        used as the worker count.
+
         Args:
-            max_workers: Maximum number of parallel workers
+            max_workers: Maximum number of parallel workers (None = auto-size)
+            target_qps: Target request rate used for auto-sizing
+            median_rtt: Expected median round-trip time in seconds of one agent run
         """
         self.max_workers = max_workers
+        self.target_qps = target_qps
+        self.median_rtt = median_rtt
+
+    def _worker_count(self, num_tasks: int) -> int:
+        """Number of concurrent workers for ``num_tasks`` agent runs.
+
+        Args:
+            num_tasks: Number of agent runs to execute
+
+        Returns:
+            Explicit ``max_workers`` if set, else ``ceil(target_qps * median_rtt)``,
+            bounded by ``num_tasks`` (and at least 1)
+        """
+        if self.max_workers is not None:
+            return max(1, self.max_workers)
+        return max(1, min(num_tasks, math.ceil(self.target_qps * self.median_rtt)))
 
     def execute_parallel(
         self,
@@ -46,7 +79,10 @@ class ParallelExecutor:
         inputs: list[str],
         **kwargs
     ) -> list[ExecutionResult]:
-        """Execute multiple agents in parallel.
+        """Execute multiple agents in parallel on a thread pool.
+
+        Prefer ``aexecute_parallel`` when the agents' client supports async; the
+        thread pool is the fallback for synchronous-only setups.
 
         Args:
             agents: List of agents to execute
@@ -59,7 +95,7 @@ class ParallelExecutor:
         """
         results = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=self._worker_count(len(executors))) as executor:
             # Submit all tasks
             future_to_idx = {
                 executor.submit(exec_obj.run, input_text, **kwargs): idx
@@ -105,8 +141,15 @@ class ParallelExecutor:
         Returns:
             List of execution results
         """
+        # Same concurrency bound as the thread pool, enforced with a semaphore
+        semaphore = asyncio.Semaphore(self._worker_count(len(executors)))
+
+        async def run_one(exec_obj: Any, input_text: str) -> ExecutionResult:
+            async with semaphore:
+                return await exec_obj.arun(input_text, **kwargs)
+
         tasks = [
-            exec_obj.arun(input_text, **kwargs)
+            run_one(exec_obj, input_text)
             for exec_obj, input_text in zip(executors, inputs)
         ]
 
@@ -135,7 +178,7 @@ class ErrorHandler:
         ```python
         from unify_llm.agent.advanced import ErrorHandler
 
-        handler = ErrorHandler(max_retries=3, backoff_factor=2.0)
+        handler = ErrorHandler(max_retries=3, base=0.5, cap=30.0)
 
         result = handler.execute_with_retry(
             executor=executor,
@@ -149,18 +192,48 @@ class ErrorHandler:
         self,
         max_retries: int = 3,
         backoff_factor: float = 2.0,
-        retry_on_errors: list[str] | None = None
+        retry_on_errors: list[str] | None = None,
+        base: float = 0.5,
+        cap: float = 30.0
     ):
         """Initialize error handler.
 
+        Retries wait with AWS-style decorrelated jitter,
+        ``sleep = min(cap, uniform(base, prev * 3))``, so retries from the same
+        rate-limit burst spread out instead of hitting the provider in lockstep.
+
         Args:
             max_retries: Maximum number of retry attempts
-            backoff_factor: Exponential backoff factor
+            backoff_factor: Deprecated; kept for compatibility and no longer used
+                (the wait is computed with decorrelated jitter). Passing a value
+                other than the default emits a DeprecationWarning
             retry_on_errors: List of error types to retry on
+            base: Minimum wait between attempts in seconds
+            cap: Maximum wait between attempts in seconds
         """
+        if backoff_factor != 2.0:
+            warnings.warn(
+                "ErrorHandler(backoff_factor=...) is deprecated and ignored; "
+                "retries use decorrelated jitter, tune them with base= and cap=",
+                DeprecationWarning,
+                stacklevel=2
+            )
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.retry_on_errors = retry_on_errors or ["timeout", "rate_limit", "api_error"]
+        self.base = base
+        self.cap = cap
+
+    def next_delay(self, prev: float) -> float:
+        """Compute the next retry wait with decorrelated jitter.
+
+        Args:
+            prev: Previous wait in seconds (``base`` before the first retry)
+
+        Returns:
+            Wait in seconds, in ``[base, cap]``
+        """
+        return min(self.cap, random.uniform(self.base, max(self.base, prev * 3)))
 
     def should_retry(self, error: str) -> bool:
         """Determine if an error should trigger a retry.
@@ -195,6 +268,7 @@ class ErrorHandler:
         import time
 
         last_error = None
+        delay = self.base
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -212,11 +286,11 @@ class ErrorHandler:
                 if on_error:
                     on_error(f"Attempt {attempt + 1} failed: {result.error}")
 
-                # Wait before retry (exponential backoff)
+                # Wait before retry (decorrelated jitter)
                 if attempt < self.max_retries:
-                    wait_time = self.backoff_factor ** attempt
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    delay = self.next_delay(delay)
+                    logger.info(f"Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
 
             except Exception as e:
                 last_error = str(e)
@@ -225,8 +299,8 @@ class ErrorHandler:
                     on_error(f"Attempt {attempt + 1} exception: {e}")
 
                 if attempt < self.max_retries:
-                    wait_time = self.backoff_factor ** attempt
-                    time.sleep(wait_time)
+                    delay = self.next_delay(delay)
+                    time.sleep(delay)
 
         # All retries exhausted
         return ExecutionResult(
@@ -381,3 +455,103 @@ class AgentChain:
             "final_output": current_input,
             "steps": results
         }
+
+    async def _astream_step(
+        self,
+        executor: Any,
+        step_input: str,
+        name: str,
+        on_chunk: Callable[[str, str], Any] | None,
+        **kwargs
+    ) -> ExecutionResult:
+        """Run one tool-less step by streaming its LLM response (``executor.astream``).
+
+        Args:
+            executor: Agent executor for this step
+            step_input: Input for this step
+            name: Step name (passed to ``on_chunk``)
+            on_chunk: Callback invoked with ``(name, text)`` per content chunk
+            **kwargs: Additional parameters for LLM
+
+        Returns:
+            Execution result with the assembled output
+        """
+        try:
+            parts = []
+            async for text in executor.astream(step_input, **kwargs):
+                parts.append(text)
+                if on_chunk:
+                    on_chunk(name, text)
+            output = "".join(parts)
+            return ExecutionResult(success=True, output=output, iterations=1, tool_calls=[])
+
+        except Exception as e:
+            logger.error(f"Error streaming chain step {name}: {e}", exc_info=True)
+            return ExecutionResult(success=False, error=str(e), iterations=0, tool_calls=[])
+
+    async def aexecute_streaming(
+        self,
+        initial_input: str,
+        on_chunk: Callable[[str, str], Any] | None = None,
+        **kwargs
+    ) -> dict[str, Any]:
+        """Execute the agent chain asynchronously, streaming each step's output.
+
+        Steps whose agent has no tools stream their response and report every
+        content chunk through ``on_chunk(step_name, text)``, so a consumer can
+        render a stage while it is still being generated. Steps with tools run
+        through ``executor.arun`` (the tool-calling loop needs whole responses).
+        A step still starts only once the previous one has finished, because
+        its transform consumes the full previous output.
+
+        Args:
+            initial_input: Initial input to the chain
+            on_chunk: Callback invoked with ``(step_name, text)`` per chunk
+            **kwargs: Additional parameters
+
+        Returns:
+            Dictionary with results from each step (same shape as ``aexecute``)
+        """
+        results = {}
+        current_input = initial_input
+
+        for step in self._chain:
+            executor = step["executor"]
+            transform = step["transform"]
+            name = step["name"]
+
+            logger.info(f"Executing chain step (streaming): {name}")
+
+            # Apply transformation if provided
+            if transform:
+                current_input = transform(current_input)
+
+            # Execute agent: stream when there is no tool loop to drive
+            if executor.agent.config.tools:
+                result = await executor.arun(current_input, **kwargs)
+                if result.success and on_chunk:
+                    on_chunk(name, result.output)
+            else:
+                result = await self._astream_step(
+                    executor, current_input, name, on_chunk, **kwargs
+                )
+
+            results[name] = {
+                "input": current_input,
+                "result": result,
+                "success": result.success
+            }
+
+            # If failed, stop chain
+            if not result.success:
+                logger.error(f"Chain failed at step {name}: {result.error}")
+                break
+
+            # Use output as input for next step
+            current_input = result.output
+
+        return {
+            "success": all(r["success"] for r in results.values()),
+            "final_output": current_input,
+            "steps": results
+        }
@@ -35,6 +35,8 @@ class AgentConfig(BaseModel):
         enable_memory: Whether to enable conversation memory
         memory_window: Number of messages to keep in memory
         tools: List of tool names available to the agent
+        cache_system_prompt: Request provider-side prompt caching of the (static) system
+            prompt, which is resent on every iteration of the agent loop
         metadata: Additional metadata for the agent
     """
 
@@ -52,6 +54,9 @@ class AgentConfig(BaseModel):
     enable_memory: bool = Field(default=True, description="Enable conversation memory")
     memory_window: int = Field(default=10, ge=1, description="Number of messages in memory")
     tools: list[str] = Field(default_factory=list, description="Available tool names")
+    cache_system_prompt: bool = Field(
+        default=True, description="Request prompt caching of the system prompt"
+    )
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
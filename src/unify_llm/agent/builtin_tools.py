@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import json
 import math
 import operator
@@ -167,9 +168,18 @@ def create_calculator_tool() -> Tool:
 def create_string_tools() -> list[Tool]:
     """Create string manipulation tools.
 
+    The tools are stateless, so they are built once and shared; each call
+    returns a fresh list that callers may modify.
+
     Returns:
         List of string manipulation tools
     """
+    return list(_build_string_tools())
+
+
+@functools.cache
+def _build_string_tools() -> tuple[Tool, ...]:
+    """Build the string manipulation tools (cached, see ``create_string_tools``)."""
 
     def to_uppercase(text: str) -> ToolResult:
         """Convert text to uppercase."""
@@ -250,7 +260,7 @@ def create_string_tools() -> list[Tool]:
         function=count_words
     ))
 
-    return tools
+    return tuple(tools)
 
 
 def create_data_formatter_tool() -> Tool:
@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import uuid
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -18,6 +19,13 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO executions
+    (id, workflow_id, workflow_name, status, start_time, end_time,
+     trigger_type, input_data, output_data, error, node_executions, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class ExecutionStatus(str, Enum):
     """Execution status."""
@@ -94,6 +102,10 @@ class ExecutionHistory:
         # Query executions
         recent = history.get_recent(limit=10)
         by_workflow = history.get_by_workflow("workflow_1", limit=20)
+
+        # Throwaway in-memory history, released on exit
+        with ExecutionHistory(db_path=":memory:") as scratch:
+            scratch.save(execution)
         ```
     """
 
@@ -101,14 +113,53 @@ class ExecutionHistory:
         """Initialize execution history.
 
         Args:
-            db_path: Path to SQLite database
+            db_path: Path to SQLite database, or ":memory:" for a throwaway
+                in-memory history (demos/tests: no files, no fsync); close it
+                with ``close()`` or a ``with`` block
         """
         self.db_path = db_path
+        self._keepalive: sqlite3.Connection | None = None
+        if db_path == ":memory:":
+            # Every operation opens its own connection, so a plain ":memory:" would
+            # be a fresh empty database each time. Use a named shared-cache memory
+            # database instead, kept alive by one connection held for our lifetime.
+            name = f"execution_history_{uuid.uuid4().hex}"
+            self._uri: str | None = f"file:{name}?mode=memory&cache=shared"
+            self._keepalive = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        else:
+            self._uri = None
         self._init_db()
 
+    def close(self) -> None:
+        """Close the connection that keeps an in-memory history alive.
+
+        An in-memory history's contents are discarded and it must not be used
+        afterwards. For a file-backed history this is a no-op.
+        """
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
+
+    def __enter__(self) -> ExecutionHistory:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit (calls ``close``)."""
+        self.close()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a raw connection to this history's database."""
+        if self._uri is not None:
+            return sqlite3.connect(self._uri, uri=True)
+        return sqlite3.connect(self.db_path)
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._open()
+        # WAL persists in the database file; readers no longer block the writer
+        # (an in-memory database ignores this)
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -150,21 +201,20 @@ class ExecutionHistory:
 
         logger.info(f"Initialized execution history database: {self.db_path}")
 
-    def save(self, execution: ExecutionData) -> None:
-        """Save an execution to history.
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for frequent small writes.
 
-        Args:
-            execution: Execution data
+        With WAL, ``synchronous=NORMAL`` only fsyncs at checkpoints instead of
+        on every commit, and stays crash-safe.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO executions
-            (id, workflow_id, workflow_name, status, start_time, end_time,
-             trigger_type, input_data, output_data, error, node_executions, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        conn = self._open()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _to_row(execution: ExecutionData) -> tuple:
+        """Convert an execution to an ``executions`` table row."""
+        return (
             execution.id,
             execution.workflow_id,
             execution.workflow_name,
@@ -177,12 +227,30 @@ class ExecutionHistory:
             execution.error,
             json.dumps(execution.node_executions),
             json.dumps(execution.metadata)
-        ))
+        )
 
-        conn.commit()
-        conn.close()
+    def save(self, execution: ExecutionData) -> None:
+        """Save an execution to history.
+
+        Args:
+            execution: Execution data
+        """
+        self.save_many([execution])
+
+    def save_many(self, executions: List[ExecutionData]) -> None:
+        """Save several executions in a single transaction.
+
+        Args:
+            executions: Execution data to save
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(_INSERT_SQL, [self._to_row(e) for e in executions])
+        finally:
+            conn.close()
 
-        logger.debug(f"Saved execution {execution.id}")
+        logger.debug(f"Saved {len(executions)} execution(s)")
 
     def get(self, execution_id: str) -> ExecutionData | None:
         """Get execution by ID.
@@ -193,7 +261,7 @@ class ExecutionHistory:
         Returns:
             Execution data or None
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -221,7 +289,7 @@ class ExecutionHistory:
         Returns:
             List of executions
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         if status:
@@ -263,7 +331,7 @@ class ExecutionHistory:
         Returns:
             List of executions
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         if status:
@@ -299,7 +367,7 @@ class ExecutionHistory:
         Returns:
             Statistics data
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         if workflow_id:
@@ -347,7 +415,7 @@ class ExecutionHistory:
         """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("""
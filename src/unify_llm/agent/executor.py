@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
@@ -71,10 +72,7 @@ class AgentExecutor:
     Example:
         ```python
         from unify_llm import UnifyLLM
-        from unify_llm.agent import (
-            Agent, AgentConfig, AgentExecutor,
-            ToolRegistry, ConversationMemory
-        )
+        from unify_llm.agent import Agent, AgentConfig, AgentExecutor, ToolRegistry
 
         # Initialize client
         client = UnifyLLM(provider="openai", api_key="sk-...")
@@ -93,11 +91,7 @@ class AgentExecutor:
         # ... register tools ...
 
         # Create executor
-        executor = AgentExecutor(
-            agent=agent,
-            tool_registry=registry,
-            memory=ConversationMemory(window_size=10)
-        )
+        executor = AgentExecutor(agent=agent, tool_registry=registry)
 
         # Run agent
         result = executor.run("What's 15 * 23?")
@@ -117,20 +111,58 @@ class AgentExecutor:
         Args:
             agent: Agent to execute
             tool_registry: Tool registry with available tools
-            memory: Conversation memory (creates new if None)
+            memory: Conversation memory; if None, one is built from the agent's
+                ``memory_window`` (no need to pass a separate instance)
             verbose: Whether to log execution details
         """
         self.agent = agent
         self.tool_registry = tool_registry or ToolRegistry()
-        self.memory = memory or ConversationMemory(
+        # ``is None`` rather than ``or``: ConversationMemory defines __len__, so an
+        # empty caller-supplied memory is falsy and would be silently replaced.
+        self.memory = memory if memory is not None else ConversationMemory(
             window_size=agent.config.memory_window
         )
         self.verbose = verbose
 
+        # Provider-format tool schemas, rebuilt only when their inputs change
+        self._cached_tool_payload: list[dict[str, Any]] | None = None
+        self._tool_payload_key: tuple[Any, ...] | None = None
+
         # Add system message to memory if enabled
         if agent.config.enable_memory:
             self.memory.add_system_message(agent.config.system_prompt)
 
+    def _get_tools_payload(self) -> list[dict[str, Any]] | None:
+        """Get the ``tools=`` payload for the LLM, building it once per input change.
+
+        The payload is a pure function of the provider, ``config.tools`` and the
+        registry contents, so it is cached and only rebuilt when one of those
+        changes (the registry's ``version`` tracks registrations, each tool's
+        ``schema_version`` tracks field assignments such as a new description).
+
+        Returns:
+            Tools in provider format, or None if the agent has no tools
+        """
+        if not self.agent.config.tools:
+            return None
+
+        key = (
+            self.agent.config.provider,
+            tuple(self.agent.config.tools),
+            self.tool_registry.version,
+            tuple(
+                tool.schema_version if tool is not None else -1
+                for tool in map(self.tool_registry.get, self.agent.config.tools)
+            )
+        )
+        if key != self._tool_payload_key:
+            self._cached_tool_payload = self.tool_registry.get_tools_for_provider(
+                self.agent.config.provider,
+                self.agent.config.tools
+            )
+            self._tool_payload_key = key
+        return self._cached_tool_payload
+
     def run(self, user_input: str, **kwargs) -> ExecutionResult:
         """Run the agent synchronously.
 
@@ -146,12 +178,8 @@ class AgentExecutor:
             if self.agent.config.enable_memory:
                 self.memory.add_user_message(user_input)
 
-            # Get tools in the right format for the provider
-            tools = None
-            if self.agent.config.tools:
-                tools = self.tool_registry.get_tools_for_provider(
-                    self.agent.config.provider
-                )
+            # Get tools in the right format for the provider (memoized)
+            tools = self._get_tools_payload()
 
             # Prepare messages
             messages = self.memory.get_messages() if self.agent.config.enable_memory else [
@@ -176,6 +204,7 @@ class AgentExecutor:
                     temperature=self.agent.config.temperature,
                     max_tokens=self.agent.config.max_tokens,
                     tools=tools,
+                    prompt_caching=self.agent.config.cache_system_prompt,
                     **kwargs
                 )
 
@@ -305,12 +334,8 @@ class AgentExecutor:
             if self.agent.config.enable_memory:
                 self.memory.add_user_message(user_input)
 
-            # Get tools in the right format for the provider
-            tools = None
-            if self.agent.config.tools:
-                tools = self.tool_registry.get_tools_for_provider(
-                    self.agent.config.provider
-                )
+            # Get tools in the right format for the provider (memoized)
+            tools = self._get_tools_payload()
 
             # Prepare messages
             messages = self.memory.get_messages() if self.agent.config.enable_memory else [
@@ -335,6 +360,7 @@ class AgentExecutor:
                     temperature=self.agent.config.temperature,
                     max_tokens=self.agent.config.max_tokens,
                     tools=tools,
+                    prompt_caching=self.agent.config.cache_system_prompt,
                     **kwargs
                 )
 
@@ -449,6 +475,46 @@ class AgentExecutor:
                 error=str(e)
             )
 
+    async def astream(self, user_input: str, **kwargs: object) -> AsyncIterator[str]:
+        """Stream the agent's reply to an input as text deltas.
+
+        Makes a single streaming LLM call without tools, for agents that answer
+        directly; use ``arun`` for the tool-calling reasoning loop. The full
+        reply is added to memory once the stream ends.
+
+        Args:
+            user_input: User input message
+            **kwargs: Additional parameters for LLM
+
+        Yields:
+            Content deltas as they arrive
+        """
+        if self.agent.config.enable_memory:
+            self.memory.add_user_message(user_input)
+            messages = self.memory.get_messages()
+        else:
+            messages = [
+                self.agent.get_system_message(),
+                {"role": "user", "content": user_input}
+            ]
+
+        parts: list[str] = []
+        async for chunk in self.agent.client.achat_stream(
+            model=self.agent.config.model,
+            messages=messages,
+            temperature=self.agent.config.temperature,
+            max_tokens=self.agent.config.max_tokens,
+            prompt_caching=self.agent.config.cache_system_prompt,
+            **kwargs
+        ):
+            delta = chunk.content
+            if delta:
+                parts.append(delta)
+                yield delta
+
+        if self.agent.config.enable_memory:
+            self.memory.add_assistant_message("".join(parts))
+
     def reset_memory(self) -> None:
         """Reset the conversation memory."""
         self.memory.clear()
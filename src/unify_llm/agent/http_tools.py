@@ -7,16 +7,25 @@ allowing agents to make HTTP requests to external APIs.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import ipaddress
 import json
 import logging
 import socket
+import time
+import weakref
+from collections import OrderedDict
+from contextvars import ContextVar
 from enum import Enum
-from typing import Dict, List, Optional, Set, Union
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union
 from urllib.parse import urlparse
 
 import httpx
 
+from unify_llm.adapters.base import json_loads
 from unify_llm.agent.tools import Tool, ToolParameter, ToolParameterType, ToolResult
 
 logger = logging.getLogger(__name__)
@@ -93,6 +102,83 @@ def is_url_safe(url: str) -> tuple[bool, str]:
         return False, f"URL validation error: {str(e)}"
 
 
+# Connection pooling: requests reuse one keep-alive client instead of paying a
+# TCP+TLS handshake per call. A client is bound to the event loop it was created
+# on, so the implicit shared client is kept per loop.
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_context_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "http_tools_client", default=None
+)
+_loop_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create a pooled client that never stores cookies.
+
+    Requests are independent tool calls, so cookies set by one response must
+    not leak into later requests made through the same shared client.
+    """
+    no_cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.AsyncClient(limits=_POOL_LIMITS, cookies=no_cookies, **kwargs)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the client for the current context (see ``shared_http_client``)."""
+    client = _context_client.get()
+    if client is not None:
+        return client
+    loop = asyncio.get_running_loop()
+    client = _loop_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _new_client()
+        _loop_clients[loop] = client
+    return client
+
+
+@contextlib.asynccontextmanager
+async def shared_http_client(**kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+    """Route every ``http_request`` in this context through one client.
+
+    The client is closed on exit; tasks started inside the block (e.g. via
+    ``asyncio.gather``) inherit it.
+
+    Args:
+        **kwargs: Extra arguments for ``httpx.AsyncClient``
+
+    Example:
+        ```python
+        async with shared_http_client():
+            await asyncio.gather(http_get(url_a), http_get(url_b))
+        ```
+    """
+    async with _new_client(**kwargs) as client:
+        token = _context_client.set(client)
+        try:
+            yield client
+        finally:
+            _context_client.reset(token)
+
+
+# Short-lived cache of successful GET/HEAD results (opt-in per call via
+# ``cache_ttl``): key -> (expiry on the monotonic clock, result).
+_RESPONSE_CACHE_SIZE = 512
+_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+_response_cache: OrderedDict[str, tuple[float, ToolResult]] = OrderedDict()
+
+
+def _response_cache_key(*parts: Any) -> str:
+    """Hash every request input that can change the response (credentials included)."""
+    blob = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+def clear_response_cache() -> None:
+    """Drop every cached HTTP response."""
+    _response_cache.clear()
+
+
 class HTTPMethod(str, Enum):
     """HTTP request methods."""
     GET = "GET"
@@ -133,7 +219,8 @@ async def http_request(
     auth_token: str | None = None,
     timeout: int = 30,
     follow_redirects: bool = True,
-    response_format: str = "auto"
+    response_format: str = "auto",
+    cache_ttl: float = 0.0
 ) -> ToolResult:
     """Make an HTTP request (n8n-style HTTP Request node).
 
@@ -150,6 +237,8 @@ async def http_request(
         timeout: Request timeout in seconds
         follow_redirects: Whether to follow redirects
         response_format: Response format (json, text, binary, auto)
+        cache_ttl: Seconds to reuse a successful GET/HEAD result for an identical
+            request; 0 disables caching
 
     Returns:
         ToolResult with response data
@@ -189,6 +278,20 @@ async def http_request(
             metadata={"method": method, "url": url, "blocked": True}
         )
 
+    cache_key = None
+    if cache_ttl > 0 and method.upper() in _CACHEABLE_METHODS:
+        cache_key = _response_cache_key(
+            method.upper(), url, headers, query_params, auth_type, auth_user,
+            auth_password, auth_token, follow_redirects, response_format
+        )
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if expires_at > time.monotonic():
+                _response_cache.move_to_end(cache_key)
+                return cached_result.model_copy(deep=True)
+            del _response_cache[cache_key]
+
     try:
         # Prepare headers
         request_headers = headers or {}
@@ -216,19 +319,17 @@ async def http_request(
             else:
                 request_body = body
 
-        # Make request
-        async with httpx.AsyncClient(
+        # Make request over the pooled keep-alive client
+        response = await _get_client().request(
+            method=method,
+            url=url,
+            headers=request_headers,
+            params=query_params,
+            content=request_body,
+            auth=auth,
             timeout=timeout,
             follow_redirects=follow_redirects
-        ) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                params=query_params,
-                content=request_body,
-                auth=auth
-            )
+        )
 
         # Parse response
         response_data = {
@@ -243,7 +344,8 @@ async def http_request(
             "application/json" in response.headers.get("content-type", "")
         ):
             try:
-                response_data["body"] = response.json()
+                # Decode the raw bytes (orjson when installed): no intermediate str
+                response_data["body"] = json_loads(response.content)
             except (json.JSONDecodeError, ValueError):
                 response_data["body"] = response.text
         elif response_format == "binary":
@@ -255,7 +357,7 @@ async def http_request(
         # Check if successful
         success = 200 <= response.status_code < 300
 
-        return ToolResult(
+        result = ToolResult(
             success=success,
             output=response_data,
             metadata={
@@ -265,6 +367,15 @@ async def http_request(
             }
         )
 
+        if cache_key is not None and success:
+            expires_at = time.monotonic() + cache_ttl
+            _response_cache[cache_key] = (expires_at, result.model_copy(deep=True))
+            _response_cache.move_to_end(cache_key)
+            while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+
+        return result
+
     except httpx.TimeoutException as e:
         return ToolResult(
             success=False,
@@ -4,10 +4,16 @@
 from __future__ import annotations
 
 import inspect
+import logging
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# Providers whose tool schema is the Anthropic format (everything else: OpenAI)
+_ANTHROPIC_FORMAT_PROVIDERS = frozenset({"anthropic", "anthropic_openai"})
 
 
 class ToolParameterType(str, Enum):
@@ -105,12 +111,57 @@ class Tool(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Provider format name -> schema dict, built on first use. Every agent sharing
+    # this tool reuses it instead of rebuilding the schema per request. Only field
+    # assignment invalidates it: in-place edits (``tool.parameters["x"] = ...``)
+    # are not seen, so reassign the field instead.
+    _schema_cache: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _schema_version: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping cached schemas when the definition changes."""
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            # Rebind rather than clear: model_copy() shares this dict with the original
+            self._schema_cache = {}
+            self._schema_version += 1
+
+    @property
+    def schema_version(self) -> int:
+        """Counter bumped on every field assignment, for callers caching schemas."""
+        return self._schema_version
+
     def to_openai_format(self) -> dict[str, Any]:
         """Convert tool to OpenAI function calling format.
 
+        The schema is cached on the tool and the same dict is returned on every
+        call, so treat it as read-only (``copy.deepcopy`` it before editing).
+        Assigning a field rebuilds it; editing ``parameters`` in place does not.
+
         Returns:
             Tool in OpenAI format
         """
+        schema = self._schema_cache.get("openai")
+        if schema is None:
+            schema = self._schema_cache["openai"] = self._build_openai_format()
+        return schema
+
+    def to_anthropic_format(self) -> dict[str, Any]:
+        """Convert tool to Anthropic tool format.
+
+        Cached like ``to_openai_format``: the returned dict is shared and must
+        not be mutated.
+
+        Returns:
+            Tool in Anthropic format
+        """
+        schema = self._schema_cache.get("anthropic")
+        if schema is None:
+            schema = self._schema_cache["anthropic"] = self._build_anthropic_format()
+        return schema
+
+    def _build_openai_format(self) -> dict[str, Any]:
+        """Build the OpenAI function calling schema (uncached)."""
         properties = {}
         required = []
 
@@ -144,12 +195,8 @@ class Tool(BaseModel):
             }
         }
 
-    def to_anthropic_format(self) -> dict[str, Any]:
-        """Convert tool to Anthropic tool format.
-
-        Returns:
-            Tool in Anthropic format
-        """
+    def _build_anthropic_format(self) -> dict[str, Any]:
+        """Build the Anthropic tool schema (uncached)."""
         input_schema = {
             "type": "object",
             "properties": {},
@@ -260,6 +307,12 @@ class ToolRegistry:
     def __init__(self):
         """Initialize the tool registry."""
         self._tools: dict[str, Tool] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change, for callers caching derived payloads."""
+        return self._version
 
     def register(self, tool: Tool) -> None:
         """Register a tool.
@@ -268,6 +321,16 @@ class ToolRegistry:
             tool: Tool to register
         """
         self._tools[tool.name] = tool
+        self._version += 1
+
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """Register several tools in one call.
+
+        Args:
+            tools: Tools to register (later duplicates replace earlier ones)
+        """
+        self._tools.update((tool.name, tool) for tool in tools)
+        self._version += 1
 
     def register_function(
             self,
@@ -357,25 +420,36 @@ class ToolRegistry:
         """
         return list(self._tools.values())
 
-    def get_tools_for_provider(self, provider: str) -> list[dict[str, Any]]:
+    def get_tools_for_provider(
+            self,
+            provider: str,
+            names: list[str] | None = None
+    ) -> list[dict[str, Any]]:
         """Get tools in provider-specific format.
 
         Args:
             provider: Provider name (openai, anthropic, etc.)
+            names: Only include these tools, resolved by name lookup (all
+                registered tools if None); unknown names are skipped with a warning
 
         Returns:
             Tools in provider format
         """
-        tools = []
-        for tool in self._tools.values():
-            if provider in ["openai", "openrouter", "grok", "databricks"]:
-                tools.append(tool.to_openai_format())
-            elif provider in ["anthropic", "anthropic_openai"]:
-                tools.append(tool.to_anthropic_format())
-            else:
-                # Default to OpenAI format
-                tools.append(tool.to_openai_format())
-        return tools
+        if names is None:
+            selected = list(self._tools.values())
+        else:
+            selected = []
+            for name in names:
+                tool = self._tools.get(name)
+                if tool is None:
+                    logger.warning(f"Tool '{name}' is not registered; skipping")
+                else:
+                    selected.append(tool)
+
+        if provider in _ANTHROPIC_FORMAT_PROVIDERS:
+            return [tool.to_anthropic_format() for tool in selected]
+        # OpenAI format (openai, openrouter, grok, databricks and the default)
+        return [tool.to_openai_format() for tool in selected]
 
     def unregister(self, name: str) -> bool:
         """Unregister a tool.
@@ -388,9 +462,11 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._version += 1
             return True
         return False
 
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
+        self._version += 1
@@ -161,6 +161,8 @@ class ScheduleTrigger(BaseTrigger):
     def __init__(self, config: TriggerConfig, callback: Callable[[TriggerEvent], None]):
         super().__init__(config, callback)
         self.cron_expression = config.config.get("cron", "0 * * * *")  # Default: hourly
+        # Parse the expression once (and fail fast on a bad one); each run only rebases it
+        self._cron = croniter(self.cron_expression, datetime.now())
         self._task = None
 
     async def start(self) -> None:
@@ -183,7 +185,8 @@ class ScheduleTrigger(BaseTrigger):
 
     async def _run(self) -> None:
         """Run the schedule loop."""
-        cron = croniter(self.cron_expression, datetime.now())
+        cron = self._cron
+        cron.set_current(datetime.now())
 
         while self._running:
             next_run = cron.get_next(datetime)
@@ -422,16 +425,15 @@ class TriggerManager:
             await self.triggers[trigger_id].stop()
 
     async def start_all(self) -> None:
-        """Start all triggers."""
-        for trigger in self.triggers.values():
-            if trigger.config.enabled:
-                await trigger.start()
+        """Start all enabled triggers concurrently."""
+        await asyncio.gather(
+            *(trigger.start() for trigger in self.triggers.values() if trigger.config.enabled)
+        )
         logger.info(f"Started {len(self.triggers)} triggers")
 
     async def stop_all(self) -> None:
-        """Stop all triggers."""
-        for trigger in self.triggers.values():
-            await trigger.stop()
+        """Stop all triggers concurrently."""
+        await asyncio.gather(*(trigger.stop() for trigger in self.triggers.values()))
         logger.info("Stopped all triggers")
 
     def get_status(self) -> dict[str, dict[str, Any]]:
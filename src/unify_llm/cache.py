@@ -0,0 +1,161 @@
+"""进程内 LRU + 可选 SQLite 落盘的响应缓存:相同请求直接返回上次的 ChatResponse,不走网络。
+
+键是 ``(provider, base_url, 规范化后的整个 ChatRequest)`` 的 blake2b 摘要:model、messages、
+采样参数、tools 等任一不同即视为不同请求;同一 provider 指向不同端点(自建网关、代理、兼容服务)
+的响应也互不串用。只有确定性请求才值得缓存,故 ``UnifyLLM`` 默认只缓存
+``temperature == 0`` 的调用,``cache="force"`` 时才对采样请求也读写缓存(演示/回放场景)。
+
+``normalize_prompts=True`` 时,user 消息先做大小写/空白归一再算键:措辞只差大小写或空格的重复
+提问(演示、回放里常见)也能命中。这是精确匹配的廉价近似,不做 embedding 语义检索。
+
+SQLite 读写很短,且由一把线程锁串行化;async 路径也直接同步调用(单次 µs 到 ms 级),
+不为此引入线程池。
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from unify_llm.models import ChatRequest, ChatResponse
+
+
+class ResponseCache:
+    """按请求内容缓存 ChatResponse:内存 LRU 在前,SQLite(可选)在后。
+
+    Example:
+        ```python
+        from unify_llm import ResponseCache, UnifyLLM
+
+        cache = ResponseCache(path=".unify_llm_cache.sqlite")
+        client = UnifyLLM(provider="openai", response_cache=cache)
+        client.chat(model="gpt-4o", messages=[...], temperature=0)  # 首次走网络
+        client.chat(model="gpt-4o", messages=[...], temperature=0)  # 命中缓存
+        ```
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: str | Path | None = None,
+        normalize_prompts: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept in the in-memory LRU.
+            path: SQLite file for persistence across processes/runs; None keeps the
+                cache in memory only.
+            normalize_prompts: Key user messages case- and whitespace-insensitively, so
+                prompts differing only in those share an entry.
+
+        Raises:
+            ValueError: If ``maxsize`` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.normalize_prompts = normalize_prompts
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, ChatResponse] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses"
+                " (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        request: ChatRequest,
+        *,
+        normalize: bool = False,
+        base_url: str | None = None,
+    ) -> str:
+        """由 provider、端点与请求内容(不含 ``stream`` / ``prompt_caching`` 标志)算出稳定的缓存键。
+
+        ``base_url`` 为 None 表示 provider 的默认端点,此时键与不带端点时相同(已落盘的缓存
+        仍可命中);末尾的 ``/`` 不影响键。``normalize`` 为 True 时 user 消息文本先转小写并
+        折叠空白;system/assistant/tool 消息保持原样(工具输出的大小写可能有意义)。
+        """
+        payload = request.model_dump(mode="json", exclude={"stream", "prompt_caching"})
+        if normalize:
+            for message in payload["messages"]:
+                if message.get("role") == "user" and isinstance(message.get("content"), str):
+                    message["content"] = " ".join(message["content"].lower().split())
+        endpoint: list[str] = [provider.lower()]
+        if base_url is not None:
+            endpoint.append(base_url.rstrip("/"))
+        blob = json.dumps([*endpoint, payload], sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+    def key_for(self, provider: str, request: ChatRequest, base_url: str | None = None) -> str:
+        """按本缓存的归一设置算键(``UnifyLLM`` 走这里,并传入自己的 base_url)。"""
+        return self.make_key(provider, request, normalize=self.normalize_prompts, base_url=base_url)
+
+    def _remember(self, key: str, response: ChatResponse) -> None:
+        """写入内存 LRU 并按容量淘汰最久未用的项(须持锁)。"""
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> ChatResponse | None:
+        """Look up a cached response (memory first, then SQLite).
+
+        Args:
+            key: Key from ``make_key``.
+
+        Returns:
+            A copy of the cached response, or None on a miss.
+        """
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    response = ChatResponse.model_validate_json(row[0])
+                    self._remember(key, response)
+        # 返回副本:调用方改动返回值不应污染缓存。
+        return response.model_copy(deep=True) if response is not None else None
+
+    def set(self, key: str, response: ChatResponse) -> None:
+        """Store a response under ``key`` (memory and, if configured, SQLite).
+
+        Args:
+            key: Key from ``make_key``.
+            response: Response to cache.
+        """
+        stored = response.model_copy(deep=True)
+        with self._lock:
+            self._remember(key, stored)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, stored.model_dump_json()),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every cached response (memory and SQLite)."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any (the in-memory LRU stays usable)."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
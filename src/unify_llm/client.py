@@ -1,10 +1,18 @@
 """Unified client for LLM providers(兼容门面:内部委托 ports.factory 的唯一注册表/装配缝)。"""
 
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Iterator
-from typing import ClassVar
+from typing import ClassVar, Literal
+
+import httpx
 
 from unify_llm.adapters.base import BaseProvider
+from unify_llm.cache import ResponseCache
 from unify_llm.core.exceptions import InvalidRequestError
+from unify_llm.limiter import ClientRateLimiter
 from unify_llm.models import (
     ChatRequest,
     ChatResponse,
@@ -17,6 +25,17 @@ from unify_llm.ports.factory import ProviderBuilder
 from unify_llm.ports.llm import LLMProvider
 from unify_llm.utils import get_api_key_from_env, resolve_model_name
 
+# provider 池:同一事件循环内,同一 (provider, builder, 连接配置) 复用同一 provider 实例及其 httpx
+# 连接池,免去每构造一次 UnifyLLM 就新建连接池、重做 TCP+TLS 握手。httpx.AsyncClient 绑定创建它的
+# 事件循环,故按运行中的循环分桶(循环被回收或关闭后整桶丢弃);不在运行中的循环里构造时不入池。
+# 每桶按 LRU 限 _POOL_MAX_PER_LOOP 个;builder 入键:重注册同名 provider 后旧条目自然失配。
+# 构造是同步的,一把 threading.Lock 即可串行化"查池-建-入池"。
+_POOL_MAX_PER_LOOP = 32
+_PROVIDER_POOL: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, OrderedDict[tuple[object, ...], LLMProvider]
+] = weakref.WeakKeyDictionary()
+_POOL_LOCK = threading.Lock()
+
 
 class UnifyLLM:
     """Unified client for calling various LLM APIs.
@@ -59,6 +78,10 @@ class UnifyLLM:
         max_retries: int = 3,
         organization: str | None = None,
         extra_headers: dict[str, str] | None = None,
+        reuse_provider: bool = True,
+        rate_limiter: ClientRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the UnifyLLM client.
 
@@ -71,6 +94,16 @@ class UnifyLLM:
             max_retries: Maximum number of retry attempts
             organization: Organization ID (for providers that support it)
             extra_headers: Additional headers to include in requests
+            reuse_provider: Reuse a provider (and its HTTP connection pool) built earlier in
+                the same running event loop with the same provider/config; outside a running
+                loop, or with False, a private one is built
+            rate_limiter: Optional client-side RPM/TPM limiter; requests wait locally for
+                quota instead of being sent only to come back as 429 (share one instance
+                across clients for a process-wide limit)
+            response_cache: Optional response cache consulted by ``chat``/``achat``; by
+                default only deterministic (``temperature == 0``) requests are cached
+            http_client: Optional shared async HTTP client for the provider (e.g. one
+                larger pool reused by several clients); it is owned, and closed, by the caller
 
         Raises:
             InvalidRequestError: If the provider is not supported
@@ -91,8 +124,99 @@ class UnifyLLM:
 
         # 委托唯一装配缝纯查表构造(未知 provider → InvalidRequestError)。
         # 门面语义:显式选定即如实构造,不做 Mock 回退(缺 key 留到调用时报错)。
-        self._provider: LLMProvider = factory.build(provider, config)
+        if reuse_provider:
+            self._provider: LLMProvider = self._pooled_provider(provider, config, http_client)
+        else:
+            self._provider = factory.build(provider, config, async_client=http_client)
         self._provider_name = provider  # Save for model name resolution
+        self._base_url = base_url  # Part of the response-cache key
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+
+    @staticmethod
+    def _pooled_provider(
+        provider: str, config: ProviderConfig, http_client: httpx.AsyncClient | None = None
+    ) -> LLMProvider:
+        """按 (provider, builder, 连接配置, 注入客户端) 从当前循环的池取 provider,未命中则构造入池。
+
+        不在运行中的事件循环里时直接新建私有 provider;池里 HTTP 客户端已关闭的条目作废重建。
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return factory.build(provider, config, async_client=http_client)
+        key: tuple[object, ...] = (
+            provider.lower(),
+            factory.REGISTRY.get(provider.lower()),
+            config.api_key,
+            config.base_url,
+            config.timeout,
+            config.max_retries,
+            config.organization,
+            tuple(sorted(config.extra_headers.items())),
+            http_client,  # 按身份区分:注入不同共享客户端的 provider 不能互相复用
+        )
+        with _POOL_LOCK:
+            for closed in [other for other in _PROVIDER_POOL if other.is_closed()]:
+                del _PROVIDER_POOL[closed]
+            bucket = _PROVIDER_POOL.get(loop)
+            if bucket is None:
+                bucket = _PROVIDER_POOL[loop] = OrderedDict()
+            pooled = bucket.get(key)
+            if pooled is None or (
+                isinstance(pooled, BaseProvider) and pooled.async_client.is_closed
+            ):
+                pooled = factory.build(provider, config, async_client=http_client)
+                bucket[key] = pooled
+                if len(bucket) > _POOL_MAX_PER_LOOP:
+                    # 淘汰只是出池,不关闭:仍持有它的客户端照常可用,随其回收释放
+                    bucket.popitem(last=False)
+            else:
+                bucket.move_to_end(key)
+            return pooled
+
+    @classmethod
+    def clear_provider_pool(cls) -> None:
+        """Drop every pooled provider, for all event loops (e.g. in tests).
+
+        Pooled providers are not closed here: callers still holding a client keep a working
+        provider, and owned sync clients are released when the provider is collected.
+        """
+        with _POOL_LOCK:
+            _PROVIDER_POOL.clear()
+
+    @classmethod
+    async def aclose_provider_pool(cls) -> None:
+        """Remove the running loop's pooled providers and close their owned HTTP clients.
+
+        Call it before the loop shuts down to release pooled connections promptly. Clients
+        still holding one of these providers must not be used afterwards.
+        """
+        with _POOL_LOCK:
+            bucket = _PROVIDER_POOL.pop(asyncio.get_running_loop(), None)
+        for pooled in (bucket or {}).values():
+            if isinstance(pooled, BaseProvider):
+                await pooled.aclose()
+                pooled.close()
+
+    def warmup(self, timeout: float = 3.0) -> None:
+        """Pre-open a keep-alive connection to the provider (moves the TLS handshake off
+        the first request's critical path). No-op for providers without an HTTP pool.
+
+        Args:
+            timeout: Timeout in seconds for the warmup request
+        """
+        if isinstance(self._provider, BaseProvider):
+            self._provider.warmup(timeout)
+
+    async def awarmup(self, timeout: float = 3.0) -> None:
+        """Async counterpart of ``warmup`` (warms the async connection pool).
+
+        Args:
+            timeout: Timeout in seconds for the warmup request
+        """
+        if isinstance(self._provider, BaseProvider):
+            await self._provider.awarmup(timeout)
 
     @classmethod
     def register_provider(cls, name: str, provider_class: type[BaseProvider]) -> None:
@@ -135,6 +259,7 @@ class UnifyLLM:
         tool_choice: str | dict[str, object] | None = None,
         response_format: dict[str, str] | None = None,
         user: str | None = None,
+        prompt_caching: bool = False,
         extra_params: dict[str, object] | None = None,
     ) -> ChatRequest:
         """Prepare a chat request (shared logic for sync/async methods).
@@ -170,9 +295,18 @@ class UnifyLLM:
             tool_choice=tool_choice,
             response_format=response_format,
             user=user,
+            prompt_caching=prompt_caching,
             extra_params=extra_params or {},
         )
 
+    def _cache_key(self, request: ChatRequest, cache: bool | Literal["force"]) -> str | None:
+        """请求可缓存时返回其缓存键,否则 None(未配缓存 / 关闭 / 非确定性且未 force)。"""
+        if self._response_cache is None or not cache:
+            return None
+        if cache != "force" and request.temperature != 0:
+            return None
+        return self._response_cache.key_for(self._provider_name, request, self._base_url)
+
     def chat(
         self,
         model: str,
@@ -187,6 +321,8 @@ class UnifyLLM:
         tool_choice: str | dict[str, object] | None = None,
         response_format: dict[str, str] | None = None,
         user: str | None = None,
+        prompt_caching: bool = False,
+        cache: bool | Literal["force"] = True,
         **extra_params: object,
     ) -> ChatResponse:
         """Make a synchronous chat request.
@@ -204,6 +340,11 @@ class UnifyLLM:
             tool_choice: How to select tools
             response_format: Desired response format
             user: Unique identifier for the end-user
+            prompt_caching: Mark the system prompt and last user message as prompt-cache
+                breakpoints (Anthropic / Claude-on-Databricks; ignored by other providers)
+            cache: Use the client's response cache (if one is configured): True caches
+                only deterministic requests (temperature 0), "force" caches any request,
+                False bypasses the cache
             **extra_params: Provider-specific extra parameters
 
         Returns:
@@ -237,9 +378,20 @@ class UnifyLLM:
             tool_choice=tool_choice,
             response_format=response_format,
             user=user,
+            prompt_caching=prompt_caching,
             extra_params=extra_params,
         )
-        return self._provider.chat(request)
+        cache_key = self._cache_key(request, cache)
+        if cache_key is not None and self._response_cache is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire_sync(self._provider_name, request)
+        response = self._provider.chat(request)
+        if cache_key is not None and self._response_cache is not None:
+            self._response_cache.set(cache_key, response)
+        return response
 
     async def achat(
         self,
@@ -255,6 +407,8 @@ class UnifyLLM:
         tool_choice: str | dict[str, object] | None = None,
         response_format: dict[str, str] | None = None,
         user: str | None = None,
+        prompt_caching: bool = False,
+        cache: bool | Literal["force"] = True,
         **extra_params: object,
     ) -> ChatResponse:
         """Make an asynchronous chat request.
@@ -283,9 +437,20 @@ class UnifyLLM:
             tool_choice=tool_choice,
             response_format=response_format,
             user=user,
+            prompt_caching=prompt_caching,
             extra_params=extra_params,
         )
-        return await self._provider.achat(request)
+        cache_key = self._cache_key(request, cache)
+        if cache_key is not None and self._response_cache is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(self._provider_name, request)
+        response = await self._provider.achat(request)
+        if cache_key is not None and self._response_cache is not None:
+            self._response_cache.set(cache_key, response)
+        return response
 
     def chat_stream(
         self,
@@ -300,6 +465,7 @@ class UnifyLLM:
         tools: list[dict[str, object]] | None = None,
         tool_choice: str | dict[str, object] | None = None,
         user: str | None = None,
+        prompt_caching: bool = False,
         **extra_params: object,
     ) -> Iterator[StreamChunk]:
         """Make a synchronous streaming chat request.
@@ -333,8 +499,11 @@ class UnifyLLM:
             tools=tools,
             tool_choice=tool_choice,
             user=user,
+            prompt_caching=prompt_caching,
             extra_params=extra_params,
         )
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire_sync(self._provider_name, request)
         yield from self._provider.chat_stream(request)
 
     async def achat_stream(
@@ -350,6 +519,7 @@ class UnifyLLM:
         tools: list[dict[str, object]] | None = None,
         tool_choice: str | dict[str, object] | None = None,
         user: str | None = None,
+        prompt_caching: bool = False,
         **extra_params: object,
     ) -> AsyncIterator[StreamChunk]:
         """Make an asynchronous streaming chat request.
@@ -379,7 +549,10 @@ class UnifyLLM:
             tools=tools,
             tool_choice=tool_choice,
             user=user,
+            prompt_caching=prompt_caching,
             extra_params=extra_params,
         )
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(self._provider_name, request)
         async for chunk in self._provider.achat_stream(request):
             yield chunk
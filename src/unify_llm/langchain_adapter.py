@@ -9,6 +9,9 @@ from __future__ import annotations
 
 from typing import AsyncIterator, Iterator, List, Optional, Union
 
+import httpx
+
+from unify_llm.cache import ResponseCache
 from unify_llm.client import UnifyLLM
 from unify_llm.models import Message
 
@@ -51,6 +54,8 @@ class LangChainAdapter:
         max_retries: int = 3,
         organization: str | None = None,
         extra_headers: dict | None = None,
+        response_cache: ResponseCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """Initialize the LangChain adapter.
 
@@ -62,6 +67,8 @@ class LangChainAdapter:
             max_retries: Maximum number of retry attempts
             organization: Organization ID (for providers that support it)
             extra_headers: Additional headers to include in requests
+            response_cache: Optional response cache for invoke/ainvoke (see ``UnifyLLM``)
+            http_client: Optional shared async HTTP client (see ``UnifyLLM``)
         """
         self.client = UnifyLLM(
             provider=provider,
@@ -71,6 +78,8 @@ class LangChainAdapter:
             max_retries=max_retries,
             organization=organization,
             extra_headers=extra_headers,
+            response_cache=response_cache,
+            http_client=http_client,
         )
         self._default_model: str | None = None
 
@@ -285,6 +294,22 @@ class LangChainAdapter:
         """
         self._default_model = model
 
+    def warmup(self, timeout: float = 3.0) -> None:
+        """Pre-open a connection to the provider (see ``UnifyLLM.warmup``).
+
+        Args:
+            timeout: Timeout in seconds for the warmup request
+        """
+        self.client.warmup(timeout)
+
+    async def awarmup(self, timeout: float = 3.0) -> None:
+        """Async version of warmup (see ``UnifyLLM.awarmup``).
+
+        Args:
+            timeout: Timeout in seconds for the warmup request
+        """
+        await self.client.awarmup(timeout)
+
     def get_raw_client(self) -> UnifyLLM:
         """Get the underlying UnifyLLM client.
 
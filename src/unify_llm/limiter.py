@@ -0,0 +1,103 @@
+"""客户端侧 RPM/TPM 令牌桶:在本地排队,而不是把注定 429 的请求发出去再退避。
+
+``ClientRateLimiter`` 按 (provider, model) 各维护一对令牌桶(请求数 + 估算 token 数),额度不足时
+阻塞到桶回满为止(async 走 ``asyncio.sleep``,sync 走 ``time.sleep``),从不拒绝请求。一个实例可由
+多个 UnifyLLM 共享,从而对同一组配额做进程级全局限流。
+
+与网关的 ``gateway.ratelimit`` 不同:后者对入站应用 key 做拒绝式限流(超额即 429),本模块对出站
+上游调用做排队式限流,且不依赖网关子树(不拉 fastapi)。
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+from unify_llm.models import ChatRequest
+from unify_llm.utils import estimate_tokens
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """单个令牌桶的可变状态。"""
+
+    tokens: float
+    last: float
+
+
+class ClientRateLimiter:
+    """按 (provider, model) 的 RPM/TPM 令牌桶,额度不足时等待而非报错。
+
+    Example:
+        ```python
+        from unify_llm import ClientRateLimiter, UnifyLLM
+
+        limiter = ClientRateLimiter(rpm=500, tpm=90_000)
+        a = UnifyLLM(provider="openai", rate_limiter=limiter)
+        b = UnifyLLM(provider="openai", rate_limiter=limiter)  # 与 a 共用同一组桶
+        ```
+    """
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rpm: Requests per minute per (provider, model); None disables the request bucket.
+            tpm: Estimated tokens per minute per (provider, model); None disables the token
+                bucket.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if (rpm is not None and rpm <= 0) or (tpm is not None and tpm <= 0):
+            raise ValueError("rpm/tpm limits must be positive")
+        self.rpm = rpm
+        self.tpm = tpm
+        # 桶状态的读改写极短,一把线程锁同时服务 sync 与 async 调用方(等待发生在锁外)。
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple[str, str, str], _Bucket] = {}
+
+    @staticmethod
+    def estimate_request_tokens(request: ChatRequest) -> int:
+        """估算一次请求消耗的 token:全部消息文本 + 请求的 max_tokens 上限。"""
+        prompt = "".join(msg.content or "" for msg in request.messages)
+        return estimate_tokens(prompt) + (request.max_tokens or 0)
+
+    def _take(self, key: tuple[str, str, str], capacity: float, cost: float) -> float:
+        """尝试从桶 ``key`` 扣 ``cost``(须持锁);成功返回 0,否则返回还需等待的秒数。"""
+        now = time.monotonic()
+        refill_per_sec = capacity / 60.0
+        bucket = self._buckets.setdefault(key, _Bucket(tokens=capacity, last=now))
+        bucket.tokens = min(capacity, bucket.tokens + (now - bucket.last) * refill_per_sec)
+        bucket.last = now
+        # 单次估算超过整桶容量时按满桶计,否则该请求永远等不到。
+        cost = min(cost, capacity)
+        if bucket.tokens >= cost:
+            bucket.tokens -= cost
+            return 0.0
+        return (cost - bucket.tokens) / refill_per_sec
+
+    def _reserve(self, provider: str, model: str, tokens: int) -> float:
+        """两个桶都有额度才一起扣;否则都不扣,返回需等待的秒数。"""
+        with self._lock:
+            wait = 0.0
+            if self.rpm is not None:
+                wait = self._take((provider, model, "req"), float(self.rpm), 1.0)
+            if wait == 0.0 and self.tpm is not None:
+                wait = self._take((provider, model, "tok"), float(self.tpm), float(tokens))
+                if wait > 0.0 and self.rpm is not None:
+                    # token 桶不够:退还已扣的请求令牌,保持两桶原子。
+                    self._buckets[(provider, model, "req")].tokens += 1.0
+            return wait
+
+    async def acquire(self, provider: str, request: ChatRequest) -> None:
+        """异步等待直到 ``request`` 在其 (provider, model) 桶内有额度。"""
+        tokens = self.estimate_request_tokens(request)
+        while (wait := self._reserve(provider, request.model, tokens)) > 0.0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, provider: str, request: ChatRequest) -> None:
+        """同步版 ``acquire``(阻塞当前线程)。"""
+        tokens = self.estimate_request_tokens(request)
+        while (wait := self._reserve(provider, request.model, tokens)) > 0.0:
+            time.sleep(wait)
@@ -70,11 +70,15 @@ class Usage(BaseModel):
         prompt_tokens: Number of tokens in the prompt
         completion_tokens: Number of tokens in the completion
         total_tokens: Total number of tokens used
+        cache_creation_input_tokens: Prompt tokens written to the provider's prompt cache
+        cache_read_input_tokens: Prompt tokens served from the provider's prompt cache
     """
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
 
 class ChatRequest(BaseModel):
@@ -94,6 +98,8 @@ class ChatRequest(BaseModel):
         tool_choice: How to select tools
         response_format: Desired response format
         user: Unique identifier for the end-user
+        prompt_caching: Mark the system prompt and the last user message as prompt-cache
+            breakpoints on providers that support it (ignored elsewhere)
         extra_params: Provider-specific extra parameters
     """
 
@@ -110,6 +116,7 @@ class ChatRequest(BaseModel):
     tool_choice: str | dict[str, object] | None = None
     response_format: dict[str, str] | None = None
     user: str | None = None
+    prompt_caching: bool = False
     extra_params: dict[str, object] = Field(default_factory=dict)
 
     @field_validator("messages")
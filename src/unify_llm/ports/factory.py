@@ -6,28 +6,18 @@
 - ``build(provider, config)``:门面(UnifyLLM)用的纯查表构造,不做 Mock 回退(保持历史语义:
   显式选定的 provider 就如实构造,缺 key 留到调用时报错)。
 - ``REGISTRY`` / ``register``:把原 client.UnifyLLM._providers 收编于此,作为唯一 provider 表。
+  内置 provider 以 ``_LazyBuilder`` 登记:adapter 模块在该 provider 首次被构造时才导入,
+  ``from unify_llm import UnifyLLM`` 不再为用不到的 provider 付导入开销。
 """
 
+import importlib
 import os
 from typing import Protocol, runtime_checkable
 
 import httpx
 
-from unify_llm.adapters.anthropic import AnthropicProvider
-from unify_llm.adapters.anthropic_openai import AnthropicOpenAIProvider
 from unify_llm.adapters.base import BaseProvider
-from unify_llm.adapters.databricks import DatabricksProvider
-from unify_llm.adapters.gemini import GeminiProvider
 from unify_llm.adapters.mock import MockProvider
-from unify_llm.adapters.ollama import OllamaProvider
-from unify_llm.adapters.openai_compatible import (
-    ByteDanceProvider,
-    DeepSeekProvider,
-    GrokProvider,
-    OpenAIProvider,
-    OpenRouterProvider,
-)
-from unify_llm.adapters.qwen import QwenProvider
 from unify_llm.core.exceptions import AuthenticationError, InvalidRequestError
 from unify_llm.core.settings import get_settings
 from unify_llm.models import ProviderConfig
@@ -50,19 +40,45 @@ class ProviderBuilder(Protocol):
     ) -> BaseProvider: ...
 
 
+class _LazyBuilder:
+    """按 (模块, 类名) 延迟导入的 builder:首次构造该 provider 时才 import 其 adapter 模块。"""
+
+    __slots__ = ("_builder", "_target")
+
+    def __init__(self, module_name: str, attr: str) -> None:
+        self._target = (module_name, attr)
+        self._builder: ProviderBuilder | None = None
+
+    def __call__(
+        self,
+        config: ProviderConfig,
+        *,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ) -> BaseProvider:
+        if self._builder is None:
+            module_name, attr = self._target
+            self._builder = getattr(importlib.import_module(module_name), attr)
+        return self._builder(config, client=client, async_client=async_client)
+
+
+_OPENAI_COMPATIBLE = "unify_llm.adapters.openai_compatible"
+
 # 唯一 provider 注册表(收编自 client.UnifyLLM._providers)。
 REGISTRY: dict[str, ProviderBuilder] = {
-    "openai": OpenAIProvider,
-    "grok": GrokProvider,
-    "openrouter": OpenRouterProvider,
-    "bytedance": ByteDanceProvider,
-    "deepseek": DeepSeekProvider,
-    "anthropic": AnthropicProvider,
-    "anthropic_openai": AnthropicOpenAIProvider,
-    "gemini": GeminiProvider,
-    "qwen": QwenProvider,
-    "ollama": OllamaProvider,
-    "databricks": DatabricksProvider,
+    "openai": _LazyBuilder(_OPENAI_COMPATIBLE, "OpenAIProvider"),
+    "grok": _LazyBuilder(_OPENAI_COMPATIBLE, "GrokProvider"),
+    "openrouter": _LazyBuilder(_OPENAI_COMPATIBLE, "OpenRouterProvider"),
+    "bytedance": _LazyBuilder(_OPENAI_COMPATIBLE, "ByteDanceProvider"),
+    "deepseek": _LazyBuilder(_OPENAI_COMPATIBLE, "DeepSeekProvider"),
+    "anthropic": _LazyBuilder("unify_llm.adapters.anthropic", "AnthropicProvider"),
+    "anthropic_openai": _LazyBuilder(
+        "unify_llm.adapters.anthropic_openai", "AnthropicOpenAIProvider"
+    ),
+    "gemini": _LazyBuilder("unify_llm.adapters.gemini", "GeminiProvider"),
+    "qwen": _LazyBuilder("unify_llm.adapters.qwen", "QwenProvider"),
+    "ollama": _LazyBuilder("unify_llm.adapters.ollama", "OllamaProvider"),
+    "databricks": _LazyBuilder("unify_llm.adapters.databricks", "DatabricksProvider"),
 }
 
 
@@ -0,0 +1,223 @@
+"""多 key / 多 provider 负载均衡路由(litellm.Router 风格)。
+
+一个公开 model 名可以挂多个部署(不同 key、不同区域乃至不同 provider),``UnifyRouter`` 按策略
+挑一个发请求:把负载摊到多条 RPM/TPM 配额上,而不是全部压在单个 key 的桶里。可重试类错误
+(429 / 超时 / 5xx / 网络错)不原地退避,而是立即换下一个部署重发(failover);出错的部署随后
+冷却一段时间(429 带 ``retry_after`` 时取两者较大值),冷却期内各策略都先跳过它,免得每个请求
+都先在它身上白跑一趟。
+
+策略:
+- ``simple-shuffle``:按 ``rpm`` 加权随机(未配 rpm 的部署权重 1);
+- ``least-busy``:选当前在途请求最少的部署;
+- ``latency``:选延迟 EWMA 最低的部署(未测过的部署视为 0,先被探测)。
+
+候选部署全在冷却时不拒绝请求,照常按策略在全部候选中挑选。
+"""
+
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from unify_llm.client import UnifyLLM
+from unify_llm.core.exceptions import (
+    APIError,
+    InvalidRequestError,
+    ProviderError,
+    RateLimitError,
+    TimeoutError,
+)
+from unify_llm.models import ChatResponse, Message
+
+RoutingStrategy = Literal["simple-shuffle", "least-busy", "latency"]
+
+_STRATEGIES: frozenset[str] = frozenset({"simple-shuffle", "least-busy", "latency"})
+
+# 换部署重发的错误类:配额/超时/上游 5xx/网络错都与具体部署相关,换一个大概率能成。
+_FAILOVER_ERRORS: tuple[type[Exception], ...] = (
+    RateLimitError,
+    TimeoutError,
+    APIError,
+    ProviderError,
+)
+
+
+@dataclass(slots=True)
+class RouterDeployment:
+    """一个可路由部署:公开 model 名 → (客户端, 上游 model),附配额与运行期统计。
+
+    Attributes:
+        model_name: 对调用方公开的 model 名(同名部署组成一个负载均衡组)。
+        client: 发请求用的 UnifyLLM(各自的 provider / key / base_url)。
+        model: 发往该部署的上游 model 名。
+        rpm: 该部署的每分钟请求配额(仅作 ``simple-shuffle`` 权重)。
+        tpm: 该部署的每分钟 token 配额(信息性)。
+        inflight: 当前在途请求数(``least-busy`` 依据)。
+        ewma_latency: 成功请求耗时的指数滑动平均,秒(``latency`` 依据)。
+        cooldown_until: 冷却截止时刻(``time.monotonic()`` 时钟);此前 ``_pick`` 优先跳过它。
+    """
+
+    model_name: str
+    client: UnifyLLM
+    model: str
+    rpm: int | None = None
+    tpm: int | None = None
+    inflight: int = field(default=0, init=False)
+    ewma_latency: float = field(default=0.0, init=False)
+    cooldown_until: float = field(default=0.0, init=False)
+
+
+class UnifyRouter:
+    """把同一公开 model 的请求按策略分发到多个部署,失败自动换部署重发。
+
+    Example:
+        ```python
+        from unify_llm import RouterDeployment, UnifyLLM, UnifyRouter
+
+        router = UnifyRouter(
+            [
+                RouterDeployment("gpt", UnifyLLM(provider="openai", api_key="sk-a"), "gpt-4o"),
+                RouterDeployment("gpt", UnifyLLM(provider="openai", api_key="sk-b"), "gpt-4o"),
+            ],
+            strategy="least-busy",
+        )
+        response = await router.achat("gpt", [{"role": "user", "content": "Hello!"}])
+        ```
+    """
+
+    def __init__(
+        self,
+        deployments: Sequence[RouterDeployment],
+        strategy: RoutingStrategy = "simple-shuffle",
+        *,
+        latency_alpha: float = 0.3,
+        cooldown: float = 5.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            deployments: All routable deployments (grouped by ``model_name``).
+            strategy: Deployment selection strategy.
+            latency_alpha: EWMA smoothing factor for the ``latency`` strategy (0, 1].
+            cooldown: Seconds a deployment is skipped after a failover error (0 disables).
+            rng: Random source for ``simple-shuffle`` (inject a seeded one for tests).
+
+        Raises:
+            ValueError: If no deployments are given or the strategy is unknown.
+        """
+        if not deployments:
+            raise ValueError("UnifyRouter requires at least one deployment")
+        if strategy not in _STRATEGIES:
+            available = ", ".join(sorted(_STRATEGIES))
+            raise ValueError(f"Unknown routing strategy '{strategy}'. Available: {available}")
+        self.deployments = list(deployments)
+        self.strategy = strategy
+        self._alpha = latency_alpha
+        self._cooldown = cooldown
+        self._rng = rng if rng is not None else random.Random()
+
+    def _candidates(self, model: str) -> list[RouterDeployment]:
+        """取挂在公开 model 名下的全部部署(无 → InvalidRequestError)。"""
+        candidates = [d for d in self.deployments if d.model_name == model]
+        if not candidates:
+            available = ", ".join(sorted({d.model_name for d in self.deployments}))
+            raise InvalidRequestError(
+                f"No deployment for model '{model}'. Available models: {available}"
+            )
+        return candidates
+
+    def _pick(self, candidates: list[RouterDeployment]) -> RouterDeployment:
+        """按策略从候选部署中挑一个(冷却中的部署仅在别无选择时参与)。"""
+        now = time.monotonic()
+        candidates = [d for d in candidates if d.cooldown_until <= now] or candidates
+        if self.strategy == "least-busy":
+            return min(candidates, key=lambda d: d.inflight)
+        if self.strategy == "latency":
+            return min(candidates, key=lambda d: d.ewma_latency)
+        weights = [d.rpm or 1 for d in candidates]
+        return self._rng.choices(candidates, weights=weights)[0]
+
+    def _record_failure(self, deployment: RouterDeployment, error: Exception) -> None:
+        """让出错的部署冷却 ``cooldown`` 秒(429 给出更长的 ``retry_after`` 时按它)。"""
+        cooldown = self._cooldown
+        if isinstance(error, RateLimitError) and error.retry_after:
+            cooldown = max(cooldown, float(error.retry_after))
+        deployment.cooldown_until = time.monotonic() + cooldown
+
+    def _record_latency(self, deployment: RouterDeployment, elapsed: float) -> None:
+        """把一次成功请求的耗时并入该部署的延迟 EWMA(首个样本直接落值)。"""
+        if deployment.ewma_latency == 0.0:
+            deployment.ewma_latency = elapsed
+        else:
+            deployment.ewma_latency += self._alpha * (elapsed - deployment.ewma_latency)
+
+    # 透传 UnifyLLM.chat/achat 的采样参数与厂商 extra 参数(签名随门面演进,故不逐一重复)。
+    async def achat(
+        self,
+        model: str,
+        messages: list[Message | dict[str, str]],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResponse:
+        """Route an asynchronous chat request, failing over to the next deployment.
+
+        Args:
+            model: Public model name (a ``RouterDeployment.model_name``).
+            messages: List of messages.
+            **kwargs: Forwarded to ``UnifyLLM.achat``.
+
+        Returns:
+            Chat response from the first deployment that succeeds.
+
+        Raises:
+            InvalidRequestError: If no deployment serves ``model``.
+            UnifyLLMError: The last failover error once every deployment failed, or any
+                non-retryable error immediately.
+        """
+        remaining = self._candidates(model)
+        while True:
+            deployment = self._pick(remaining)
+            remaining.remove(deployment)
+            deployment.inflight += 1
+            start = time.monotonic()
+            try:
+                response = await deployment.client.achat(
+                    model=deployment.model, messages=messages, **kwargs
+                )
+            except _FAILOVER_ERRORS as error:
+                self._record_failure(deployment, error)
+                if not remaining:
+                    raise
+                continue
+            finally:
+                deployment.inflight -= 1
+            self._record_latency(deployment, time.monotonic() - start)
+            return response
+
+    def chat(
+        self,
+        model: str,
+        messages: list[Message | dict[str, str]],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResponse:
+        """Route a synchronous chat request (same selection and failover as ``achat``)."""
+        remaining = self._candidates(model)
+        while True:
+            deployment = self._pick(remaining)
+            remaining.remove(deployment)
+            deployment.inflight += 1
+            start = time.monotonic()
+            try:
+                response = deployment.client.chat(
+                    model=deployment.model, messages=messages, **kwargs
+                )
+            except _FAILOVER_ERRORS as error:
+                self._record_failure(deployment, error)
+                if not remaining:
+                    raise
+                continue
+            finally:
+                deployment.inflight -= 1
+            self._record_latency(deployment, time.monotonic() - start)
+            return response
@@ -1,7 +1,12 @@
 """Utility functions for UnifyLLM."""
 
+import io
 import os
+import sys
+import time
 from pathlib import Path
+from types import TracebackType
+from typing import Self, TextIO
 
 import yaml  # type: ignore[import-untyped]
 
@@ -237,3 +242,82 @@ def format_provider_error(error: Exception, provider: str) -> str:
     error_msg = str(error)
 
     return f"[{provider.upper()}] {error_type}: {error_msg}"
+
+
+class ChunkAggregator:
+    """Coalesce streamed text chunks into fewer, larger writes.
+
+    Printing every stream chunk with ``flush=True`` costs one write syscall per token.
+    The aggregator buffers chunks and writes them out once ``min_chars`` have
+    accumulated or ``max_ms`` have passed since the last write, whichever comes first.
+    There is no timer: ``max_ms`` is only checked when the next chunk is fed, so a
+    stalled stream keeps its buffer until more text arrives or ``flush()`` is called
+    (leaving the ``with`` block flushes).
+
+    Example:
+        ```python
+        with ChunkAggregator() as out:
+            for chunk in client.chat_stream(model="gpt-4", messages=messages):
+                out.feed(chunk.content)
+        ```
+    """
+
+    def __init__(
+        self,
+        min_chars: int = 64,
+        max_ms: float = 50.0,
+        stream: TextIO | io.TextIOBase | None = None,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            min_chars: Buffered characters that trigger a write
+            max_ms: Time in milliseconds since the last write after which the next
+                ``feed`` writes out (checked on feed only)
+            stream: Text stream such as ``sys.stdout`` or ``io.StringIO`` (defaults
+                to ``sys.stdout`` at write time)
+        """
+        self.min_chars = min_chars
+        self.max_ms = max_ms
+        self._stream = stream
+        self._buf: list[str] = []
+        self._size = 0
+        self._last = time.monotonic()
+
+    def feed(self, text: str | None) -> None:
+        """Buffer ``text`` (None/empty is ignored) and write out if a threshold is hit.
+
+        Args:
+            text: Chunk content
+        """
+        if not text:
+            return
+        self._buf.append(text)
+        self._size += len(text)
+        if self._size >= self.min_chars or (time.monotonic() - self._last) * 1000 >= self.max_ms:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out and flush everything buffered so far."""
+        self._last = time.monotonic()
+        if not self._buf:
+            return
+        # 输出流在写出时才解析:测试/调用方可能在构造之后重定向 sys.stdout。
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write("".join(self._buf))
+        stream.flush()
+        self._buf.clear()
+        self._size = 0
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Context manager exit (flushes whatever is still buffered)."""
+        self.flush()
@@ -0,0 +1,310 @@
+"""Tests for the A2A building blocks (history, registry, message bus).
+
+Nothing here talks to a real LLM: the agents' client is a recording fake.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from unify_llm.a2a import (
+    A2AAgent,
+    A2AAgentConfig,
+    AgentRegistry,
+    ConversationHistory,
+    get_default_bus,
+    get_default_registry,
+)
+from unify_llm.a2a.message_bus import MessageBus, MessageBusConfig
+from unify_llm.a2a.protocol import AgentCapability, AgentInfo, AgentStatus
+from unify_llm.agent.base import Agent, AgentConfig
+
+
+class _RecordingClient:
+    """Fake client whose ``achat`` records its kwargs and echoes a fixed reply."""
+
+    def __init__(self, reply: str = "ok") -> None:
+        self.reply = reply
+        self.calls: list[dict[str, object]] = []
+
+    async def achat(self, **kwargs: object) -> SimpleNamespace:
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=self.reply)
+
+
+def _agent(client: _RecordingClient, history: ConversationHistory | None = None) -> A2AAgent:
+    base_agent = Agent(
+        config=AgentConfig(name="reviewer", model="m", provider="openai", system_prompt="sys"),
+        client=client,
+    )
+    return A2AAgent(base_agent, A2AAgentConfig(agent_name="reviewer"), history=history)
+
+
+# ── ConversationHistory ──────────────────────────────────────────────────
+
+
+def test_history_appends_without_mutating_earlier_entries() -> None:
+    history = ConversationHistory(system_prompt="sys")
+    history.add_observation("analyze", {"b": 1, "a": 2})
+    snapshot = history.messages
+    history.append("assistant", "done")
+
+    assert snapshot == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": '[analyze] {"a":2,"b":1}'},
+    ]
+    assert history.messages[:2] == snapshot
+    assert history.turns == 2
+
+    # messages is a copy: editing it does not touch the history
+    snapshot.append({"role": "user", "content": "x"})
+    assert history.turns == 2
+
+
+def test_history_resets_to_system_prompt_after_turn_limit() -> None:
+    history = ConversationHistory(system_prompt="sys", reset_cache_after_n_turns=2)
+    history.append("user", "1")
+    history.append("assistant", "2")
+    history.append("user", "3")  # the limit was reached: reset, then append
+
+    assert history.messages == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "3"},
+    ]
+
+    history.reset()
+    assert history.messages == [{"role": "system", "content": "sys"}]
+    assert ConversationHistory().messages == []
+
+
+def test_ask_sends_history_as_prompt_prefix() -> None:
+    client = _RecordingClient(reply="summary")
+    history = ConversationHistory()
+    history.add_observation("analyze", {"score": 8})
+    agent = _agent(client, history)
+
+    assert asyncio.run(agent.ask("Summarize.")) == "summary"
+    asyncio.run(agent.ask("Again."))
+
+    first, second = (call["messages"] for call in client.calls)
+    assert first == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": '[analyze] {"score":8}'},
+        {"role": "user", "content": "Summarize."},
+    ]
+    # The second request extends the first byte-for-byte
+    assert second[: len(first)] == first
+    assert second[len(first) :] == [
+        {"role": "assistant", "content": "summary"},
+        {"role": "user", "content": "Again."},
+    ]
+    assert client.calls[0]["prompt_caching"] is True
+    assert client.calls[0]["model"] == "m"
+
+
+def test_ask_without_history_uses_system_prompt_only() -> None:
+    client = _RecordingClient()
+    asyncio.run(_agent(client).ask("Hi"))
+    assert client.calls[0]["messages"] == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "Hi"},
+    ]
+
+
+# ── AgentRegistry ────────────────────────────────────────────────────────
+
+
+def _info(agent_id: str, *capabilities: str, **fields: object) -> AgentInfo:
+    return AgentInfo(
+        agent_id=agent_id,
+        agent_name=agent_id,
+        capabilities=[
+            AgentCapability(name=name, description=name, input_schema={}, output_schema={})
+            for name in capabilities
+        ],
+        status=fields.pop("status", AgentStatus.IDLE),
+        **fields,
+    )
+
+
+def _ids(agents: list[AgentInfo]) -> list[str]:
+    return [agent.agent_id for agent in agents]
+
+
+def test_registry_reindexes_changed_capabilities() -> None:
+    registry = AgentRegistry()
+
+    async def run() -> None:
+        await registry.register(_info("a", "write", "review"))
+        await registry.register(_info("b", "write"))
+        await registry.register(_info("a", "plan"))  # re-register with new capabilities
+
+        assert registry.find_by_capability("review") == []
+        assert "review" not in registry._by_capability
+        assert _ids(registry.find_by_capability("write")) == ["b"]
+        assert _ids(registry.find_by_capability("plan")) == ["a"]
+
+        await registry.unregister("a")
+        assert registry.find_by_capability("plan") == []
+        assert _ids(await registry.find_agents()) == ["b"]
+
+    asyncio.run(run())
+
+
+def test_registry_union_keeps_registration_order() -> None:
+    registry = AgentRegistry()
+
+    async def run() -> None:
+        await registry.register(_info("a", "review"))
+        await registry.register(_info("b", "write", "review"))
+        await registry.register(_info("c", "write", status=AgentStatus.BUSY))
+        await registry.register(_info("a", "write"))  # keeps its first position
+
+        assert _ids(registry.find_by_capability("write")) == ["a", "b", "c"]
+        # Each agent appears once, in registration order, whatever the query order
+        assert _ids(await registry.find_agents(["write", "review"])) == ["a", "b", "c"]
+        assert _ids(await registry.find_agents(["review", "write"])) == ["a", "b", "c"]
+        assert _ids(await registry.find_agents(["review"])) == ["b"]
+        assert _ids(await registry.find_agents(["write"], status=AgentStatus.BUSY)) == ["c"]
+        assert await registry.find_agents(["missing"]) == []
+
+    asyncio.run(run())
+
+
+def test_registry_cleanup_stale_drops_index_entries() -> None:
+    registry = AgentRegistry()
+
+    async def run() -> None:
+        await registry.register(
+            _info("old", "write", last_seen=datetime.now() - timedelta(hours=1))
+        )
+        await registry.register(_info("new", "write", "plan"))
+        await registry.cleanup_stale(timedelta(minutes=5))
+
+        assert _ids(await registry.find_agents()) == ["new"]
+        assert _ids(registry.find_by_capability("write")) == ["new"]
+        assert await registry.get_agent("old") is None
+
+        await registry.register(_info("old", "plan"))  # registers afresh, at the end
+        assert _ids(registry.find_by_capability("plan")) == ["new", "old"]
+
+    asyncio.run(run())
+
+
+def test_default_registry_and_bus_are_per_event_loop() -> None:
+    async def contend() -> tuple[AgentRegistry, MessageBus]:
+        registry, bus = get_default_registry(), get_default_bus()
+        assert get_default_registry() is registry and get_default_bus() is bus
+        assert await registry.find_agents() == []  # nothing left from an earlier run
+        assert bus.get_subscribers() == []
+
+        # Two waiters bind the lock (and the queue) to this loop
+        async def hold() -> None:
+            async with registry._lock:
+                await asyncio.sleep(0)
+
+        await asyncio.gather(hold(), hold(), registry.register(_info("a", "write")))
+        await bus.start()
+        bus.subscribe("a", lambda message: asyncio.sleep(0))
+        await bus.publish("a", {"n": 1})
+        assert (await bus.get_message("a"))["n"] == 1
+        return registry, bus
+
+    first_registry, first_bus = asyncio.run(contend())
+    # A second loop gets fresh instances: no "bound to a different event loop"
+    # error and no agents or subscribers left over from the first run
+    second_registry, second_bus = asyncio.run(contend())
+    assert second_registry is not first_registry
+    assert second_bus is not first_bus
+
+    # Outside a running loop there is nothing to share
+    assert get_default_registry() is not get_default_registry()
+    assert get_default_bus() is not get_default_bus()
+
+
+# ── MessageBus ───────────────────────────────────────────────────────────
+
+
+def _bus(max_queue_size: int = 10) -> MessageBus:
+    bus = MessageBus(
+        MessageBusConfig(name="t", max_queue_size=max_queue_size, enable_logging=False)
+    )
+    asyncio.run(bus.start())
+    return bus
+
+
+def test_publish_many_queues_in_order_and_counts_errors() -> None:
+    bus = _bus(max_queue_size=2)
+    received: list[dict[str, object]] = []
+
+    async def handler(message: dict[str, object]) -> None:
+        received.append(message)
+
+    async def failing(message: dict[str, object]) -> None:
+        raise RuntimeError("boom")
+
+    bus.subscribe("a", handler)
+    bus.subscribe("b", failing)
+
+    async def run() -> list[dict[str, object]]:
+        await bus.publish_many(
+            [
+                ("a", {"n": 1}),
+                ("missing", {"n": 2}),  # no queue: error
+                ("a", {"n": 3}),
+                ("a", {"n": 4}),  # queue holds 2: QueueFull, error
+                ("b", {"n": 5}),  # queued, but the handler raises: error
+            ],
+            sender_id="s",
+        )
+        return await bus.get_messages("a")
+
+    queued = asyncio.run(run())
+
+    assert [m["n"] for m in queued] == [1, 3]
+    assert [m["n"] for m in received] == [1, 3]
+    assert {m["_timestamp"] for m in queued} == {queued[0]["_timestamp"]}
+    assert queued[0]["_target"] == "a" and queued[0]["_sender"] == "s"
+    assert queued[0]["_bus"] == "t"
+    stats = bus.get_stats()
+    assert stats["messages_sent"] == 3
+    assert stats["errors"] == 3
+    assert stats["messages_received"] == 2
+
+
+def test_get_messages_respects_drain_limit() -> None:
+    bus = _bus()
+    bus.subscribe("a", lambda message: asyncio.sleep(0))
+
+    async def run() -> tuple[list[int], list[int], list[int]]:
+        await bus.publish_many([("a", {"n": n}) for n in range(5)])
+        first = await bus.get_messages("a", max_messages=1)
+        second = await bus.get_messages("a", max_messages=3)
+        rest = await bus.get_messages("a")
+        return ([m["n"] for m in first], [m["n"] for m in second], [m["n"] for m in rest])
+
+    assert asyncio.run(run()) == ([0], [1, 2, 3], [4])
+
+    with pytest.raises(ValueError, match="max_messages"):
+        asyncio.run(bus.get_messages("a", max_messages=0))
+    with pytest.raises(KeyError):
+        asyncio.run(bus.get_messages("missing"))
+
+
+def test_publish_local_skips_the_queue() -> None:
+    bus = _bus()
+    received: list[dict[str, object]] = []
+
+    async def handler(message: dict[str, object]) -> None:
+        received.append(message)
+
+    bus.subscribe("a", handler)
+
+    assert asyncio.run(bus.publish_local("a", {"n": 1}, sender_id="s")) is True
+    assert asyncio.run(bus.publish_local("missing", {"n": 2})) is False
+
+    assert [(m["n"], m["_target"], m["_sender"]) for m in received] == [(1, "a", "s")]
+    assert bus._queues["a"].empty()
+    assert bus.get_stats()["messages_sent"] == 1
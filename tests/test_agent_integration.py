@@ -116,9 +116,7 @@ def test_builtin_tools():
         print(f"✅ Calculator: 2 + 2 = {result.output}")
 
         # Register string tools
-        tools = create_string_tools()
-        for tool in tools:
-            registry.register(tool)
+        registry.register_many(create_string_tools())
 
         uppercase_tool = registry.get("to_uppercase")
         result = uppercase_tool.execute(text="hello")
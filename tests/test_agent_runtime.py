@@ -0,0 +1,324 @@
+"""Tests for the agent runtime helpers (executor streaming, chains, history, HTTP tools).
+
+Nothing here talks to a real LLM or server: agents get a recording fake client and
+HTTP requests go through ``httpx.MockTransport``.
+"""
+
+import asyncio
+import gc
+import warnings
+from collections.abc import AsyncIterator
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from unify_llm.agent import http_tools
+from unify_llm.agent.advanced import AgentChain, ErrorHandler
+from unify_llm.agent.base import Agent, AgentConfig
+from unify_llm.agent.execution_history import ExecutionData, ExecutionHistory, ExecutionStatus
+from unify_llm.agent.executor import AgentExecutor
+from unify_llm.agent.tools import Tool, ToolParameter, ToolParameterType, ToolRegistry
+
+
+class _StreamingClient:
+    """Fake client whose ``achat_stream`` records its kwargs and yields fixed deltas."""
+
+    def __init__(self, deltas: list[str | None]) -> None:
+        self.deltas = deltas
+        self.calls: list[dict[str, object]] = []
+
+    async def achat_stream(self, **kwargs: object) -> AsyncIterator[SimpleNamespace]:
+        self.calls.append(kwargs)
+        for text in self.deltas:
+            yield SimpleNamespace(content=text)
+
+
+def _executor(client: object, **config: object) -> AgentExecutor:
+    agent_config = AgentConfig(
+        name="writer", model="m", provider="openai", system_prompt="sys", **config
+    )
+    return AgentExecutor(agent=Agent(config=agent_config, client=client))
+
+
+# ── AgentExecutor.astream / AgentChain streaming ─────────────────────────
+
+
+def test_astream_yields_deltas_and_records_reply() -> None:
+    client = _StreamingClient(["Hel", None, "lo"])
+    executor = _executor(client)
+
+    async def collect() -> list[str]:
+        return [delta async for delta in executor.astream("Hi")]
+
+    assert asyncio.run(collect()) == ["Hel", "lo"]
+    messages = executor.memory.get_messages()
+    assert [(m["role"], m["content"]) for m in messages[-2:]] == [
+        ("user", "Hi"),
+        ("assistant", "Hello"),
+    ]
+    assert client.calls[0]["prompt_caching"] is True
+
+
+def test_streamed_chain_step_goes_through_astream() -> None:
+    client = _StreamingClient(["a", "b"])
+    executor = _executor(client, enable_memory=False, cache_system_prompt=False)
+    chain = AgentChain().add_agent(executor.agent, executor, name="draft")
+    seen: list[tuple[str, str]] = []
+
+    result = asyncio.run(
+        chain.aexecute_streaming("go", on_chunk=lambda name, text: seen.append((name, text)))
+    )
+
+    assert result["success"] is True
+    assert result["final_output"] == "ab"
+    assert seen == [("draft", "a"), ("draft", "b")]
+    call = client.calls[0]
+    assert call["messages"] == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "go"},
+    ]
+    # The chain honours the agent's prompt-caching setting like any other call
+    assert call["prompt_caching"] is False
+
+
+# ── ExecutionHistory ─────────────────────────────────────────────────────
+
+
+def _execution(execution_id: str, status: ExecutionStatus, hour: int) -> ExecutionData:
+    return ExecutionData(
+        id=execution_id,
+        workflow_id="wf",
+        workflow_name="Workflow",
+        status=status,
+        start_time=datetime(2024, 1, 1, hour),
+        input_data={"n": hour},
+    )
+
+
+def test_in_memory_history_round_trip_and_save_many() -> None:
+    with ExecutionHistory(db_path=":memory:") as history:
+        history.save_many(
+            [
+                _execution("a", ExecutionStatus.SUCCESS, 1),
+                _execution("b", ExecutionStatus.ERROR, 2),
+                _execution("c", ExecutionStatus.SUCCESS, 3),
+            ]
+        )
+        history.save(_execution("b", ExecutionStatus.SUCCESS, 2))  # replaces "b"
+
+        assert [e.id for e in history.get_recent()] == ["c", "b", "a"]
+        stored = history.get("a")
+        assert stored is not None
+        assert stored.input_data == {"n": 1}
+        assert history.get_statistics("wf")["success"] == 3
+
+        # A second in-memory history is a separate database
+        with ExecutionHistory(db_path=":memory:") as other:
+            assert other.get_recent() == []
+
+
+def test_in_memory_history_close_releases_connection() -> None:
+    history = ExecutionHistory(db_path=":memory:")
+    history.close()
+    history.close()  # idempotent
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        del history
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+# ── http_tools: shared client and response cache ─────────────────────────
+
+
+class _Server:
+    """MockTransport handler that counts requests and serves a JSON body."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(self.status_code, json={"path": request.url.path, "n": 1})
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Empty response cache, no DNS lookups, and a hand-driven cache clock."""
+    now = [1000.0]
+    http_tools.clear_response_cache()
+    monkeypatch.setattr(http_tools, "is_url_safe", lambda url: (True, ""))
+    monkeypatch.setattr(http_tools, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    yield now
+    http_tools.clear_response_cache()
+
+
+def _run_requests(server: _Server, *calls: dict[str, object]) -> list[object]:
+    async def run() -> list[object]:
+        transport = httpx.MockTransport(server)
+        async with http_tools.shared_http_client(transport=transport):
+            return [await http_tools.http_request(**call) for call in calls]
+
+    return asyncio.run(run())
+
+
+def test_response_cache_hits_until_ttl_expires(clock: list[float]) -> None:
+    server = _Server()
+    call = {"url": "https://api.test/a", "cache_ttl": 10.0}
+
+    first, second = _run_requests(server, call, call)
+    assert first.success and second.output == first.output
+    assert len(server.requests) == 1
+
+    clock[0] += 11
+    _run_requests(server, call)
+    assert len(server.requests) == 2
+
+    # A different request input is a different cache entry
+    _run_requests(server, {**call, "query_params": {"page": "2"}})
+    assert len(server.requests) == 3
+
+
+def test_response_cache_skips_other_methods_failures_and_opt_out(clock: list[float]) -> None:
+    server = _Server()
+    post = {"url": "https://api.test/a", "method": "POST", "body": {"x": 1}, "cache_ttl": 10.0}
+    _run_requests(server, post, post)
+    assert len(server.requests) == 2
+
+    uncached = {"url": "https://api.test/a"}
+    _run_requests(server, uncached, uncached)
+    assert len(server.requests) == 4
+
+    failing = _Server(status_code=500)
+    call = {"url": "https://api.test/a", "cache_ttl": 10.0}
+    results = _run_requests(failing, call, call)
+    assert [r.success for r in results] == [False, False]
+    assert len(failing.requests) == 2
+    assert len(http_tools._response_cache) == 0
+
+
+def test_response_cache_evicts_least_recently_used(
+    clock: list[float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(http_tools, "_RESPONSE_CACHE_SIZE", 2)
+    server = _Server()
+    a, b, c = ({"url": f"https://api.test/{p}", "cache_ttl": 10.0} for p in "abc")
+
+    _run_requests(server, a, b, a, c)  # the hit on "a" makes "b" the oldest entry
+    assert len(server.requests) == 3
+
+    _run_requests(server, a)
+    assert len(server.requests) == 3
+    _run_requests(server, b)
+    assert len(server.requests) == 4
+
+
+def test_cached_result_is_not_shared_with_callers(clock: list[float]) -> None:
+    server = _Server()
+    call = {"url": "https://api.test/a", "cache_ttl": 10.0}
+
+    first, second = _run_requests(server, call, call)
+    first.output["body"]["n"] = 99
+    second.output["body"]["n"] = 98
+
+    (third,) = _run_requests(server, call)
+    assert third.output["body"] == {"path": "/a", "n": 1}
+    assert len(server.requests) == 1
+
+
+def test_shared_http_client_scopes_the_context_client() -> None:
+    async def current() -> httpx.AsyncClient:
+        return http_tools._get_client()
+
+    async def run() -> None:
+        async with http_tools.shared_http_client() as client:
+            assert http_tools._get_client() is client
+            # Tasks started inside the block inherit the client
+            assert await asyncio.gather(current(), current()) == [client, client]
+        assert client.is_closed
+
+        loop_client = http_tools._get_client()
+        assert loop_client is not client
+        assert http_tools._get_client() is loop_client  # reused within the loop
+        await loop_client.aclose()
+        assert http_tools._get_client() is not loop_client  # a closed client is replaced
+        await http_tools._get_client().aclose()
+
+    asyncio.run(run())
+
+
+# ── Tool schema cache ────────────────────────────────────────────────────
+
+
+def _tool() -> Tool:
+    return Tool(
+        name="search",
+        description="Search",
+        parameters={"query": ToolParameter(type=ToolParameterType.STRING, description="q")},
+    )
+
+
+def test_tool_schemas_are_cached_per_format() -> None:
+    tool = _tool()
+    openai_schema = tool.to_openai_format()
+    anthropic_schema = tool.to_anthropic_format()
+
+    assert tool.to_openai_format() is openai_schema
+    assert tool.to_anthropic_format() is anthropic_schema
+    assert openai_schema["function"]["parameters"]["required"] == ["query"]
+    assert list(anthropic_schema["input_schema"]["properties"]) == ["query"]
+
+
+def test_tool_schema_cache_invalidated_by_field_assignment() -> None:
+    tool = _tool()
+    stale = tool.to_openai_format()
+    copy = tool.model_copy()
+
+    tool.description = "Search the web"
+    assert tool.to_openai_format() is not stale
+    assert tool.to_openai_format()["function"]["description"] == "Search the web"
+
+    tool.parameters = {
+        **tool.parameters,
+        "limit": ToolParameter(type=ToolParameterType.INTEGER, description="n", required=False),
+    }
+    assert list(tool.to_anthropic_format()["input_schema"]["properties"]) == ["query", "limit"]
+
+    # The copy made before the edits keeps its own, unchanged schema
+    assert copy.to_openai_format()["function"]["description"] == "Search"
+
+
+def test_executor_tool_payload_follows_tool_field_assignment() -> None:
+    tool = _tool()
+    registry = ToolRegistry()
+    registry.register(tool)
+    executor = _executor(_StreamingClient([]), tools=["search", "missing"])
+    executor.tool_registry = registry
+
+    first = executor._get_tools_payload()
+    assert executor._get_tools_payload() is first  # memoized while nothing changes
+    assert first is not None and first[0]["function"]["description"] == "Search"
+
+    tool.description = "Search the web"
+    payload = executor._get_tools_payload()
+    assert payload is not None
+    assert payload[0]["function"]["description"] == "Search the web"
+    assert payload[0] is tool.to_openai_format()
+
+
+# ── ErrorHandler ─────────────────────────────────────────────────────────
+
+
+def test_error_handler_warns_on_deprecated_backoff_factor() -> None:
+    with pytest.warns(DeprecationWarning, match="backoff_factor"):
+        handler = ErrorHandler(backoff_factor=1.5)
+    assert handler.backoff_factor == 1.5
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        ErrorHandler()
+        ErrorHandler(max_retries=2, base=0.1, cap=1.0)
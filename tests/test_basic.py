@@ -1,7 +1,10 @@
 """Basic tests for UnifyLLM."""
 
+import asyncio
+
 import pytest
 
+import unify_llm.client as client_module
 from unify_llm import UnifyLLM
 from unify_llm.core.exceptions import InvalidRequestError
 from unify_llm.models import ChatRequest, Message
@@ -18,6 +21,68 @@ def test_client_initialization():
         UnifyLLM(provider="invalid_provider")
 
 
+def test_client_reuses_pooled_provider():
+    """Clients with the same provider/config in one event loop share a pooled provider."""
+
+    async def build() -> None:
+        first = UnifyLLM(provider="openai", api_key="pool-key")
+        second = UnifyLLM(provider="openai", api_key="pool-key")
+        assert first._provider is second._provider
+
+        # Different config or opting out builds a separate provider
+        assert UnifyLLM(provider="openai", api_key="other-key")._provider is not first._provider
+        private = UnifyLLM(provider="openai", api_key="pool-key", reuse_provider=False)
+        assert private._provider is not first._provider
+
+        UnifyLLM.clear_provider_pool()
+        assert UnifyLLM(provider="openai", api_key="pool-key")._provider is not first._provider
+        await UnifyLLM.aclose_provider_pool()
+
+    asyncio.run(build())
+
+    # Outside a running loop nothing is pooled
+    outside = UnifyLLM(provider="openai", api_key="pool-key")
+    assert UnifyLLM(provider="openai", api_key="pool-key")._provider is not outside._provider
+
+
+def test_provider_pool_is_per_event_loop() -> None:
+    """A provider (and its loop-bound async client) never crosses asyncio.run calls."""
+
+    async def build() -> tuple[object, object]:
+        client = UnifyLLM(provider="openai", api_key="loop-key")
+        provider = client._provider
+        assert UnifyLLM(provider="openai", api_key="loop-key")._provider is provider
+        return provider, provider.async_client
+
+    first_provider, first_async_client = asyncio.run(build())
+    second_provider, second_async_client = asyncio.run(build())
+    assert second_provider is not first_provider
+    assert second_async_client is not first_async_client
+
+
+def test_provider_pool_drops_closed_and_bounds_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Closed pooled providers are rebuilt, evicted ones fall out, aclose empties the loop."""
+    monkeypatch.setattr(client_module, "_POOL_MAX_PER_LOOP", 2)
+
+    async def build() -> None:
+        first = UnifyLLM(provider="openai", api_key="k0")._provider
+        await first.aclose()
+        reopened = UnifyLLM(provider="openai", api_key="k0")._provider
+        assert reopened is not first
+
+        UnifyLLM(provider="openai", api_key="k1")
+        UnifyLLM(provider="openai", api_key="k2")  # evicts k0 (least recently used)
+        assert UnifyLLM(provider="openai", api_key="k0")._provider is not reopened
+
+        pooled = UnifyLLM(provider="openai", api_key="k2")._provider
+        await UnifyLLM.aclose_provider_pool()
+        assert pooled.async_client.is_closed
+        assert UnifyLLM(provider="openai", api_key="k2")._provider is not pooled
+        await UnifyLLM.aclose_provider_pool()
+
+    asyncio.run(build())
+
+
 def test_message_creation():
     """Test Message model creation."""
     msg = Message(role="user", content="Hello")
@@ -105,3 +170,31 @@ def test_provider_registration():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_chunk_aggregator_batches_writes():
+    """Test that ChunkAggregator coalesces chunks and flushes the tail on exit."""
+    import io
+
+    from unify_llm.utils import ChunkAggregator
+
+    out = io.StringIO()
+    with ChunkAggregator(min_chars=8, max_ms=60_000.0, stream=out) as agg:
+        for token in ["ab", "cd", None, "ef"]:
+            agg.feed(token)
+        assert out.getvalue() == ""  # below both thresholds: still buffered
+        agg.feed("ghij")
+        assert out.getvalue() == "abcdefghij"
+        agg.feed("k")
+    assert out.getvalue() == "abcdefghijk"
+
+
+def test_chunk_aggregator_accepts_text_streams(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that ChunkAggregator takes sys.stdout-style TextIO streams, not only io classes."""
+    import sys
+
+    from unify_llm.utils import ChunkAggregator
+
+    with ChunkAggregator(min_chars=1, stream=sys.stdout) as agg:
+        agg.feed("hi")
+    assert capsys.readouterr().out == "hi"
@@ -0,0 +1,156 @@
+"""ResponseCache:键稳定性/LRU 淘汰/SQLite 持久化,以及 UnifyLLM 接入(按 temperature 决定缓存)。"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from unify_llm.adapters.mock import MockProvider
+from unify_llm.cache import ResponseCache
+from unify_llm.client import UnifyLLM
+from unify_llm.models import ChatRequest, ChatResponse, Message
+
+
+class _CountingProvider(MockProvider):
+    """记录真实调用次数的 MockProvider(用于断言缓存命中时不走 provider)。"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat(self, request: ChatRequest, /) -> ChatResponse:
+        self.calls += 1
+        return super().chat(request)
+
+    async def achat(self, request: ChatRequest, /) -> ChatResponse:
+        self.calls += 1
+        return await super().achat(request)
+
+
+def _request(content: str = "ping", temperature: float | None = 0.0) -> ChatRequest:
+    return ChatRequest(
+        model="m", messages=[Message(role="user", content=content)], temperature=temperature
+    )
+
+
+def _client(cache: ResponseCache) -> tuple[UnifyLLM, _CountingProvider]:
+    client = UnifyLLM(provider="mock", reuse_provider=False, response_cache=cache)
+    provider = _CountingProvider()
+    client._provider = provider
+    return client, provider
+
+
+def test_invalid_maxsize_rejected() -> None:
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
+
+
+def test_key_ignores_stream_flag_but_not_content() -> None:
+    streamed = _request()
+    streamed.stream = True
+    assert ResponseCache.make_key("openai", _request()) == ResponseCache.make_key(
+        "openai", streamed
+    )
+    assert ResponseCache.make_key("openai", _request()) != ResponseCache.make_key(
+        "openai", _request("pong")
+    )
+    assert ResponseCache.make_key("openai", _request()) != ResponseCache.make_key(
+        "anthropic", _request()
+    )
+
+
+def test_key_includes_base_url() -> None:
+    default = ResponseCache.make_key("openai", _request())
+    proxied = ResponseCache.make_key("openai", _request(), base_url="https://proxy.test/v1")
+    assert proxied != default
+    assert proxied != ResponseCache.make_key("openai", _request(), base_url="https://other.test/v1")
+    assert proxied == ResponseCache.make_key(
+        "openai", _request(), base_url="https://proxy.test/v1/"
+    )
+    # No base_url (the provider default) keeps the key persisted caches already use
+    assert ResponseCache().key_for("openai", _request(), None) == default
+
+
+def test_clients_on_different_endpoints_do_not_share_entries() -> None:
+    cache = ResponseCache()
+    first = UnifyLLM(
+        provider="mock", base_url="https://a.test", reuse_provider=False, response_cache=cache
+    )
+    second = UnifyLLM(
+        provider="mock", base_url="https://b.test", reuse_provider=False, response_cache=cache
+    )
+    request = _request()
+    assert first._cache_key(request, True) != second._cache_key(request, True)
+
+
+def test_normalized_keys_ignore_case_and_spacing_of_user_prompts() -> None:
+    cache = ResponseCache(normalize_prompts=True)
+    assert cache.key_for("openai", _request("What's  the weather?")) == cache.key_for(
+        "openai", _request("what's the WEATHER?")
+    )
+    assert ResponseCache().key_for("openai", _request("A")) != ResponseCache().key_for(
+        "openai", _request("a")
+    )
+    system = ChatRequest(model="m", messages=[Message(role="system", content="A")])
+    system_lower = ChatRequest(model="m", messages=[Message(role="system", content="a")])
+    assert cache.key_for("openai", system) != cache.key_for("openai", system_lower)
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = ResponseCache(maxsize=2)
+    response = MockProvider().chat(_request())
+    cache.set("a", response)
+    cache.set("b", response)
+    assert cache.get("a") is not None  # a 变为最近使用
+    cache.set("c", response)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_sqlite_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    response = MockProvider().chat(_request())
+    first = ResponseCache(path=path)
+    first.set("k", response)
+    first.close()
+
+    second = ResponseCache(path=path)
+    try:
+        cached = second.get("k")
+        assert cached is not None
+        assert cached.content == response.content
+    finally:
+        second.close()
+
+
+def test_client_caches_only_deterministic_requests() -> None:
+    client, provider = _client(ResponseCache())
+    messages: list[Message | dict[str, str]] = [{"role": "user", "content": "hi"}]
+
+    first = client.chat(model="m", messages=messages, temperature=0.0)
+    second = client.chat(model="m", messages=messages, temperature=0.0)
+    assert provider.calls == 1
+    assert second.content == first.content
+
+    client.chat(model="m", messages=messages, temperature=0.7)
+    client.chat(model="m", messages=messages, temperature=0.7)
+    assert provider.calls == 3  # 采样请求默认不缓存
+
+    client.chat(model="m", messages=messages, temperature=0.7, cache="force")
+    client.chat(model="m", messages=messages, temperature=0.7, cache="force")
+    assert provider.calls == 4
+
+    client.chat(model="m", messages=messages, temperature=0.0, cache=False)
+    assert provider.calls == 5
+
+
+def test_client_async_path_uses_cache() -> None:
+    client, provider = _client(ResponseCache())
+    messages: list[Message | dict[str, str]] = [{"role": "user", "content": "hi"}]
+
+    async def run() -> None:
+        await client.achat(model="m", messages=messages, temperature=0.0)
+        await client.achat(model="m", messages=messages, temperature=0.0)
+
+    asyncio.run(run())
+    assert provider.calls == 1
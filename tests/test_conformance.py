@@ -224,6 +224,51 @@ def test_network_error_maps_to_provider_error(case: Case) -> None:
         provider.client.close()  # type: ignore[attr-defined]
 
 
+@pytest.mark.parametrize("case", CASES, ids=_IDS)
+def test_warmup_heads_base_url_and_swallows_errors(case: Case) -> None:
+    provider = _build(case)
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(405)
+
+    _patch(provider, handler)
+    try:
+        provider.warmup()  # type: ignore[attr-defined]
+        assert seen == ["HEAD"]
+        provider.client.close()  # type: ignore[attr-defined]
+        _patch(provider, _connect_error)
+        provider.warmup()  # type: ignore[attr-defined]  # 网络错被吞掉,不抛
+    finally:
+        provider.client.close()  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("case", CASES, ids=_IDS)
+def test_injected_async_client_carries_provider_headers(case: Case) -> None:
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return httpx.Response(200, json=case.chat_json)
+
+    async def run() -> None:
+        # 共享客户端本身不带任何鉴权头,须由 provider 逐请求补上。
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as shared:
+            provider = factory.build(
+                case.name,
+                ProviderConfig(api_key="test-key", base_url=case.base_url),
+                async_client=shared,
+            )
+            provider.client.close()  # type: ignore[attr-defined]
+            resp = await provider.achat(_request())
+            assert resp.content == "hi"
+            expected = provider._get_headers()  # type: ignore[attr-defined]
+            assert all(seen[0].get(k) == v for k, v in expected.items())
+
+    asyncio.run(run())
+
+
 # ── Mock provider(无 HTTP,直接验证不变量)──────────────────────────────────
 
 
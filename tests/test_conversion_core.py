@@ -6,11 +6,18 @@ _convert_response / _convert_stream_chunk、_convert_request 序列化)、provid
 不连真网络。
 """
 
+import dataclasses
+import enum
 import json
+import uuid
+from datetime import UTC, date, datetime
 
 import httpx
 import pytest
 
+from unify_llm.adapters import base
+from unify_llm.adapters.anthropic import AnthropicProvider
+from unify_llm.adapters.databricks import DatabricksProvider
 from unify_llm.adapters.openai_compatible import OpenAIProvider
 from unify_llm.core.exceptions import (
     AuthenticationError,
@@ -22,8 +29,11 @@ from unify_llm.models import (
     ChatResponse,
     FinishReason,
     Message,
+    MessageDelta,
     ProviderConfig,
     Role,
+    StreamChoiceDelta,
+    StreamChunk,
 )
 from unify_llm.utils import get_model_name_mapping_path, resolve_model_name
 
@@ -133,6 +143,40 @@ def test_convert_stream_chunk_maps_delta() -> None:
     assert chunk.id == "c1"
 
 
+def test_convert_stream_chunk_fast_path_matches_full_parse() -> None:
+    provider = _provider()
+    raw: dict[str, object] = {
+        "id": "c1",
+        "model": "gpt-4o",
+        "created": 1,
+        "choices": [{"index": 0, "delta": {"content": "hi"}, "finish_reason": None}],
+    }
+    fast = provider._fast_content_chunk(raw)
+    assert fast is not None
+    full = StreamChunk(
+        id="c1",
+        model="gpt-4o",
+        created=1,
+        provider=provider.name,
+        choices=[StreamChoiceDelta(index=0, delta=MessageDelta(content="hi"))],
+    )
+    assert fast == full
+    assert fast.model_dump() == full.model_dump()
+
+    # 首帧带 role、末帧带 finish_reason:不走快路径,仍得到枚举值。
+    first = {"id": "c1", "model": "m", "choices": [{"index": 0, "delta": {"role": "assistant"}}]}
+    assert provider._fast_content_chunk(first) is None
+    converted = provider._convert_stream_chunk(first)
+    assert converted is not None
+    assert converted.choices[0].delta.role is Role.ASSISTANT
+    last = {
+        "id": "c1",
+        "model": "m",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    }
+    assert provider._fast_content_chunk(last) is None
+
+
 def test_convert_stream_chunk_returns_none_when_empty() -> None:
     assert _provider()._convert_stream_chunk({}) is None
     assert _provider()._convert_stream_chunk({"choices": []}) is None
@@ -150,6 +194,57 @@ def test_convert_request_serializes_role_as_plain_string() -> None:
     assert '"role": "user"' in dumped
 
 
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _caching_request(prompt_caching: bool) -> ChatRequest:
+    return ChatRequest(
+        model="claude",
+        messages=[
+            Message(role="system", content="sys"),
+            Message(role="user", content="first"),
+            Message(role="assistant", content="ok"),
+            Message(role="user", content="second"),
+        ],
+        prompt_caching=prompt_caching,
+    )
+
+
+def test_prompt_caching_marks_system_and_last_user_message() -> None:
+    config = ProviderConfig(api_key="k", base_url="https://dbx.example.com")
+    messages = DatabricksProvider(config)._convert_request(_caching_request(True))["messages"]
+    assert isinstance(messages, list)
+    assert messages[0]["content"] == [{"type": "text", "text": "sys", "cache_control": _EPHEMERAL}]
+    assert messages[1]["content"] == "first"
+    assert messages[3]["content"] == [
+        {"type": "text", "text": "second", "cache_control": _EPHEMERAL}
+    ]
+
+    payload = AnthropicProvider(ProviderConfig(api_key="k"))._convert_request(
+        _caching_request(True)
+    )
+    assert payload["system"] == [{"type": "text", "text": "sys", "cache_control": _EPHEMERAL}]
+    assert payload["messages"] == [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "ok"},
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "second", "cache_control": _EPHEMERAL}],
+        },
+    ]
+
+
+def test_prompt_caching_ignored_when_off_or_unsupported() -> None:
+    # 不支持 cache_control 的 OpenAI 兼容端点照旧发纯字符串
+    unsupported = _provider()._convert_request(_caching_request(True))["messages"]
+    assert isinstance(unsupported, list)
+    assert [m["content"] for m in unsupported] == ["sys", "first", "ok", "second"]
+    payload = AnthropicProvider(ProviderConfig(api_key="k"))._convert_request(
+        _caching_request(False)
+    )
+    assert payload["system"] == "sys"
+
+
 # ── base._handle_http_error:错误分类 ─────────────────────────────────────
 
 
@@ -167,6 +262,64 @@ def test_handle_http_error_rate_limit_retry_after() -> None:
     assert exc_info.value.retry_after == 7
 
 
+# ── base.canonical_json / pretty_json:orjson 分支与标准库分支逐字节一致 ──
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    seen_at: datetime
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+_CANONICAL_CASES: list[object] = [
+    {"b": 1, "a": [1, 2.5, None, True, "é"]},
+    {10: "x", 2: "y"},  # 非 str 键:按转换后的字符串排序
+    {1.5: "f", None: "n", False: "b", "s": "t"},
+    datetime(2024, 1, 1, 12, 0),
+    datetime(2024, 1, 1, 12, 0, 0, 123, tzinfo=UTC),
+    date(2024, 1, 2),
+    _Point(1, datetime(2024, 1, 1)),
+    _Color.RED,
+    uuid.UUID(int=5),
+    ({"nested": {3: [{"z": 1, "y": 2}]}},),
+]
+
+
+@pytest.mark.parametrize("obj", _CANONICAL_CASES)
+def test_canonical_json_stdlib_branch_is_canonical(obj: object) -> None:
+    encoded = base._canonical_json_stdlib(obj)
+    assert encoded == base._canonical_json_stdlib(json.loads(encoded))  # 再编码不变
+
+
+def test_canonical_json_stdlib_format() -> None:
+    assert base._canonical_json_stdlib({10: "x", 2: "y"}) == b'{"10":"x","2":"y"}'
+    assert base._canonical_json_stdlib(datetime(2024, 1, 1, 12)) == b'"2024-01-01T12:00:00"'
+
+
+@pytest.mark.parametrize("obj", _CANONICAL_CASES)
+def test_canonical_json_orjson_branch_matches_stdlib(obj: object) -> None:
+    pytest.importorskip("orjson")
+    assert base.canonical_json(obj) == base._canonical_json_stdlib(obj)
+
+
+def test_pretty_json_stdlib_format() -> None:
+    assert base._pretty_json_stdlib({"b": "é", 1: []}) == '{\n  "b": "é",\n  "1": []\n}'.encode()
+    assert base._pretty_json_stdlib({"b": 1, "a": 2}, sort_keys=True).startswith(b'{\n  "a"')
+
+
+@pytest.mark.parametrize("sort_keys", [False, True])
+@pytest.mark.parametrize("obj", _CANONICAL_CASES)
+def test_pretty_json_orjson_branch_matches_stdlib(obj: object, sort_keys: bool) -> None:
+    pytest.importorskip("orjson")
+    assert base.pretty_json(obj, sort_keys=sort_keys) == base._pretty_json_stdlib(
+        obj, sort_keys=sort_keys
+    )
+
+
 # ── utils:src 搬迁后 YAML 路径仍指向仓库根 configs/ ──────────────────────
 
 
@@ -1350,6 +1350,34 @@ class TestAgentExecutor:
         assert result.success is True
         assert result.output == "Async response"
 
+    @pytest.mark.asyncio
+    async def test_executor_astream(self):
+        """Test streaming executor output into memory."""
+        mock_client = Mock()
+
+        async def fake_stream(**kwargs):
+            for text in ["Hel", None, "lo"]:
+                yield Mock(content=text)
+
+        mock_client.achat_stream = fake_stream
+
+        config = AgentConfig(
+            name="test_agent",
+            model="gpt-4",
+            provider="openai",
+            system_prompt="You are helpful",
+            enable_memory=True,
+        )
+        agent = Agent(config=config, client=mock_client)
+
+        executor = AgentExecutor(agent=agent)
+        deltas = [delta async for delta in executor.astream("Hi")]
+
+        assert deltas == ["Hel", "lo"]
+        messages = executor.memory.get_messages()
+        assert messages[-2] == {"role": "user", "content": "Hi"}
+        assert messages[-1] == {"role": "assistant", "content": "Hello"}
+
     def test_executor_reset_memory(self):
         """Test resetting executor memory."""
         mock_client = Mock()
@@ -0,0 +1,50 @@
+"""ClientRateLimiter:令牌桶额度/等待时长/两桶原子扣减,以及 UnifyLLM 接入(MockProvider)。"""
+
+import asyncio
+
+import pytest
+
+from unify_llm.client import UnifyLLM
+from unify_llm.limiter import ClientRateLimiter
+from unify_llm.models import ChatRequest, Message
+
+
+def _request(content: str = "ping", max_tokens: int | None = None) -> ChatRequest:
+    return ChatRequest(
+        model="m", messages=[Message(role="user", content=content)], max_tokens=max_tokens
+    )
+
+
+def test_invalid_limits_rejected() -> None:
+    with pytest.raises(ValueError):
+        ClientRateLimiter(rpm=0)
+
+
+def test_estimate_includes_max_tokens() -> None:
+    assert ClientRateLimiter.estimate_request_tokens(_request("x" * 40, max_tokens=10)) == 20
+
+
+def test_rpm_bucket_exhausts_then_reports_wait() -> None:
+    limiter = ClientRateLimiter(rpm=2)
+    assert limiter._reserve("openai", "m", 0) == 0.0
+    assert limiter._reserve("openai", "m", 0) == 0.0
+    wait = limiter._reserve("openai", "m", 0)
+    assert 0.0 < wait <= 30.0
+    # 不同 model 各有独立的桶
+    assert limiter._reserve("openai", "other", 0) == 0.0
+
+
+def test_tpm_shortfall_refunds_request_token() -> None:
+    limiter = ClientRateLimiter(rpm=10, tpm=100)
+    assert limiter._reserve("openai", "m", 100) == 0.0
+    assert limiter._reserve("openai", "m", 50) > 0.0
+    # 被 TPM 挡下的那次不应吃掉 RPM 令牌
+    assert limiter._buckets[("openai", "m", "req")].tokens == pytest.approx(9.0, abs=0.01)
+
+
+def test_client_acquires_before_calling_provider() -> None:
+    limiter = ClientRateLimiter(rpm=5)
+    client = UnifyLLM(provider="mock", rate_limiter=limiter)
+    client.chat(model="m", messages=[{"role": "user", "content": "ping"}])
+    asyncio.run(client.achat(model="m", messages=[{"role": "user", "content": "ping"}]))
+    assert limiter._buckets[("mock", "m", "req")].tokens == pytest.approx(3.0, abs=0.01)
@@ -0,0 +1,106 @@
+"""UnifyRouter:多部署选择策略 + failover,全程 MockProvider,不连真网络。"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from unify_llm.client import UnifyLLM
+from unify_llm.core.exceptions import InvalidRequestError, RateLimitError
+from unify_llm.models import ChatRequest, ChatResponse
+from unify_llm.router import RouterDeployment, UnifyRouter
+
+
+class _RateLimitedProvider:
+    """总是 429 的 provider(验证换部署重发),记录被调用次数。"""
+
+    def __init__(self, retry_after: int | None = None) -> None:
+        self.calls = 0
+        self.retry_after = retry_after
+
+    def chat(self, request: ChatRequest, /) -> ChatResponse:
+        self.calls += 1
+        raise RateLimitError("busy", provider="limited", retry_after=self.retry_after)
+
+    async def achat(self, request: ChatRequest, /) -> ChatResponse:
+        return self.chat(request)
+
+
+def _deployment(model: str = "mock-upstream", **kwargs: int) -> RouterDeployment:
+    return RouterDeployment("alias", UnifyLLM(provider="mock"), model, **kwargs)
+
+
+def test_unknown_model_raises() -> None:
+    router = UnifyRouter([_deployment()])
+    with pytest.raises(InvalidRequestError):
+        router.chat("missing", [{"role": "user", "content": "ping"}])
+
+
+def test_least_busy_picks_idle_deployment() -> None:
+    busy, idle = _deployment("busy"), _deployment("idle")
+    busy.inflight = 3
+    router = UnifyRouter([busy, idle], strategy="least-busy")
+    response = router.chat("alias", [{"role": "user", "content": "ping"}])
+    assert response.model == "idle"
+    assert busy.inflight == 3
+    assert idle.inflight == 0
+
+
+def test_latency_strategy_records_ewma() -> None:
+    first, second = _deployment("first"), _deployment("second")
+    first.ewma_latency = 5.0
+    router = UnifyRouter([first, second], strategy="latency")
+    response = asyncio.run(router.achat("alias", [{"role": "user", "content": "ping"}]))
+    assert response.model == "second"
+    assert second.ewma_latency > 0.0
+
+
+def test_failover_to_next_deployment() -> None:
+    limited = _deployment("limited")
+    limited.client._provider = _RateLimitedProvider()  # type: ignore[assignment]
+    healthy = _deployment("healthy")
+    router = UnifyRouter([limited, healthy], strategy="latency")
+    response = asyncio.run(router.achat("alias", [{"role": "user", "content": "ping"}]))
+    assert response.model == "healthy"
+
+
+def test_failover_exhausted_reraises() -> None:
+    limited = RouterDeployment("alias", UnifyLLM(provider="mock", reuse_provider=False), "limited")
+    limited.client._provider = _RateLimitedProvider()  # type: ignore[assignment]
+    router = UnifyRouter([limited], rng=random.Random(0))
+    with pytest.raises(RateLimitError):
+        router.chat("alias", [{"role": "user", "content": "ping"}])
+
+
+def test_failing_deployment_cools_down() -> None:
+    limited, healthy = _deployment("limited"), _deployment("healthy")
+    provider = _RateLimitedProvider()
+    limited.client._provider = provider  # type: ignore[assignment]
+    router = UnifyRouter([limited, healthy], strategy="latency")
+
+    async def run() -> list[str]:
+        messages = [{"role": "user", "content": "ping"}]
+        return [(await router.achat("alias", messages)).model for _ in range(20)]
+
+    assert asyncio.run(run()) == ["healthy"] * 20
+    # 只在第一次请求时失败一次,冷却期内 latency 策略不再先选它(即使其 EWMA 仍为 0)
+    assert provider.calls == 1
+    assert limited.ewma_latency == 0.0
+    assert limited.cooldown_until > healthy.cooldown_until
+
+
+def test_cooldown_honours_retry_after_and_can_be_disabled() -> None:
+    limited, healthy = _deployment("limited"), _deployment("healthy")
+    limited.client._provider = _RateLimitedProvider(retry_after=60)  # type: ignore[assignment]
+    router = UnifyRouter([limited, healthy], strategy="latency", cooldown=1.0)
+    router.chat("alias", [{"role": "user", "content": "ping"}])
+    assert limited.cooldown_until - time.monotonic() > 30
+
+    provider = _RateLimitedProvider()
+    limited.client._provider = provider  # type: ignore[assignment]
+    limited.cooldown_until = 0.0
+    router = UnifyRouter([limited, healthy], strategy="latency", cooldown=0.0)
+    for _ in range(3):
+        router.chat("alias", [{"role": "user", "content": "ping"}])
+    assert provider.calls == 3  # 不冷却:旧行为,每次都先试 EWMA 为 0 的它